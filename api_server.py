@@ -1,15 +1,20 @@
 """Flask API server for external agent spawning."""
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
+import math
 import os
 import sys
+import time
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from rps.api.spawn_api import SpawnAPI
 from rps.api.spawn_queue import SpawnQueue
+from rps.api.world_stream import WorldStream
+from rps.api.admission import AdmissionController
+from rps.analysis.metrics import SimulationMetrics
 from rps.core.config import Config
 
 # Initialize Flask app
@@ -27,6 +32,15 @@ spawn_api = SpawnAPI(
 # Global spawn queue (will be shared with game)
 spawn_queue = None
 
+# Global world stream (published by the game loop)
+world_stream = None
+
+# Global metrics (shared with the game loop)
+metrics = None
+
+# Global admission control (population snapshot published by the game loop)
+admission = None
+
 
 def set_spawn_queue(queue: SpawnQueue):
     """Set the spawn queue (called by game on startup).
@@ -38,6 +52,62 @@ def set_spawn_queue(queue: SpawnQueue):
     spawn_queue = queue
 
 
+def set_world_stream(stream: WorldStream):
+    """Set the world stream (called by game on startup).
+    
+    Args:
+        stream: WorldStream instance published by the game loop
+    """
+    global world_stream
+    world_stream = stream
+
+
+def set_metrics(simulation_metrics: SimulationMetrics):
+    """Set the metrics collector (called by game on startup).
+    
+    Args:
+        simulation_metrics: SimulationMetrics instance from the game
+    """
+    global metrics
+    metrics = simulation_metrics
+
+
+def set_admission(controller: AdmissionController):
+    """Set the admission controller (called by game on startup).
+    
+    Args:
+        controller: AdmissionController instance from the game
+    """
+    global admission
+    admission = controller
+
+
+def set_spawn_api(api: SpawnAPI):
+    """Set the spawn validator (called by game on startup).
+    
+    Args:
+        api: SpawnAPI bounded by the game's arena
+    """
+    global spawn_api
+    spawn_api = api
+
+
+@app.before_request
+def start_request_timer():
+    """Record request start time for latency metrics."""
+    request.environ['rps.start_time'] = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    """Record request latency and status for metrics."""
+    start = request.environ.get('rps.start_time')
+    if metrics is not None and start is not None:
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        metrics.observe_request(endpoint, response.status_code, time.perf_counter() - start)
+    return response
+
+
 @app.route('/api/spawn', methods=['POST'])
 def spawn_agent():
     """Spawn an agent via API.
@@ -62,6 +132,17 @@ def spawn_agent():
             'code': 'GAME_NOT_RUNNING'
         }), 503
     
+    # Per-client rate limit (checked before any parsing work)
+    if admission is not None:
+        retry_after = admission.check_rate(request.remote_addr or 'unknown')
+        if retry_after > 0:
+            return jsonify({
+                'success': False,
+                'error': 'Too many spawn requests. Slow down.',
+                'code': 'RATE_LIMITED',
+                'retry_after': retry_after
+            }), 429, {'Retry-After': str(math.ceil(retry_after))}
+    
     # Get request data
     data = request.get_json()
     
@@ -78,8 +159,15 @@ def spawn_agent():
     if error:
         return jsonify(error), 400
     
-    # Check if queue is full
-    if spawn_queue.is_full():
+    # Reject if the world (plus pending spawns) is already at the cap
+    if admission is not None:
+        rejection = admission.check_capacity(spawn_queue.size())
+        if rejection is not None:
+            current_pop, max_pop = rejection
+            return jsonify(spawn_api.create_population_cap_error(current_pop, max_pop)), 503
+    
+    # Add to queue (add() checks capacity under the queue lock)
+    if not spawn_queue.add(spawn_request):
         return jsonify({
             'success': False,
             'error': 'Spawn queue is full. Try again later.',
@@ -87,14 +175,6 @@ def spawn_agent():
             'queue_size': spawn_queue.size()
         }), 503
     
-    # Add to queue
-    if not spawn_queue.add(spawn_request):
-        return jsonify({
-            'success': False,
-            'error': 'Failed to add spawn request to queue',
-            'code': 'QUEUE_ERROR'
-        }), 500
-    
     # Return success (agent will be spawned in next game frame)
     return jsonify({
         'success': True,
@@ -124,13 +204,65 @@ def get_status():
             'message': 'Game not running'
         })
     
-    return jsonify({
+    queue_size, queue_capacity = spawn_queue.occupancy()
+    
+    status = {
         'running': True,
-        'queue_size': spawn_queue.size(),
-        'queue_capacity': 1000,
-        'screen_width': config.screen_width,
-        'screen_height': config.screen_height
-    })
+        'queue_size': queue_size,
+        'queue_capacity': queue_capacity,
+        'screen_width': spawn_api.screen_width,
+        'screen_height': spawn_api.screen_height
+    }
+    
+    if admission is not None:
+        status['population'], status['max_population'] = admission.snapshot()
+    
+    return jsonify(status)
+
+
+@app.route('/api/stream', methods=['GET'])
+def stream_world():
+    """Stream live world state as Server-Sent Events.
+    
+    The first event is a keyframe with every living agent; following
+    events are deltas (spawned, moved, died). See rps.api.world_stream.
+    
+    Returns:
+        text/event-stream response
+    """
+    global world_stream
+    
+    if world_stream is None:
+        return jsonify({
+            'success': False,
+            'error': 'Game not running. Start the game with --api-enabled flag.',
+            'code': 'GAME_NOT_RUNNING'
+        }), 503
+    
+    return Response(
+        world_stream.subscribe(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Expose metrics in the Prometheus text exposition format.
+    
+    Returns:
+        text/plain metrics response
+    """
+    global metrics
+    
+    if metrics is None:
+        return jsonify({
+            'success': False,
+            'error': 'Game not running. Start the game with --api-enabled flag.',
+            'code': 'GAME_NOT_RUNNING'
+        }), 503
+    
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 
 @app.route('/api/health', methods=['GET'])
@@ -177,6 +309,8 @@ def run_server(host='127.0.0.1', port=5000, debug=False):
     print(f"Starting RPS World API server on {host}:{port}")
     print(f"Spawn endpoint: POST http://{host}:{port}/api/spawn")
     print(f"Status endpoint: GET http://{host}:{port}/api/status")
+    print(f"Stream endpoint: GET http://{host}:{port}/api/stream")
+    print(f"Metrics endpoint: GET http://{host}:{port}/metrics")
     app.run(host=host, port=port, debug=debug, threaded=True)
 
 
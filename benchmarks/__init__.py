@@ -0,0 +1 @@
+"""Performance benchmarks for RPS World."""
@@ -0,0 +1,63 @@
+"""Timestep benchmark: discrete vs. swept (continuous) collision detection.
+
+Runs the same seeds at the reference timestep (1/60 s) and at larger
+timesteps with and without Config.continuous_collisions, then reports
+how closely outcomes match the reference and how fast each mode runs.
+
+Usage:
+    python -m benchmarks.bench_ccd [--seeds 20] [--count 30] [--multipliers 1 4 8]
+"""
+
+import argparse
+import statistics
+from dataclasses import replace
+
+from rps.core.config import Config
+from rps.core.headless import run_headless
+
+BASE_DT = 1 / 60
+
+
+def run_mode(seeds, count, dt, continuous, max_ticks):
+    """Run all seeds in one mode."""
+    results = []
+    for seed in seeds:
+        config = replace(Config(seed=seed), continuous_collisions=continuous, max_population=count * 3)
+        results.append(run_headless(config, count, dt=dt, max_ticks=max_ticks))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Continuous collision detection benchmark')
+    parser.add_argument('--seeds', type=int, default=20)
+    parser.add_argument('--count', type=int, default=30, help='Agents per kind')
+    parser.add_argument('--multipliers', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--max-sim-time', type=float, default=600.0, help='Simulated seconds per run')
+    args = parser.parse_args()
+
+    seeds = list(range(args.seeds))
+    reference = run_mode(seeds, args.count, BASE_DT, False, int(args.max_sim_time / BASE_DT))
+    ref_winners = [r.winner for r in reference]
+
+    print(f"{'mode':>14s} {'dt':>6s} {'winner match':>13s} {'mean victory s':>15s} "
+          f"{'kills':>7s} {'ticks/s':>9s} {'sim s/s':>8s}")
+    for multiplier in args.multipliers:
+        dt = BASE_DT * multiplier
+        for continuous in (False, True):
+            if multiplier == 1 and not continuous:
+                results = reference
+            else:
+                results = run_mode(seeds, args.count, dt, continuous, int(args.max_sim_time / dt))
+            match = sum(r.winner == w for r, w in zip(results, ref_winners)) / len(results)
+            ticks = sum(r.ticks for r in results)
+            elapsed = sum(r.elapsed for r in results)
+            print(
+                f"{'continuous' if continuous else 'discrete':>14s} {multiplier:>5d}x "
+                f"{match:>12.0%} {statistics.mean(r.sim_time for r in results):>15.1f} "
+                f"{statistics.mean(r.kills for r in results):>7.1f} "
+                f"{ticks / elapsed:>9.0f} {sum(r.sim_time for r in results) / elapsed:>8.1f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
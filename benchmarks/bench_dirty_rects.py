@@ -0,0 +1,65 @@
+"""Presentation benchmark: full flips vs. dirty-rectangle updates.
+
+Runs the simulation and times clearing, drawing and presenting each
+frame with ``pygame.display.flip`` against ``DirtyRectRenderer`` at a few
+population sizes. Run it with the SDL software renderer the game is
+deployed on (e.g. ``SDL_RENDER_DRIVER=software``); the default dummy
+video driver only measures the erase/draw side.
+
+Usage:
+    python -m benchmarks.bench_dirty_rects [--sizes 30 150 600] [--frames 200]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from rps.core.config import Config, KINDS
+from rps.core.world import World
+from rps.ui.dirty_rects import DirtyRectRenderer
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dirty-rectangle presentation benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[30, 150, 600])
+    parser.add_argument('--frames', type=int, default=200)
+    args = parser.parse_args()
+
+    pygame.init()
+    config = Config(seed=0, max_population=max(args.sizes))
+    screen = pygame.display.set_mode((config.screen_width, config.screen_height))
+    print(f"{'agents':>8s} {'flip ms':>8s} {'dirty ms':>9s} {'flipped':>8s}")
+    for size in args.sizes:
+        results = []
+        for dirty in (False, True):
+            world = World(config)
+            for kind in KINDS:
+                world.spawn_random(kind, size // len(KINDS))
+            renderer = DirtyRectRenderer(screen, config.background_color,
+                                         config.dirty_rect_threshold) if dirty else None
+            flips = 0
+            elapsed = 0.0
+            for _ in range(args.frames):
+                world.update(1 / 60)
+                start = time.perf_counter()
+                if renderer:
+                    renderer.begin()
+                    renderer.present(world.draw(screen))
+                    flips += renderer.last_full
+                else:
+                    screen.fill(config.background_color)
+                    world.draw(screen)
+                    pygame.display.flip()
+                elapsed += time.perf_counter() - start
+            results.append((elapsed / args.frames, flips))
+        (flip, _), (dirty, flips) = results
+        print(f"{size:>8d} {flip * 1e3:>8.3f} {dirty * 1e3:>9.3f} {flips / args.frames:>7.0%}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
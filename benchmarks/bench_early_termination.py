@@ -0,0 +1,50 @@
+"""Early termination benchmark: prediction accuracy and simulation saved.
+
+Runs each seed once with Config.early_termination and validate=True, so
+the run continues past the decided state to the real victory. For each
+decided_minority threshold it reports how often the predicted winner was
+the actual one (per decision reason), and the share of ticks an early
+stop would have skipped.
+
+Usage:
+    python -m benchmarks.bench_early_termination [--seeds 30] [--count 40] [--minority 0 0.05 0.1]
+"""
+
+import argparse
+import statistics
+from collections import Counter
+from dataclasses import replace
+
+from rps.core.config import Config
+from rps.core.headless import run_headless
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Early termination benchmark')
+    parser.add_argument('--seeds', type=int, default=30)
+    parser.add_argument('--count', type=int, default=40, help='Agents per kind')
+    parser.add_argument('--minority', type=float, nargs='+', default=[0.0, 0.05, 0.1],
+                        help='decided_minority thresholds (0 = two-kinds rule only)')
+    parser.add_argument('--max-ticks', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'minority':>8s} {'reason':>10s} {'runs':>5s} {'correct':>8s} {'ticks saved':>12s}")
+    for minority in args.minority:
+        results = []
+        for seed in range(args.seeds):
+            config = replace(Config(seed=seed), early_termination=True, decided_minority=minority,
+                             max_population=args.count * 3)
+            results.append(run_headless(config, args.count, max_ticks=args.max_ticks, validate=True))
+        by_reason = Counter(r.decided_reason for r in results)
+        for reason in sorted(by_reason, key=str):
+            group = [r for r in results if r.decided_reason == reason]
+            if reason is None:
+                print(f"{minority:>8.2f} {'undecided':>10s} {len(group):>5d} {'-':>8s} {'-':>12s}")
+                continue
+            correct = sum(r.predicted_winner == r.winner for r in group) / len(group)
+            saved = statistics.mean(1 - r.decided_tick / r.ticks for r in group)
+            print(f"{minority:>8.2f} {reason:>10s} {len(group):>5d} {correct:>8.0%} {saved:>12.0%}")
+
+
+if __name__ == '__main__':
+    main()
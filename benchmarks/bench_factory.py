@@ -0,0 +1,55 @@
+"""Agent creation benchmark: per-agent loop vs. vectorized create_batch.
+
+Usage:
+    python -m benchmarks.bench_factory [--count 50000]
+"""
+
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from rps.core.config import Config, KINDS
+from rps.core.factory import AgentFactory
+
+
+def time_it(fn) -> float:
+    """Run fn once and return elapsed seconds."""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Agent creation benchmark')
+    parser.add_argument('--count', type=int, default=50000, help='Total agents to create')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    per_kind = args.count // len(KINDS)
+
+    def loop():
+        factory = AgentFactory(Config(seed=args.seed), random.Random(args.seed))
+        for kind in KINDS:
+            for _ in range(per_kind):
+                factory.create_random_agent(kind)
+
+    def batch():
+        factory = AgentFactory(Config(seed=args.seed), random.Random(args.seed))
+        factory.create_balanced_population(per_kind)
+
+    # Warm the shared sprite cache so neither variant pays for it
+    batch_warmup = AgentFactory(Config(seed=0), random.Random(0))
+    batch_warmup.create_balanced_population(1)
+
+    batch_time = time_it(batch)
+    loop_time = time_it(loop)
+    total = per_kind * len(KINDS)
+    print(f"per-agent loop : {loop_time * 1000:9.1f} ms  ({total / loop_time:,.0f} agents/s)")
+    print(f"create_batch   : {batch_time * 1000:9.1f} ms  ({total / batch_time:,.0f} agents/s)")
+
+
+if __name__ == '__main__':
+    main()
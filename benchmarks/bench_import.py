@@ -0,0 +1,77 @@
+"""Import-time benchmark: simulation core with and without pygame.
+
+The core (config, agent, collision, world, factory, names, headless) no
+longer imports pygame, so headless workers skip its import and SDL setup.
+This measures, in fresh interpreters, the time to import the core alone
+and with pygame loaded as it used to be, then the start-up of a spawn
+process pool whose workers run one tiny headless game each.
+
+Usage:
+    python -m benchmarks.bench_import [--repeats 5] [--workers 4]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+from rps.core.config import Config
+from rps.core.headless import run_headless
+
+
+def _import_time(statement: str, repeats: int) -> float:
+    """Median wall time of a fresh interpreter running an import statement."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _load_pygame():
+    """Worker initializer emulating the old core's pygame import."""
+    os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    import pygame  # noqa: F401
+
+
+def _tiny_run(seed: int) -> int:
+    return run_headless(Config(seed=seed, world_width=100, world_height=100), 1, max_ticks=10).ticks
+
+
+def _pool_time(workers: int, with_pygame: bool) -> float:
+    """Seconds until every worker of a fresh spawn pool has finished one run."""
+    start = time.perf_counter()
+    context = multiprocessing.get_context('spawn')
+    initializer = _load_pygame if with_pygame else None
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=initializer) as pool:
+        list(pool.map(_tiny_run, range(workers)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Core import-time benchmark')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+    
+    base = _import_time('pass', args.repeats)
+    core = _import_time('import rps.core.headless', args.repeats)
+    old = _import_time('import pygame, rps.core.headless', args.repeats)
+    print(f"{'interpreter start':>26s} {base * 1000:>8.0f} ms")
+    print(f"{'core import':>26s} {(core - base) * 1000:>8.0f} ms")
+    print(f"{'core import + pygame':>26s} {(old - base) * 1000:>8.0f} ms")
+    
+    for with_pygame in (False, True):
+        label = f"pool of {args.workers}" + (" + pygame" if with_pygame else "")
+        elapsed = statistics.median(_pool_time(args.workers, with_pygame) for _ in range(args.repeats))
+        print(f"{label:>26s} {elapsed * 1000:>8.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
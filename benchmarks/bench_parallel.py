@@ -0,0 +1,62 @@
+"""Vectorized update benchmark: per-agent loop vs. threaded NumPy kernels.
+
+Times the steering and integration phase only (no collisions) for the
+object path and for ParallelStepper at several thread counts. Thread
+scaling needs free cores; on a single core the threaded rows only show
+the pool overhead.
+
+Usage:
+    python -m benchmarks.bench_parallel [--sizes 600 3000 12000] [--threads 1 2 4] [--ticks 20]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from rps.core.config import Config
+from rps.core.parallel import ParallelStepper
+from rps.core.world import World
+
+
+def _make_world(size: int) -> World:
+    config = Config(seed=0, max_population=size, show_names=False)
+    world = World(config)
+    world.spawn_batch(size // 3)
+    return world
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vectorized update benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[600, 3000, 12000])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--ticks', type=int, default=20)
+    parser.add_argument('--max-loop', type=int, default=3000, help='Largest size timed with the loop')
+    args = parser.parse_args()
+
+    columns = ['loop'] + [f'{t} thr' for t in args.threads]
+    print(f"{'agents':>8s} " + ' '.join(f"{c:>10s}" for c in columns) + '   (ms per tick)')
+    for size in args.sizes:
+        row = []
+        if size <= args.max_loop:
+            world = _make_world(size)
+            start = time.perf_counter()
+            for _ in range(args.ticks):
+                world._update_agents(1 / 60)
+            row.append(f"{(time.perf_counter() - start) / args.ticks * 1e3:>10.2f}")
+        else:
+            row.append(f"{'-':>10s}")
+        for threads in args.threads:
+            world = _make_world(size)
+            stepper = ParallelStepper(world.config, threads)
+            start = time.perf_counter()
+            for _ in range(args.ticks):
+                stepper.step(world.agents, 1 / 60)
+            row.append(f"{(time.perf_counter() - start) / args.ticks * 1e3:>10.2f}")
+            stepper.close()
+        print(f"{len(world.agents):>8d} " + ' '.join(row))
+
+
+if __name__ == '__main__':
+    main()
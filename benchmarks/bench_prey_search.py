@@ -0,0 +1,64 @@
+"""Nearest-prey search benchmark: linear scan vs. prey quadtree.
+
+Times one tick's worth of full nearest-prey searches (every agent looks
+for its prey) at growing populations, including the quadtree's
+incremental maintenance after all agents move one step.
+
+Usage:
+    python -m benchmarks.bench_prey_search [--sizes 500 2000 8000] [--queries 500]
+"""
+
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from rps.core.config import BEATS, Config, KINDS
+from rps.core.factory import AgentFactory
+from rps.core.quadtree import PreyQuadtree
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Nearest-prey search benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 2000, 8000])
+    parser.add_argument('--queries', type=int, default=500, help='Searches timed per size')
+    args = parser.parse_args()
+
+    config = Config(seed=0, world_width=4000, world_height=4000)
+    rng = random.Random(0)
+    print(f"{'agents':>8s} {'linear us':>10s} {'tree us':>9s} {'sync ms':>8s} {'speedup':>8s}")
+    for size in args.sizes:
+        factory = AgentFactory(config, rng)
+        agents = []
+        for kind in KINDS:
+            agents.extend(factory.create_batch(kind, size // len(KINDS)))
+        searchers = rng.sample(agents, min(args.queries, len(agents)))
+
+        start = time.perf_counter()
+        for agent in searchers:
+            agent._nearest_prey(agents)
+        linear = (time.perf_counter() - start) / len(searchers)
+
+        tree = PreyQuadtree(*config.world_size)
+        tree.sync(agents)
+        for agent in agents:
+            agent.pos += agent.vel / 60
+        start = time.perf_counter()
+        tree.sync(agents)
+        sync = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for agent in searchers:
+            tree.nearest(agent.pos.x, agent.pos.y, BEATS[agent.kind], agent.id)
+        indexed = (time.perf_counter() - start) / len(searchers)
+
+        print(
+            f"{len(agents):>8d} {linear * 1e6:>10.1f} {indexed * 1e6:>9.1f} "
+            f"{sync * 1e3:>8.2f} {linear / indexed:>7.1f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Render benchmark: full draw vs. camera-culled draw of a large arena.
+
+Fills a large world with agents and times ``World.draw`` with the whole
+population blitted (the screen-sized path) against a camera viewport at
+a few zoom levels, which only draws agents the spatial grid finds in view.
+
+Usage:
+    python -m benchmarks.bench_render [--agents 50000] [--world 20000] [--frames 20]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from rps.core.config import Config, KINDS
+from rps.core.world import World
+from rps.ui.camera import Camera
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render culling benchmark')
+    parser.add_argument('--agents', type=int, default=50000)
+    parser.add_argument('--world', type=int, default=20000, help='World width and height')
+    parser.add_argument('--frames', type=int, default=20, help='Frames timed per case')
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 800))
+    config = Config(seed=0, world_width=args.world, world_height=args.world,
+                    max_population=args.agents, show_names=False)
+    world = World(config)
+    for kind in KINDS:
+        world.spawn_random(kind, args.agents // len(KINDS))
+    world.visible_agents(0, 0, 1, 1)  # Build the spatial grid before timing
+
+    def time_draw(camera):
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            screen.fill(config.background_color)
+            world.draw(screen, camera)
+        return (time.perf_counter() - start) / args.frames
+
+    print(f"{world.get_total_count()} agents in a {args.world}x{args.world} world")
+    print(f"{'view':>12s} {'ms/frame':>9s} {'speedup':>8s}")
+    full = time_draw(None)
+    print(f"{'all agents':>12s} {full * 1e3:>9.2f} {'1.0x':>8s}")
+    for zoom in (1.0, 0.5, 0.25):
+        camera = Camera(screen.get_size(), config.world_size)
+        camera.zoom_at(zoom, (600, 400))
+        culled = time_draw(camera)
+        print(f"{f'zoom {zoom}':>12s} {culled * 1e3:>9.2f} {full / culled:>7.1f}x")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
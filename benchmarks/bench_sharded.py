@@ -0,0 +1,54 @@
+"""Sharded world benchmark: scaling efficiency for 1..N worker processes.
+
+Runs the same large arena and population with an increasing number of
+tiles/workers and reports ticks per second, speedup over one worker and
+parallel efficiency (speedup / workers). Efficiency needs one free core
+per worker; halo exchange and migration overhead grow with the number of
+tile borders, while each tile's nearest-prey search shrinks (which can push
+efficiency above 100%).
+
+Usage:
+    python -m benchmarks.bench_sharded [--workers 1 2 4] [--count 5000] [--size 8000] [--ticks 50]
+"""
+
+import argparse
+import os
+import time
+
+from rps.core.config import Config
+from rps.core.sharded import ShardedWorld, tile_layout
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sharded world scaling benchmark')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--count', type=int, default=5000, help='Agents per kind')
+    parser.add_argument('--size', type=int, default=8000, help='Arena width and height')
+    parser.add_argument('--ticks', type=int, default=50)
+    args = parser.parse_args()
+
+    config = Config(
+        seed=0, world_width=args.size, world_height=args.size, max_population=args.count * 3
+    )
+    print(f"cores available: {os.cpu_count()}")
+    print(f"{'workers':>8s} {'tiles':>6s} {'ticks/s':>9s} {'speedup':>8s} {'efficiency':>10s}")
+    baseline = None
+    for workers in args.workers:
+        with ShardedWorld(config, workers=workers) as world:
+            world.spawn_batch(args.count)
+            world.update(1 / 60)  # Warm-up
+            start = time.perf_counter()
+            for _ in range(args.ticks):
+                world.update(1 / 60)
+            rate = args.ticks / (time.perf_counter() - start)
+        baseline = baseline or rate
+        speedup = rate / baseline
+        columns, rows = tile_layout(workers)
+        print(
+            f"{workers:>8d} {f'{columns}x{rows}':>6s} {rate:>9.1f} "
+            f"{speedup:>7.2f}x {speedup / workers:>10.0%}"
+        )
+
+
+if __name__ == '__main__':
+    main()
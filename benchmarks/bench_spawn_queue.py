@@ -0,0 +1,122 @@
+"""Contention microbenchmark: ring-buffer SpawnQueue vs. the queue.Queue wrapper.
+
+Several producer threads add spawn requests while a single consumer drains
+the queue once per simulated frame, mirroring API handler threads feeding
+the game loop.
+
+Usage:
+    python -m benchmarks.bench_spawn_queue [--producers 4] [--requests 20000]
+"""
+
+import argparse
+import queue
+import threading
+import time
+
+from rps.api.spawn_queue import SpawnQueue, SpawnRequest
+
+
+class LegacySpawnQueue:
+    """The previous queue.Queue-based implementation, kept for comparison."""
+    
+    def __init__(self, maxsize: int = 1000):
+        self._queue = queue.Queue(maxsize=maxsize)
+    
+    def add(self, spawn_request: SpawnRequest) -> bool:
+        try:
+            self._queue.put_nowait(spawn_request)
+            return True
+        except queue.Full:
+            return False
+    
+    def get_all(self) -> list:
+        requests = []
+        while not self._queue.empty():
+            try:
+                requests.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return requests
+
+
+def run(queue_factory, producers: int, requests_per_producer: int, frame_interval: float) -> dict:
+    """Run one contention scenario.
+    
+    Args:
+        queue_factory: Callable returning an empty queue
+        producers: Number of producer threads
+        requests_per_producer: Requests added by each producer
+        frame_interval: Consumer sleep between drains (seconds)
+        
+    Returns:
+        Dictionary with throughput and drain statistics
+    """
+    spawn_queue = queue_factory()
+    request = SpawnRequest(agent_type='rock', x=100.0, y=100.0)
+    done = threading.Event()
+    consumed = 0
+    dropped = [0] * producers
+    drain_times = []
+    
+    def producer(index: int):
+        for _ in range(requests_per_producer):
+            if not spawn_queue.add(request):
+                dropped[index] += 1
+    
+    def consumer():
+        nonlocal consumed
+        while True:
+            finished = done.is_set()
+            start = time.perf_counter()
+            consumed += len(spawn_queue.get_all())
+            drain_times.append(time.perf_counter() - start)
+            if finished:
+                break
+            time.sleep(frame_interval)
+    
+    consumer_thread = threading.Thread(target=consumer)
+    producer_threads = [threading.Thread(target=producer, args=(i,)) for i in range(producers)]
+    
+    start = time.perf_counter()
+    consumer_thread.start()
+    for thread in producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    done.set()
+    consumer_thread.join()
+    elapsed = time.perf_counter() - start
+    
+    total = producers * requests_per_producer
+    return {
+        'elapsed': elapsed,
+        'throughput': total / elapsed,
+        'consumed': consumed,
+        'dropped': sum(dropped),
+        'max_drain_ms': max(drain_times) * 1000,
+        'mean_drain_ms': sum(drain_times) / len(drain_times) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SpawnQueue contention benchmark')
+    parser.add_argument('--producers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=20000, help='Requests per producer')
+    parser.add_argument('--maxsize', type=int, default=1000)
+    parser.add_argument('--frame-interval', type=float, default=0.001)
+    args = parser.parse_args()
+    
+    for label, factory in (
+        ('legacy queue.Queue', lambda: LegacySpawnQueue(args.maxsize)),
+        ('ring buffer', lambda: SpawnQueue(args.maxsize)),
+    ):
+        result = run(factory, args.producers, args.requests, args.frame_interval)
+        print(
+            f"{label:20s} {result['throughput']:>12,.0f} req/s  "
+            f"consumed={result['consumed']:<8d} dropped={result['dropped']:<8d} "
+            f"drain mean={result['mean_drain_ms']:.3f}ms max={result['max_drain_ms']:.3f}ms"
+        )
+
+
+if __name__ == '__main__':
+    main()
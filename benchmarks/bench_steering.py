@@ -0,0 +1,47 @@
+"""Target persistence benchmark: steering cost and win-rate distributions.
+
+Runs the same seeds with Config.target_reacquire_ticks = 1 (full search
+every tick) and larger K, then compares win rates per kind, mean time to
+victory and simulation speed. Similar win-rate distributions mean the
+cheaper steering does not change the game's balance.
+
+Usage:
+    python -m benchmarks.bench_steering [--seeds 30] [--count 40] [--k 1 5 10]
+"""
+
+import argparse
+import statistics
+from collections import Counter
+from dataclasses import replace
+
+from rps.core.config import Config, KINDS
+from rps.core.headless import run_headless
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Target persistence benchmark')
+    parser.add_argument('--seeds', type=int, default=30)
+    parser.add_argument('--count', type=int, default=40, help='Agents per kind')
+    parser.add_argument('--k', type=int, nargs='+', default=[1, 5, 10], help='Re-acquisition intervals')
+    parser.add_argument('--max-ticks', type=int, default=20000)
+    args = parser.parse_args()
+
+    header = ' '.join(f"{kind:>9s}" for kind in KINDS)
+    print(f"{'K':>4s} {header} {'unfinished':>10s} {'victory s':>10s} {'ticks/s':>9s}")
+    for k in args.k:
+        results = []
+        for seed in range(args.seeds):
+            config = replace(Config(seed=seed), target_reacquire_ticks=k, max_population=args.count * 3)
+            results.append(run_headless(config, args.count, max_ticks=args.max_ticks))
+        wins = Counter(r.winner for r in results)
+        rates = ' '.join(f"{wins[kind] / len(results):>9.0%}" for kind in KINDS)
+        ticks = sum(r.ticks for r in results)
+        elapsed = sum(r.elapsed for r in results)
+        print(
+            f"{k:>4d} {rates} {wins[None]:>10d} "
+            f"{statistics.mean(r.sim_time for r in results):>10.1f} {ticks / elapsed:>9.0f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""Spatial heatmaps of kills (and optionally occupancy) per kind."""
+
+import math
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pygame
+from ..core.config import KINDS
+
+
+class KillHeatmap:
+    """Per-kind NumPy grids updated in O(1) per kill.
+    
+    ``kills[k, row, col]`` counts kills by winners of ``KINDS[k]`` in each
+    cell; ``occupancy`` accumulates living-agent samples the same way. The
+    overlay is built with ``pygame.surfarray`` from the grids and cached
+    until the next change, so drawing costs one scale and one blit.
+    """
+    
+    def __init__(self, world_size: Tuple[int, int], cell_size: float = 10.0):
+        """Initialize empty grids.
+        
+        Args:
+            world_size: Arena (width, height)
+            cell_size: World units per grid cell
+        """
+        self.cell_size = cell_size
+        self.cols = max(1, math.ceil(world_size[0] / cell_size))
+        self.rows = max(1, math.ceil(world_size[1] / cell_size))
+        self.kinds = list(KINDS)
+        self._kind_index = {kind: i for i, kind in enumerate(self.kinds)}
+        shape = (len(self.kinds), self.rows, self.cols)
+        self.kills = np.zeros(shape, dtype=np.int32)
+        self.occupancy = np.zeros(shape, dtype=np.int32)
+        self._version = 0
+        self._cache: Dict[str, Tuple[int, pygame.Surface]] = {}
+    
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Grid (row, col) of a world position, clamped to the grid."""
+        col = min(max(int(x // self.cell_size), 0), self.cols - 1)
+        row = min(max(int(y // self.cell_size), 0), self.rows - 1)
+        return row, col
+    
+    def add_kill(self, kind: str, x: float, y: float):
+        """Record a kill.
+        
+        Args:
+            kind: Winner's kind
+            x: Kill X position
+            y: Kill Y position
+        """
+        k = self._kind_index.get(kind)
+        if k is None:
+            return
+        row, col = self._cell(x, y)
+        self.kills[k, row, col] += 1
+        self._version += 1
+    
+    def record_occupancy(self, agents: List):
+        """Add one sample of where living agents are.
+        
+        Args:
+            agents: Agents to sample (dead ones are skipped)
+        """
+        # Layers follow KINDS, so an agent's kind code is its layer
+        samples = [(a.code, a.pos.x, a.pos.y) for a in agents if a.alive]
+        if not samples:
+            return
+        k, x, y = np.array(samples).T
+        cols = np.clip((x // self.cell_size).astype(np.intp), 0, self.cols - 1)
+        rows = np.clip((y // self.cell_size).astype(np.intp), 0, self.rows - 1)
+        np.add.at(self.occupancy, (k.astype(np.intp), rows, cols), 1)
+        self._version += 1
+    
+    def clear(self):
+        """Reset all grids."""
+        self.kills[:] = 0
+        self.occupancy[:] = 0
+        self._version += 1
+    
+    def to_surface(self, colors: Dict[str, Tuple[int, int, int]], layer: str = 'kills',
+                   max_alpha: int = 200) -> pygame.Surface:
+        """Render a layer as a cell-resolution RGBA surface.
+        
+        Each kind contributes its color weighted by a log-scaled count;
+        alpha follows the strongest kind in the cell.
+        
+        Args:
+            colors: Color per kind
+            layer: 'kills' or 'occupancy'
+            max_alpha: Alpha of the busiest cell
+            
+        Returns:
+            Surface of size (cols, rows), one pixel per cell
+        """
+        cached = self._cache.get(layer)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        
+        grid = getattr(self, layer)
+        peak = grid.max()
+        intensity = np.log1p(grid) / math.log1p(peak) if peak else np.zeros(grid.shape)
+        palette = np.array([colors[kind] for kind in self.kinds], dtype=np.float64)
+        rgb = np.einsum('krc,kx->crx', intensity, palette)  # surfarray is (x, y)
+        alpha = intensity.max(axis=0).T * max_alpha
+        
+        surface = pygame.Surface((self.cols, self.rows), pygame.SRCALPHA)
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[...] = np.minimum(rgb, 255)
+        del pixels
+        alphas = pygame.surfarray.pixels_alpha(surface)
+        alphas[...] = alpha
+        del alphas
+        
+        self._cache[layer] = (self._version, surface)
+        return surface
+    
+    def draw(self, surface: pygame.Surface, colors: Dict[str, Tuple[int, int, int]],
+             layer: str = 'kills', camera=None) -> List[pygame.Rect]:
+        """Draw a layer over the arena.
+        
+        Only the cells in view are scaled up, so the cost is bounded by
+        the screen size at any zoom.
+        
+        Args:
+            surface: Surface to draw on
+            colors: Color per kind
+            layer: 'kills' or 'occupancy'
+            camera: Optional Camera mapping world to screen
+            
+        Returns:
+            Screen rectangles drawn
+        """
+        cell = self.cell_size
+        if camera is not None:
+            x0, y0, x1, y1 = camera.view_rect()
+            zoom = camera.zoom
+        else:
+            x0, y0 = 0.0, 0.0
+            x1, y1 = surface.get_size()
+            zoom = 1.0
+        c0 = min(max(int(x0 // cell), 0), self.cols)
+        r0 = min(max(int(y0 // cell), 0), self.rows)
+        c1 = min(max(math.ceil(x1 / cell), c0), self.cols)
+        r1 = min(max(math.ceil(y1 / cell), r0), self.rows)
+        if c1 == c0 or r1 == r0:
+            return []
+        
+        cells = self.to_surface(colors, layer).subsurface((c0, r0, c1 - c0, r1 - r0))
+        left, top = (c0 * cell - x0) * zoom, (r0 * cell - y0) * zoom
+        size = (round((c1 - c0) * cell * zoom), round((r1 - r0) * cell * zoom))
+        return [surface.blit(pygame.transform.scale(cells, size), (round(left), round(top)))]
+    
+    def export(self, directory: str = "analysis_output", path: Optional[str] = None) -> str:
+        """Save the grids as a compressed NumPy archive.
+        
+        Args:
+            directory: Output directory (ignored if path is given)
+            path: Optional explicit file path
+            
+        Returns:
+            Path of the written file
+        """
+        if path is None:
+            os.makedirs(directory, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(directory, f"heatmap_{timestamp}.npz")
+        np.savez_compressed(
+            path,
+            kills=self.kills,
+            occupancy=self.occupancy,
+            kinds=np.array(self.kinds),
+            cell_size=self.cell_size
+        )
+        return path
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import List
 import csv
 import os
+import sys
 from datetime import datetime
 
 
@@ -29,13 +30,28 @@ class CollisionEvent:
     tick: int
 
 
+def _event_size(event) -> int:
+    """Approximate size of one event record, including its field values."""
+    fields = vars(event)
+    size = sys.getsizeof(event) + sys.getsizeof(fields)
+    for value in fields.values():
+        if not isinstance(value, str):  # Kind strings are shared
+            size += sys.getsizeof(value)
+    return size
+
+
 class AnalysisLogger:
     """Logs and exports simulation events for analysis."""
     
-    def __init__(self):
-        """Initialize the logger."""
+    def __init__(self, heatmap=None):
+        """Initialize the logger.
+        
+        Args:
+            heatmap: Optional KillHeatmap updated with every logged kill
+        """
         self.spawn_events: List[SpawnEvent] = []
         self.collision_events: List[CollisionEvent] = []
+        self.heatmap = heatmap
         self.enabled = True
     
     def log_spawn(self, id: int, kind: str, x: float, y: float, tick: int):
@@ -76,6 +92,8 @@ class AnalysisLogger:
             self.collision_events.append(
                 CollisionEvent(winner_id, winner_kind, loser_id, loser_kind, x, y, tick)
             )
+            if self.heatmap is not None:
+                self.heatmap.add_kill(winner_kind, x, y)
     
     def export_csv(self, directory: str = "analysis_output"):
         """Export logged events to CSV files.
@@ -114,10 +132,27 @@ class AnalysisLogger:
         
         return spawn_file, collision_file
     
+    def memory_usage(self) -> int:
+        """Estimate memory held by logged events.
+        
+        Sizes one event of each type and extrapolates, so the cost does
+        not grow with the number of events.
+        
+        Returns:
+            Approximate size in bytes
+        """
+        size = sys.getsizeof(self.spawn_events) + sys.getsizeof(self.collision_events)
+        for events in (self.spawn_events, self.collision_events):
+            if events:
+                size += len(events) * _event_size(events[-1])
+        return size
+    
     def clear(self):
         """Clear all logged events."""
         self.spawn_events.clear()
         self.collision_events.clear()
+        if self.heatmap is not None:
+            self.heatmap.clear()
     
     def get_stats(self) -> dict:
         """Get statistics about logged events.
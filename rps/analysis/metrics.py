@@ -0,0 +1,288 @@
+"""Runtime metrics in the Prometheus text exposition format.
+
+Metrics are deliberately cheap to update. Metrics written only by the game
+thread (tick counter, phase timings) take no lock; metrics shared between
+API handler threads are created with ``threadsafe=True``. Values owned by
+other objects (population, queue depth, collision counts) are read through
+callbacks at scrape time, so the simulation pays nothing for them.
+"""
+
+import bisect
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from ..core.config import KINDS
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Phases timed per frame: the first three by World.update, the rest by RPSApp
+PHASES = ('steering', 'collisions', 'cleanup', 'api_spawns', 'draw', 'frame')
+
+
+def _format_labels(labels: Dict[str, str], extra: Optional[Tuple[str, str]] = None) -> str:
+    """Format a label set as ``{k="v",...}``."""
+    items = list(labels.items())
+    if extra:
+        items.append(extra)
+    if not items:
+        return ''
+    return '{' + ','.join(f'{key}="{value}"' for key, value in items) + '}'
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class for a single labelled time series."""
+    
+    type_name = 'untyped'
+    
+    def __init__(self, name: str, help: str, labels: Optional[Dict[str, str]] = None,
+                 threadsafe: bool = False):
+        self.name = name
+        self.help = help
+        self.labels = dict(labels or {})
+        self._lock = threading.Lock() if threadsafe else None
+    
+    def samples(self) -> List[str]:
+        """Exposition lines for this series."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value, either incremented or read from a callback."""
+    
+    type_name = 'counter'
+    
+    def __init__(self, name: str, help: str, labels: Optional[Dict[str, str]] = None,
+                 threadsafe: bool = False, function: Optional[Callable[[], float]] = None):
+        super().__init__(name, help, labels, threadsafe)
+        self.value = 0
+        self.function = function
+    
+    def inc(self, amount: float = 1):
+        """Increment the counter.
+        
+        Args:
+            amount: Non-negative increment
+        """
+        if self._lock is None:
+            self.value += amount
+        else:
+            with self._lock:
+                self.value += amount
+    
+    def get(self) -> float:
+        """Current value."""
+        return self.function() if self.function else self.value
+    
+    def samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labels)} {_format_value(self.get())}"]
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+    
+    type_name = 'gauge'
+    
+    def set(self, value: float):
+        """Set the gauge.
+        
+        Args:
+            value: New value
+        """
+        self.value = value
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed cumulative buckets."""
+    
+    type_name = 'histogram'
+    
+    def __init__(self, name: str, help: str, labels: Optional[Dict[str, str]] = None,
+                 threadsafe: bool = False, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labels, threadsafe)
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float):
+        """Record an observation.
+        
+        Args:
+            value: Observed value
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        if self._lock is None:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+        else:
+            with self._lock:
+                self.counts[index] += 1
+                self.sum += value
+                self.count += 1
+    
+    def samples(self) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), self.counts):
+            cumulative += bucket_count
+            labels = _format_labels(self.labels, ('le', _format_value(bound)))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labels)
+        lines.append(f"{self.name}_sum{labels} {_format_value(self.sum)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, List[_Metric]] = {}
+        self._lock = threading.Lock()
+    
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            family = self._metrics.setdefault(metric.name, [])
+            if family and family[0].type_name != metric.type_name:
+                raise ValueError(f"Metric {metric.name} already registered as {family[0].type_name}")
+            family.append(metric)
+        return metric
+    
+    def counter(self, name: str, help: str, labels: Optional[Dict[str, str]] = None,
+                threadsafe: bool = False, function: Optional[Callable[[], float]] = None) -> Counter:
+        """Register a counter series."""
+        return self._register(Counter(name, help, labels, threadsafe, function))
+    
+    def gauge(self, name: str, help: str, labels: Optional[Dict[str, str]] = None,
+              threadsafe: bool = False, function: Optional[Callable[[], float]] = None) -> Gauge:
+        """Register a gauge series."""
+        return self._register(Gauge(name, help, labels, threadsafe, function))
+    
+    def histogram(self, name: str, help: str, labels: Optional[Dict[str, str]] = None,
+                  threadsafe: bool = False, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Register a histogram series."""
+        return self._register(Histogram(name, help, labels, threadsafe, buckets))
+    
+    def render(self) -> str:
+        """Render all metrics in the text exposition format.
+        
+        Returns:
+            Exposition text
+        """
+        with self._lock:
+            families = [(name, list(family)) for name, family in self._metrics.items()]
+        lines = []
+        for name, family in families:
+            lines.append(f"# HELP {name} {family[0].help}")
+            lines.append(f"# TYPE {name} {family[0].type_name}")
+            for metric in family:
+                lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+class SimulationMetrics:
+    """Simulation, spawn-queue, logger and API metrics for one game instance."""
+    
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        """Initialize metrics.
+        
+        Args:
+            registry: Registry to register into (creates one if None)
+        """
+        self.registry = registry or MetricsRegistry()
+        self.ticks = self.registry.counter('rps_ticks_total', 'Simulation ticks executed')
+        self.phase_seconds = {
+            phase: self.registry.histogram(
+                'rps_phase_seconds', 'Time spent per frame phase in seconds', {'phase': phase}
+            )
+            for phase in PHASES
+        }
+        self._api_latency: Dict[str, Histogram] = {}
+        self._api_requests: Dict[Tuple[str, int], Counter] = {}
+        self._api_lock = threading.Lock()
+    
+    def observe_phase(self, phase: str, seconds: float):
+        """Record the duration of a frame phase.
+        
+        Args:
+            phase: Phase name from PHASES
+            seconds: Duration in seconds
+        """
+        self.phase_seconds[phase].observe(seconds)
+    
+    def observe_request(self, endpoint: str, status: int, seconds: float):
+        """Record an API request (called from handler threads).
+        
+        Args:
+            endpoint: Endpoint name
+            status: HTTP status code
+            seconds: Handling time in seconds
+        """
+        histogram = self._api_latency.get(endpoint)
+        counter = self._api_requests.get((endpoint, status))
+        if histogram is None or counter is None:
+            with self._api_lock:
+                if endpoint not in self._api_latency:
+                    self._api_latency[endpoint] = self.registry.histogram(
+                        'rps_api_request_seconds', 'API request latency in seconds',
+                        {'endpoint': endpoint}, threadsafe=True
+                    )
+                if (endpoint, status) not in self._api_requests:
+                    self._api_requests[(endpoint, status)] = self.registry.counter(
+                        'rps_api_requests_total', 'API requests handled',
+                        {'endpoint': endpoint, 'status': str(status)}, threadsafe=True
+                    )
+                histogram = self._api_latency[endpoint]
+                counter = self._api_requests[(endpoint, status)]
+        histogram.observe(seconds)
+        counter.inc()
+    
+    def bind(self, world, spawn_queue=None, logger=None):
+        """Expose state owned by other objects through scrape-time callbacks.
+        
+        Args:
+            world: World whose population and collisions are reported
+            spawn_queue: Optional SpawnQueue
+            logger: Optional AnalysisLogger
+        """
+        registry = self.registry
+        for code, kind in enumerate(KINDS):
+            registry.gauge(
+                'rps_population', 'Living agents per kind', {'kind': kind},
+                function=lambda code=code: len(world.by_code[code])
+            )
+        registry.counter(
+            'rps_collisions_total', 'Resolved collisions by outcome', {'outcome': 'kill'},
+            function=lambda: world.collision_resolver.kills
+        )
+        registry.counter(
+            'rps_collisions_total', 'Resolved collisions by outcome', {'outcome': 'bounce'},
+            function=lambda: world.collision_resolver.bounces
+        )
+        if spawn_queue is not None:
+            registry.gauge('rps_spawn_queue_depth', 'Pending spawn requests', function=spawn_queue.size)
+            registry.gauge('rps_spawn_queue_capacity', 'Spawn queue capacity',
+                           function=lambda: spawn_queue.capacity)
+            registry.counter('rps_spawn_queue_enqueued_total', 'Spawn requests accepted by the queue',
+                             function=lambda: spawn_queue.enqueued)
+            registry.counter('rps_spawn_queue_dropped_total', 'Spawn requests rejected by a full queue',
+                             function=lambda: spawn_queue.dropped)
+        if logger is not None:
+            registry.gauge('rps_logger_events', 'Events held by the analysis logger',
+                           function=lambda: len(logger.spawn_events) + len(logger.collision_events))
+            registry.gauge('rps_logger_memory_bytes', 'Estimated memory held by the analysis logger',
+                           function=logger.memory_usage)
+    
+    def render(self) -> str:
+        """Render all metrics in the text exposition format."""
+        return self.registry.render()
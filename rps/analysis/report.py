@@ -0,0 +1,317 @@
+"""Single-pass analysis of exported event logs with bounded memory.
+
+Reads the ``spawns_*.csv`` and ``collisions_*.csv`` files written by
+``AnalysisLogger.export_csv`` in chunks and merges them by tick, so only
+the agents alive at any moment are held in memory (plus fixed-size
+summaries), however long the session was.
+
+Usage:
+    python -m rps.analysis.report SPAWNS.csv COLLISIONS.csv [--window 600] [--cell 100] [--json]
+"""
+
+import argparse
+import csv
+import heapq
+import itertools
+import json
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class _Running:
+    """Count, mean, min and max of a stream of numbers."""
+    
+    __slots__ = ('count', 'total', 'low', 'high')
+    
+    def __init__(self):
+        """Start with no values."""
+        self.count = 0
+        self.total = 0.0
+        self.low = math.inf
+        self.high = -math.inf
+    
+    def add(self, value: float):
+        """Fold one value into the summary."""
+        self.count += 1
+        self.total += value
+        self.low = min(self.low, value)
+        self.high = max(self.high, value)
+    
+    def summary(self) -> dict:
+        """Count, mean, min and max as a dictionary (count only when empty)."""
+        if not self.count:
+            return {'count': 0}
+        return {'count': self.count, 'mean': self.total / self.count, 'min': self.low, 'max': self.high}
+
+
+class StreamingAnalyzer:
+    """Accumulates session statistics from spawn and kill events in tick order.
+    
+    Per living agent it keeps its kind, spawn tick, kills and kill-chain
+    depth; an agent's entry is folded into the summaries when it dies.
+    A kill chain is the longest sequence of agents each killed by the
+    next: killing an agent whose chain is ``n`` gives the killer ``n + 1``.
+    """
+    
+    def __init__(self, window: int = 600, cell_size: float = 100.0, top: int = 10):
+        """Initialize empty summaries.
+        
+        Args:
+            window: Ticks per kill-rate window
+            cell_size: World units per cell of the spatial kill histogram
+            top: Number of top killers to report
+        """
+        self.window = window
+        self.cell_size = cell_size
+        self.top = top
+        self._living: Dict[int, list] = {}  # id -> [kind, spawn_tick, kills, chain]
+        self._top: List[Tuple[int, int, str]] = []  # Min-heap of (kills, id, kind)
+        self.spawns: Dict[str, int] = {}
+        self.kills: Dict[str, int] = {}
+        self.lifespans: Dict[str, _Running] = {}
+        self.chains: Dict[int, int] = {}  # Final chain depth -> agents
+        self.windows: List[dict] = []  # Closed kill-rate windows
+        self._window_index: Optional[int] = None
+        self._window_kills: Dict[str, int] = {}
+        self._kill_x: Dict[str, _Running] = {}
+        self._kill_y: Dict[str, _Running] = {}
+        self.cells: Dict[Tuple[int, int], int] = {}
+        self.unknown_victims = 0  # Kills of agents without a spawn record
+        self.last_tick = 0
+    
+    def add_spawn(self, agent_id: int, kind: str, x: float, y: float, tick: int):
+        """Process one spawn event."""
+        self._living[agent_id] = [kind, tick, 0, 0]
+        self.spawns[kind] = self.spawns.get(kind, 0) + 1
+        self.last_tick = max(self.last_tick, tick)
+    
+    def add_kill(self, winner_id: int, winner_kind: str, loser_id: int, loser_kind: str,
+                 x: float, y: float, tick: int):
+        """Process one kill event."""
+        self.last_tick = max(self.last_tick, tick)
+        self.kills[winner_kind] = self.kills.get(winner_kind, 0) + 1
+        self._count_window(winner_kind, tick)
+        
+        if winner_kind not in self._kill_x:
+            self._kill_x[winner_kind] = _Running()
+            self._kill_y[winner_kind] = _Running()
+        self._kill_x[winner_kind].add(x)
+        self._kill_y[winner_kind].add(y)
+        cell = (int(x // self.cell_size), int(y // self.cell_size))
+        self.cells[cell] = self.cells.get(cell, 0) + 1
+        
+        victim = self._living.pop(loser_id, None)
+        if victim is None:
+            self.unknown_victims += 1
+            victim_chain = 0
+        else:
+            victim_chain = victim[3]
+            if victim[1] is not None:
+                self.lifespans.setdefault(loser_kind, _Running()).add(tick - victim[1])
+            self._retire(loser_id, victim)
+        
+        killer = self._living.get(winner_id)
+        if killer is None:
+            # Spawned before logging started: track it from here
+            killer = self._living[winner_id] = [winner_kind, None, 0, 0]
+        killer[2] += 1
+        killer[3] = max(killer[3], victim_chain + 1)
+    
+    def _count_window(self, kind: str, tick: int):
+        """Add a kill to its time window, closing finished windows."""
+        index = tick // self.window
+        if index != self._window_index:
+            self._close_window()
+            self._window_index = index
+        self._window_kills[kind] = self._window_kills.get(kind, 0) + 1
+    
+    def _close_window(self):
+        """Record the finished kill-rate window (if it saw kills) and start a new one."""
+        if self._window_index is not None and self._window_kills:
+            start = self._window_index * self.window
+            self.windows.append({
+                'start_tick': start,
+                'end_tick': start + self.window,
+                'kills': dict(self._window_kills),
+            })
+        self._window_kills = {}
+    
+    def _retire(self, agent_id: int, entry: list):
+        """Fold a finished agent into the chain and top-killer summaries."""
+        kind, _, kills, chain = entry
+        self.chains[chain] = self.chains.get(chain, 0) + 1
+        if kills:
+            item = (kills, -agent_id, kind)  # Lower ids win ties
+            if len(self._top) < self.top:
+                heapq.heappush(self._top, item)
+            elif item > self._top[0]:
+                heapq.heapreplace(self._top, item)
+    
+    def result(self) -> dict:
+        """Finish the stream and return all summaries.
+        
+        Agents still alive are counted as survivors; their kills and
+        chains are included.
+        """
+        self._close_window()
+        survivors: Dict[str, int] = {}
+        for agent_id, entry in self._living.items():
+            survivors[entry[0]] = survivors.get(entry[0], 0) + 1
+            self._retire(agent_id, entry)
+        self._living.clear()
+        
+        kinds = sorted(set(self.spawns) | set(self.kills) | set(survivors))
+        return {
+            'last_tick': self.last_tick,
+            'spawns': self.spawns,
+            'kills': self.kills,
+            'survivors': survivors,
+            'lifespans': {kind: self.lifespans[kind].summary() for kind in kinds if kind in self.lifespans},
+            'top_killers': [
+                {'id': -neg_id, 'kind': kind, 'kills': kills}
+                for kills, neg_id, kind in sorted(self._top, reverse=True)
+            ],
+            'kill_chains': {
+                'max': max(self.chains, default=0),
+                'agents_by_length': dict(sorted(self.chains.items())),
+            },
+            'kill_rate_windows': self.windows,
+            'spatial': {
+                'kill_centroids': {
+                    kind: {'x': self._kill_x[kind].total / self._kill_x[kind].count,
+                           'y': self._kill_y[kind].total / self._kill_y[kind].count}
+                    for kind in self._kill_x
+                },
+                'kill_bounds': {
+                    kind: {'x0': self._kill_x[kind].low, 'y0': self._kill_y[kind].low,
+                           'x1': self._kill_x[kind].high, 'y1': self._kill_y[kind].high}
+                    for kind in self._kill_x
+                },
+                'cell_size': self.cell_size,
+                'hottest_cells': [
+                    {'cell': list(cell), 'kills': count}
+                    for cell, count in heapq.nlargest(self.top, self.cells.items(), key=lambda item: item[1])
+                ],
+            },
+            'unknown_victims': self.unknown_victims,
+        }
+
+
+def _read_chunks(path: str, chunk_size: int) -> Iterator[list]:
+    """Yield lists of up to chunk_size parsed rows (header skipped)."""
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        while True:
+            chunk = list(itertools.islice(reader, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def _events(path: str, order: int, chunk_size: int) -> Iterator[tuple]:
+    """Events of one file as (tick, order, row), read chunk by chunk."""
+    for chunk in _read_chunks(path, chunk_size):
+        for row in chunk:
+            yield int(row[-1]), order, row
+
+
+def analyze_files(spawn_path: str, collision_path: str, window: int = 600,
+                  cell_size: float = 100.0, top: int = 10, chunk_size: int = 10000) -> dict:
+    """Analyze a pair of exported event logs in one pass.
+    
+    Both files are in tick order (as exported); they are merged so each
+    tick's spawns are applied before its kills.
+    
+    Args:
+        spawn_path: spawns_*.csv file
+        collision_path: collisions_*.csv file
+        window: Ticks per kill-rate window
+        cell_size: World units per spatial histogram cell
+        top: Number of top killers and hottest cells to report
+        chunk_size: Rows read from each file at a time
+        
+    Returns:
+        Summary dictionary (see StreamingAnalyzer.result)
+    """
+    analyzer = StreamingAnalyzer(window=window, cell_size=cell_size, top=top)
+    merged = heapq.merge(
+        _events(spawn_path, 0, chunk_size),
+        _events(collision_path, 1, chunk_size),
+        key=lambda event: event[:2]
+    )
+    for tick, order, row in merged:
+        if order == 0:
+            analyzer.add_spawn(int(row[0]), row[1], float(row[2]), float(row[3]), tick)
+        else:
+            analyzer.add_kill(int(row[0]), row[1], int(row[2]), row[3],
+                              float(row[4]), float(row[5]), tick)
+    return analyzer.result()
+
+
+def format_report(result: dict) -> str:
+    """Render a summary as plain text."""
+    lines = [f"Session: {result['last_tick']} ticks"]
+    kinds = sorted(set(result['spawns']) | set(result['kills']) | set(result['survivors']))
+    lines.append(f"{'kind':>10s} {'spawned':>8s} {'kills':>7s} {'alive':>6s} {'mean life':>10s} {'max life':>9s}")
+    for kind in kinds:
+        life = result['lifespans'].get(kind, {'count': 0})
+        mean = f"{life['mean']:.1f}" if life['count'] else '-'
+        high = f"{life['max']}" if life['count'] else '-'
+        lines.append(
+            f"{kind:>10s} {result['spawns'].get(kind, 0):>8d} {result['kills'].get(kind, 0):>7d} "
+            f"{result['survivors'].get(kind, 0):>6d} {mean:>10s} {high:>9s}"
+        )
+    
+    lines.append("")
+    lines.append("Top killers:")
+    for rank, killer in enumerate(result['top_killers'], 1):
+        lines.append(f"  {rank:>2d}. #{killer['id']} ({killer['kind']}): {killer['kills']}")
+    
+    chains = result['kill_chains']
+    lines.append("")
+    lines.append(f"Longest kill chain: {chains['max']}")
+    for length, count in chains['agents_by_length'].items():
+        lines.append(f"  {length}: {count} agents")
+    
+    lines.append("")
+    lines.append("Kills per window:")
+    for window in result['kill_rate_windows']:
+        counts = ', '.join(f"{kind} {n}" for kind, n in sorted(window['kills'].items()))
+        lines.append(f"  ticks {window['start_tick']}-{window['end_tick']}: {counts}")
+    
+    spatial = result['spatial']
+    lines.append("")
+    lines.append("Kill centroids:")
+    for kind, centre in sorted(spatial['kill_centroids'].items()):
+        lines.append(f"  {kind}: ({centre['x']:.0f}, {centre['y']:.0f})")
+    lines.append(f"Hottest {spatial['cell_size']:g}-unit cells:")
+    for cell in spatial['hottest_cells']:
+        lines.append(f"  {tuple(cell['cell'])}: {cell['kills']}")
+    if result['unknown_victims']:
+        lines.append(f"\n{result['unknown_victims']} kills of agents without a spawn record")
+    return "\n".join(lines)
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Analyze exported RPS World event logs')
+    parser.add_argument('spawns', help='spawns_*.csv file')
+    parser.add_argument('collisions', help='collisions_*.csv file')
+    parser.add_argument('--window', type=int, default=600, help='Ticks per kill-rate window')
+    parser.add_argument('--cell', type=float, default=100.0, help='Spatial histogram cell size')
+    parser.add_argument('--top', type=int, default=10, help='Top killers and cells to list')
+    parser.add_argument('--chunk-size', type=int, default=10000, help='Rows read at a time')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    args = parser.parse_args()
+    
+    result = analyze_files(args.spawns, args.collisions, window=args.window,
+                           cell_size=args.cell, top=args.top, chunk_size=args.chunk_size)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(format_report(result))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,380 @@
+"""Parameter sweeps over Config fields with headless runs.
+
+Every point of a grid or random sample of ``Config`` overrides is run
+with a series of seeds (the same seeds for every point, so points are
+compared on equal terms) across a process pool. A point stops receiving
+seeds once the confidence intervals of its win rates are narrow enough.
+Runs are folded into the statistics in seed order even when they finish
+out of order, so a sweep gives the same rows for any number of workers.
+
+Early stopping pays off mostly for lopsided points. A balanced point
+(win rates near 1/3) needs about 85 runs for a 95% half-width of 0.1 and
+about 340 for 0.05, so the defaults (tolerance 0.1, up to 200 seeds) let
+balanced points stop at roughly 85 runs and dominated ones at min_seeds.
+
+Usage:
+    python -m rps.analysis.sweep --grid 'agent_speed_rock=[[50,80],[70,100]]' \\
+        --grid 'bounce_on_tie=[true,false]' --seeds 200 --workers 4 --out sweep.csv
+    python -m rps.analysis.sweep --random 'agent_radius_paper=[8,16]' --samples 20
+"""
+
+import argparse
+import csv
+import dataclasses
+import itertools
+import json
+import math
+import multiprocessing
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from ..core.cache import ResultCache, run_key
+from ..core.config import Config, KINDS
+from ..core.headless import RunResult, run_headless
+
+Z_95 = 1.96
+
+
+def _check_fields(names) -> Dict[str, Any]:
+    """Map field names to their Config defaults, rejecting unknown names and the seed."""
+    defaults = {f.name: f.default for f in dataclasses.fields(Config)}
+    for name in names:
+        if name == 'seed':
+            raise ValueError("seed cannot be swept; every point already runs --seeds seeds")
+        if name not in defaults:
+            raise ValueError(f"Unknown Config field: {name}")
+    return defaults
+
+
+def _coerce(value, default):
+    """Match a value's type to a Config default (JSON lists -> tuples)."""
+    if isinstance(default, tuple) and isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def grid_points(space: Dict[str, Sequence]) -> List[Dict[str, Any]]:
+    """All combinations of the given field values.
+    
+    Args:
+        space: Field name -> values to try
+        
+    Returns:
+        One override dict per combination
+    """
+    defaults = _check_fields(space)
+    names = list(space)
+    return [
+        {name: _coerce(value, defaults[name]) for name, value in zip(names, values)}
+        for values in itertools.product(*(space[name] for name in names))
+    ]
+
+
+def random_points(space: Dict[str, Any], samples: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Random overrides within per-field ranges.
+    
+    Args:
+        space: Field name -> (low, high) range, or a list of choices for
+            fields that are not int/float (e.g. booleans, speed tuples)
+        samples: Number of points
+        seed: Sampling seed
+        
+    Returns:
+        One override dict per sample
+    """
+    defaults = _check_fields(space)
+    rng = random.Random(seed)
+    points = []
+    for _ in range(samples):
+        point = {}
+        for name, spec in space.items():
+            default = defaults[name]
+            if isinstance(default, bool) or not isinstance(default, (int, float)):
+                point[name] = _coerce(rng.choice(list(spec)), default)
+            elif isinstance(default, int):
+                point[name] = rng.randint(int(spec[0]), int(spec[1]))
+            else:
+                point[name] = rng.uniform(spec[0], spec[1])
+        points.append(point)
+    return points
+
+
+def wilson_halfwidth(successes: int, n: int, z: float = Z_95) -> float:
+    """Half-width of the Wilson score interval for a proportion."""
+    if n == 0:
+        return 1.0
+    p = successes / n
+    return z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+
+
+@dataclasses.dataclass
+class PointStats:
+    """Balance metrics of one sweep point, updated run by run."""
+    params: Dict[str, Any]
+    runs: int = 0
+    wins: Dict[str, int] = dataclasses.field(default_factory=lambda: {kind: 0 for kind in KINDS})
+    timeouts: int = 0  # Runs that hit max_ticks without a winner
+    decided: int = 0  # Runs stopped early at a decided state (Config.early_termination)
+    won_runs: int = 0  # Runs with a winner (Welford count for mean_ticks)
+    mean_ticks: float = 0.0
+    _m2: float = 0.0
+    converged: bool = False
+    elapsed: float = 0.0  # Wall-clock seconds spent in runs
+    
+    def add(self, result: RunResult):
+        """Fold one run into the statistics."""
+        self.runs += 1
+        self.elapsed += result.elapsed
+        if result.decided_tick is not None and result.ticks == result.decided_tick:
+            self.decided += 1
+        if result.winner is None:
+            self.timeouts += 1
+            return
+        self.wins[result.winner] = self.wins.get(result.winner, 0) + 1
+        self.won_runs += 1
+        delta = result.ticks - self.mean_ticks
+        self.mean_ticks += delta / self.won_runs
+        self._m2 += delta * (result.ticks - self.mean_ticks)
+    
+    def win_rate(self, kind: str) -> float:
+        """Share of runs won by a kind."""
+        return self.wins.get(kind, 0) / self.runs if self.runs else 0.0
+    
+    def win_rate_ci(self, kind: str) -> float:
+        """95% half-width of a kind's win rate."""
+        return wilson_halfwidth(self.wins.get(kind, 0), self.runs)
+    
+    def ticks_ci(self) -> float:
+        """95% half-width of the mean ticks to victory (or to the decided state)."""
+        n = self.won_runs
+        if n < 2:
+            return math.inf
+        return Z_95 * math.sqrt(self._m2 / (n - 1) / n)
+    
+    def row(self) -> Dict[str, Any]:
+        """Flat summary for a results table.
+        
+        ``mean_ticks`` is the mean length of runs with a winner: ticks to
+        victory, or to the decided state for the ``decided_rate`` share of
+        runs stopped early.
+        """
+        row = {name: json.dumps(value) if isinstance(value, (tuple, list)) else value
+               for name, value in self.params.items()}
+        row['runs'] = self.runs
+        for kind in self.wins:
+            row[f'win_{kind}'] = round(self.win_rate(kind), 4)
+            row[f'win_{kind}_ci'] = round(self.win_rate_ci(kind), 4)
+        row['timeout_rate'] = round(self.timeouts / self.runs, 4) if self.runs else 0.0
+        row['decided_rate'] = round(self.decided / self.runs, 4) if self.runs else 0.0
+        row['mean_ticks'] = round(self.mean_ticks, 1)
+        row['mean_ticks_ci'] = round(self.ticks_ci(), 1)
+        row['converged'] = self.converged
+        return row
+
+
+def _run_point(config: Config, count_per_kind: Optional[int], dt: float, max_ticks: int) -> RunResult:
+    """Pool entry point: one headless run."""
+    return run_headless(config, count_per_kind, dt=dt, max_ticks=max_ticks)
+
+
+class Sweep:
+    """Runs seeds for each point until its win rates converge or seeds run out."""
+    
+    def __init__(self, points: List[Dict[str, Any]], base: Optional[Config] = None,
+                 seeds: int = 200, min_seeds: int = 20, tolerance: float = 0.1,
+                 workers: int = 1, count_per_kind: Optional[int] = None,
+                 dt: float = 1 / 60, max_ticks: int = 20000, first_seed: int = 0,
+                 cache: Optional[ResultCache] = None):
+        """Configure the sweep.
+        
+        Args:
+            points: Config overrides, one dict per point
+            base: Config the overrides apply to (defaults to Config())
+            seeds: Maximum runs per point
+            min_seeds: Runs before a point may stop early
+            tolerance: Stop a point once every win-rate 95% half-width is below this
+            workers: Worker processes (1 runs in this process)
+            count_per_kind: Initial agents per kind
+            dt: Fixed timestep in seconds
+            max_ticks: Tick limit per run
+            first_seed: Seed of each point's first run (then first_seed + 1, ...)
+            cache: Optional ResultCache; runs found there are not simulated again
+            
+        Raises:
+            ValueError: If seeds is less than 1
+        """
+        if seeds < 1:
+            raise ValueError(f"seeds must be at least 1, got {seeds}")
+        self.points = points
+        self.base = base or Config()
+        self.seeds = seeds
+        self.min_seeds = min_seeds
+        self.tolerance = tolerance
+        self.workers = workers
+        self.run_args = (count_per_kind, dt, max_ticks)
+        self.first_seed = first_seed
+        self.cache = cache
+    
+    def _config(self, point: Dict[str, Any], seed: int) -> Config:
+        """Config for one run: the base with a point's overrides and a seed."""
+        return dataclasses.replace(self.base, **point, seed=seed)
+    
+    def _cached(self, config: Config) -> Optional[RunResult]:
+        """Stored result of a run, if a cache is configured and holds it."""
+        if self.cache is None:
+            return None
+        return self.cache.get(run_key(config, *self.run_args))
+    
+    def _store(self, config: Config, result: RunResult):
+        """Save a run's result to the cache, if one is configured."""
+        if self.cache is not None:
+            self.cache.put(run_key(config, *self.run_args), result)
+    
+    def _done(self, stats: PointStats) -> bool:
+        """Check (and record) whether a point needs no more runs."""
+        if stats.runs >= self.min_seeds and all(
+                stats.win_rate_ci(kind) <= self.tolerance for kind in stats.wins):
+            stats.converged = True
+        return stats.converged or stats.runs >= self.seeds
+    
+    def run(self) -> Iterator[PointStats]:
+        """Run the sweep, yielding each point's statistics when it finishes.
+        
+        Yields:
+            PointStats in completion order
+        """
+        stats = [PointStats(dict(point)) for point in self.points]
+        if self.workers <= 1:
+            for point in stats:
+                for seed in range(self.first_seed, self.first_seed + self.seeds):
+                    config = self._config(point.params, seed)
+                    result = self._cached(config)
+                    if result is None:
+                        result = _run_point(config, *self.run_args)
+                        self._store(config, result)
+                    point.add(result)
+                    if self._done(point):
+                        break
+                yield point
+            return
+        
+        # Interleave points so early stopping frees workers for the rest
+        queue = [(i, seed) for seed in range(self.first_seed, self.first_seed + self.seeds)
+                 for i in range(len(stats))]
+        queue.reverse()  # Pop from the end
+        finished = [False] * len(stats)
+        # Results that finished ahead of an earlier seed, and the next seed to fold, per point
+        early: List[Dict[int, RunResult]] = [{} for _ in stats]
+        next_seed = [self.first_seed] * len(stats)
+        
+        def fold(i: int, seed: int, result: RunResult) -> bool:
+            """Fold the contiguous run of seeds now available; return True if the point finished."""
+            early[i][seed] = result
+            while not finished[i] and next_seed[i] in early[i]:
+                stats[i].add(early[i].pop(next_seed[i]))
+                next_seed[i] += 1
+                finished[i] = self._done(stats[i])
+            if finished[i]:
+                early[i].clear()  # Surplus runs past the stopping point
+            return finished[i]
+        
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+            in_flight = {}
+            
+            def fill() -> List[PointStats]:
+                """Submit runs up to the in-flight limit; return points finished from the cache."""
+                ready = []
+                while queue and len(in_flight) < self.workers * 2:
+                    i, seed = queue.pop()
+                    if finished[i]:
+                        continue
+                    config = self._config(stats[i].params, seed)
+                    cached = self._cached(config)
+                    if cached is not None:
+                        if fold(i, seed, cached):
+                            ready.append(stats[i])
+                        continue
+                    in_flight[pool.submit(_run_point, config, *self.run_args)] = (i, seed, config)
+                return ready
+            
+            yield from fill()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, seed, config = in_flight.pop(future)
+                    result = future.result()
+                    self._store(config, result)
+                    if not finished[i] and fold(i, seed, result):
+                        yield stats[i]
+                yield from fill()
+
+
+def _parse_space(items: List[str]) -> Dict[str, Any]:
+    """Parse 'field=<json>' options."""
+    space = {}
+    for item in items:
+        name, _, value = item.partition('=')
+        space[name.strip()] = json.loads(value)
+    return space
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Sweep Config fields with headless runs')
+    parser.add_argument('--grid', action='append', default=[], metavar='FIELD=JSON_LIST',
+                        help='Values to try for a field (repeatable)')
+    parser.add_argument('--random', action='append', default=[], metavar='FIELD=JSON',
+                        help='[low, high] range, or a list of choices, for a field (repeatable)')
+    parser.add_argument('--samples', type=int, default=20, help='Random points to draw')
+    parser.add_argument('--seeds', type=int, default=200, help='Maximum runs per point')
+    parser.add_argument('--min-seeds', type=int, default=20, help='Runs before early stopping')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='Stop a point once win-rate 95%% CI half-widths are below this '
+                             '(balanced points need ~85 runs for 0.1, ~340 for 0.05)')
+    parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count())
+    parser.add_argument('--count', type=int, default=None, help='Initial agents per kind')
+    parser.add_argument('--max-ticks', type=int, default=20000)
+    parser.add_argument('--early-termination', action='store_true',
+                        help='End runs at a decided state (two kinds left) with the predicted winner')
+    parser.add_argument('--decided-minority', type=float, default=0.0,
+                        help='Also end runs when a kind falls to this share of the living')
+    parser.add_argument('--out', help='CSV file for the results table (default: stdout)')
+    parser.add_argument('--cache', metavar='DIR', help='Reuse and store run results in this directory')
+    parser.add_argument('--cache-size', type=float, default=64, help='Cache size limit in MB')
+    args = parser.parse_args()
+    
+    points = grid_points(_parse_space(args.grid)) if args.grid else [{}]
+    if args.random:
+        sampled = random_points(_parse_space(args.random), args.samples)
+        points = [dict(g, **r) for g in points for r in sampled]
+    
+    cache = ResultCache(args.cache, int(args.cache_size * 1024 * 1024)) if args.cache else None
+    base = Config(early_termination=args.early_termination, decided_minority=args.decided_minority)
+    sweep = Sweep(points, base=base, seeds=args.seeds, min_seeds=args.min_seeds, tolerance=args.tolerance,
+                  workers=args.workers, count_per_kind=args.count, max_ticks=args.max_ticks,
+                  cache=cache)
+    out = open(args.out, 'w', newline='') if args.out else sys.stdout
+    writer = None
+    start = time.perf_counter()
+    try:
+        for stats in sweep.run():
+            row = stats.row()
+            if writer is None:
+                writer = csv.DictWriter(out, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+            out.flush()  # Stream rows as points finish
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{len(points)} points in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    if cache is not None:
+        print(f"cache: {cache.hits} hits, {cache.misses} misses, {len(cache)} results "
+              f"({cache.size_bytes / 1024:.0f} KB)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
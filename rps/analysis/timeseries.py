@@ -0,0 +1,117 @@
+"""Fixed-memory population history with downsampling tiers."""
+
+import csv
+from typing import Dict, Sequence
+import numpy as np
+
+
+class PopulationSeries:
+    """Per-kind population and kills per tick in ring buffers.
+    
+    Tier ``t`` keeps one sample every ``factor ** t`` ticks in its own ring
+    of ``capacity`` rows: population counts as of the sample's tick and
+    the kills summed since the previous sample. Tier 0 holds the recent
+    past at full resolution; coarser tiers cover ``factor`` times longer
+    spans each, so memory stays at ``tiers * capacity`` rows however long
+    the run. Rows are ``(tick, count per kind..., kills)``.
+    """
+    
+    def __init__(self, kinds: Sequence[str], capacity: int = 512, tiers: int = 3, factor: int = 8):
+        """Initialize empty buffers.
+        
+        Args:
+            kinds: Kinds recorded, in column order
+            capacity: Rows per tier
+            tiers: Number of resolution tiers
+            factor: Downsampling factor between consecutive tiers
+        """
+        self.kinds = list(kinds)
+        self.capacity = capacity
+        self.periods = [factor ** tier for tier in range(tiers)]
+        self._rows = np.zeros((tiers, capacity, len(self.kinds) + 2), dtype=np.int64)
+        self.generation = 0  # Bumped by clear, so caches can tell runs apart
+        self.clear()
+    
+    def clear(self):
+        """Drop all samples."""
+        tiers = len(self.periods)
+        self._size = [0] * tiers
+        self._head = [0] * tiers  # Next row to write
+        self._pending = [0] * tiers  # Kills since the tier's last sample
+        self.samples = 0  # Ticks recorded
+        self.generation += 1
+    
+    def record(self, tick: int, counts: Dict[str, int], kills: int):
+        """Append one tick.
+        
+        Amortized O(1): a coarser tier is only touched when its period
+        elapses.
+        
+        Args:
+            tick: Game tick
+            counts: Living agents per kind
+            kills: Kills during this tick
+        """
+        self.samples += 1
+        pending = self._pending
+        for tier in range(len(self.periods)):
+            pending[tier] += kills
+        row = [tick]
+        row.extend(counts.get(kind, 0) for kind in self.kinds)
+        row.append(0)
+        for tier, period in enumerate(self.periods):
+            if self.samples % period:
+                break  # Coarser periods are multiples of this one
+            row[-1] = pending[tier]
+            pending[tier] = 0
+            head = self._head[tier]
+            self._rows[tier, head] = row
+            self._head[tier] = (head + 1) % self.capacity
+            self._size[tier] = min(self._size[tier] + 1, self.capacity)
+    
+    def __len__(self) -> int:
+        """Rows held at full resolution."""
+        return self._size[0]
+    
+    def series(self, tier: int = 0) -> np.ndarray:
+        """Rows of one tier in chronological order.
+        
+        Args:
+            tier: Resolution tier
+            
+        Returns:
+            Array of shape (rows, kinds + 2): tick, counts..., kills
+        """
+        size, head = self._size[tier], self._head[tier]
+        rows = self._rows[tier]
+        if size < self.capacity:
+            return rows[:size].copy()
+        return np.concatenate((rows[head:], rows[:head]))
+    
+    def covering_tier(self) -> int:
+        """Finest tier that still covers the whole run (or the coarsest)."""
+        for tier, period in enumerate(self.periods):
+            if self.samples <= period * self.capacity:
+                return tier
+        return len(self.periods) - 1
+    
+    def export_csv(self, path: str) -> str:
+        """Write every tier to a CSV file.
+        
+        Args:
+            path: Output file path
+            
+        Returns:
+            The path written
+        """
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['tier', 'ticks_per_sample', 'tick', *self.kinds, 'kills'])
+            for tier, period in enumerate(self.periods):
+                for row in self.series(tier).tolist():
+                    writer.writerow([tier, period, *row])
+        return path
+    
+    def memory_usage(self) -> int:
+        """Bytes held by the ring buffers (constant)."""
+        return self._rows.nbytes
@@ -0,0 +1,159 @@
+"""Rate limiting and admission control for the spawn API."""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+    
+    def __init__(self, rate: float, burst: float, now: float):
+        """Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+            now: Current monotonic time
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = now
+    
+    def _refill(self, now: float):
+        """Add tokens accumulated since the last refill."""
+        if now > self.last:
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+    
+    def acquire(self, now: float) -> float:
+        """Take one token if available.
+        
+        Args:
+            now: Current monotonic time
+            
+        Returns:
+            0.0 if a token was taken, otherwise seconds until one is available
+        """
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+    
+    def is_full(self, now: float) -> bool:
+        """Check whether the bucket has refilled completely."""
+        self._refill(now)
+        return self.tokens >= self.burst
+
+
+class RateLimiter:
+    """Per-client token buckets."""
+    
+    # Idle-bucket sweep interval (in acquisitions)
+    SWEEP_INTERVAL = 1000
+    
+    def __init__(self, rate: float, burst: float):
+        """Initialize the rate limiter.
+        
+        Args:
+            rate: Requests per second allowed per client
+            burst: Requests a client may make at once after being idle
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._acquisitions = 0
+    
+    def acquire(self, client_id: str, now: Optional[float] = None) -> float:
+        """Consume one request from a client's budget.
+        
+        Args:
+            client_id: Client identifier (e.g. remote address)
+            now: Optional monotonic timestamp
+            
+        Returns:
+            0.0 if allowed, otherwise seconds the client should wait
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(client_id)
+            if bucket is None:
+                bucket = self._buckets[client_id] = TokenBucket(self.rate, self.burst, now)
+            retry_after = bucket.acquire(now)
+            
+            self._acquisitions += 1
+            if self._acquisitions % self.SWEEP_INTERVAL == 0:
+                # Full buckets carry no state, so they can be dropped
+                self._buckets = {
+                    cid: b for cid, b in self._buckets.items() if not b.is_full(now)
+                }
+            return retry_after
+    
+    def client_count(self) -> int:
+        """Number of clients currently tracked."""
+        return len(self._buckets)
+
+
+class AdmissionController:
+    """Decides whether a spawn request may enter the spawn queue.
+    
+    The game loop publishes a population snapshot every tick; API handler
+    threads read it without locking (the snapshot is an immutable tuple
+    swapped in one assignment).
+    """
+    
+    def __init__(self, max_population: int, rate: float, burst: float):
+        """Initialize admission control.
+        
+        Args:
+            max_population: Initial population cap
+            rate: Spawn requests per second allowed per client
+            burst: Spawn request burst allowed per client
+        """
+        self.rate_limiter = RateLimiter(rate, burst) if rate > 0 else None
+        self._snapshot: Tuple[int, int] = (0, max_population)
+    
+    def publish(self, population: int, max_population: int):
+        """Publish the current population (game thread, once per tick).
+        
+        Args:
+            population: Living agents
+            max_population: Current population cap
+        """
+        self._snapshot = (population, max_population)
+    
+    def snapshot(self) -> Tuple[int, int]:
+        """Latest published (population, max_population)."""
+        return self._snapshot
+    
+    def check_rate(self, client_id: str, now: Optional[float] = None) -> float:
+        """Charge a request against the client's token bucket.
+        
+        Args:
+            client_id: Client identifier
+            now: Optional monotonic timestamp
+            
+        Returns:
+            0.0 if allowed, otherwise seconds until retry
+        """
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.acquire(client_id, now)
+    
+    def check_capacity(self, queued: int) -> Optional[Tuple[int, int]]:
+        """Check whether one more spawn fits under the population cap.
+        
+        Args:
+            queued: Requests already waiting in the spawn queue
+            
+        Returns:
+            None if admitted, otherwise (current_population, max_population)
+        """
+        population, max_population = self._snapshot
+        if population + queued >= max_population:
+            return population, max_population
+        return None
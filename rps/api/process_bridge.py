@@ -0,0 +1,191 @@
+"""Run the API server in a separate process.
+
+The Flask server lives in a child process so request parsing and JSON work
+never compete with the game loop for the GIL. The two processes share one
+``multiprocessing`` pipe:
+
+- child -> game: a start-up handshake (``('ready',)`` or ``('error', message)``),
+  then batches of validated spawn requests, as plain tuples
+- game -> child: population snapshots for admission control and /api/status
+
+The game loop's cost is one non-blocking ``ApiProcessBridge.receive`` per
+frame.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from typing import List, Optional
+from .spawn_queue import SpawnRequest
+
+
+def _to_tuple(request: SpawnRequest) -> tuple:
+    """Flatten a spawn request for cheap pickling."""
+    return (request.agent_type, request.x, request.y,
+            request.original_x, request.original_y, request.adjusted)
+
+
+def _serve_api(conn, host: str, port: int, world_width: int, world_height: int,
+               rate: float, burst: float, max_population: int, flush_interval: float):
+    """Child process entry point: run the API server and forward spawn batches."""
+    try:
+        import api_server
+        from werkzeug.serving import make_server
+        from .admission import AdmissionController
+        from .spawn_api import SpawnAPI
+        from .spawn_queue import SpawnQueue
+    except ImportError as e:
+        conn.send(('error', f"Flask not installed ({e})"))
+        return
+    
+    spawn_queue = SpawnQueue()
+    admission = AdmissionController(max_population=max_population, rate=rate, burst=burst)
+    api_server.set_spawn_api(SpawnAPI(screen_width=world_width, screen_height=world_height, margin=50))
+    api_server.set_spawn_queue(spawn_queue)
+    api_server.set_admission(admission)
+    
+    # Bind before reporting ready, so a taken port is reported to the game
+    try:
+        server = make_server(host, port, api_server.app, threaded=True)
+    except (OSError, SystemExit):  # Werkzeug exits (after printing why) if the port is taken
+        conn.send(('error', f"Cannot listen on {host}:{port}"))
+        return
+    conn.send(('ready',))
+    
+    def forward_spawns():
+        """Drain the local queue and ship each drain as one pipe message."""
+        while True:
+            requests = spawn_queue.get_all()
+            if requests:
+                conn.send([_to_tuple(r) for r in requests])
+            time.sleep(flush_interval)
+    
+    def receive_status():
+        """Apply status snapshots from the game; exit when the game goes away."""
+        try:
+            while True:
+                message = conn.recv()
+                if message is None:
+                    break
+                admission.publish(*message)
+        except EOFError:
+            pass
+        os._exit(0)
+    
+    threading.Thread(target=forward_spawns, daemon=True).start()
+    threading.Thread(target=receive_status, daemon=True).start()
+    server.serve_forever()
+
+
+class ApiProcessBridge:
+    """Game-side handle on an API server running in a child process."""
+    
+    def __init__(self, config, host: str = '127.0.0.1', port: int = 5000,
+                 flush_interval: float = 0.005):
+        """Initialize the bridge (the process is started by ``start``).
+        
+        Args:
+            config: Game configuration
+            host: Host to bind the API server to
+            port: Port to listen on
+            flush_interval: Seconds between spawn batch transfers in the child
+        """
+        self.config = config
+        self.host = host
+        self.port = port
+        self.flush_interval = flush_interval
+        self.process = None
+        self._conn = None
+        self._last_status = None
+    
+    def start(self, timeout: float = 15.0):
+        """Start the API server process and wait until it is listening.
+        
+        Args:
+            timeout: Seconds to wait for the child's start-up handshake
+            
+        Raises:
+            RuntimeError: If the server could not start (Flask missing, port
+                taken, or the process died); the process is cleaned up
+        """
+        # Spawn (not fork) so the child never inherits pygame/SDL state
+        context = multiprocessing.get_context('spawn')
+        self._conn, child_conn = context.Pipe(duplex=True)
+        self.process = context.Process(
+            target=_serve_api,
+            args=(child_conn, self.host, self.port,
+                  *self.config.world_size,
+                  self.config.api_rate_limit, self.config.api_rate_burst,
+                  self.config.max_population, self.flush_interval),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        
+        error = self._handshake(timeout)
+        if error is not None:
+            self.stop(timeout=0.5)
+            raise RuntimeError(error)
+    
+    def _handshake(self, timeout: float) -> Optional[str]:
+        """Wait for the child's start-up message.
+        
+        Returns:
+            None once the server is listening, otherwise an error description
+        """
+        try:
+            if not self._conn.poll(timeout):
+                return f"API server process did not start within {timeout:g}s"
+            message = self._conn.recv()
+        except (EOFError, OSError):
+            self.process.join(1.0)
+            return f"API server process exited during start-up (exit code {self.process.exitcode})"
+        if message[0] == 'error':
+            return message[1]
+        return None
+    
+    def receive(self) -> List[SpawnRequest]:
+        """Collect all spawn requests that have arrived (non-blocking).
+        
+        Returns:
+            List of spawn requests, oldest first
+        """
+        requests = []
+        try:
+            while self._conn.poll():
+                for fields in self._conn.recv():
+                    requests.append(SpawnRequest(*fields))
+        except (EOFError, OSError):
+            pass
+        return requests
+    
+    def send_status(self, population: int, max_population: int):
+        """Send a population snapshot to the API process if it changed.
+        
+        Args:
+            population: Living agents
+            max_population: Current population cap
+        """
+        status = (population, max_population)
+        if status == self._last_status:
+            return
+        try:
+            self._conn.send(status)
+            self._last_status = status
+        except (BrokenPipeError, OSError):
+            pass
+    
+    def stop(self, timeout: Optional[float] = 2.0):
+        """Ask the API process to exit and wait for it."""
+        if self.process is None:
+            return
+        try:
+            self._conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+        self._conn.close()
+        self.process = None
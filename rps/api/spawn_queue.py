@@ -1,8 +1,8 @@
 """Thread-safe spawn queue for communication between API and game loop."""
 
-import queue
+import threading
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 
 @dataclass
@@ -17,7 +17,13 @@ class SpawnRequest:
 
 
 class SpawnQueue:
-    """Thread-safe queue for spawn requests."""
+    """Thread-safe queue for spawn requests.
+    
+    Many producers (API handler threads) and a single consumer (the game
+    loop). Requests live in a preallocated ring buffer guarded by one lock,
+    so adding or draining any number of requests costs a single lock
+    acquisition.
+    """
     
     def __init__(self, maxsize: int = 1000):
         """Initialize the spawn queue.
@@ -25,7 +31,22 @@ class SpawnQueue:
         Args:
             maxsize: Maximum number of pending spawn requests
         """
-        self._queue = queue.Queue(maxsize=maxsize)
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._capacity = maxsize
+        self._buffer: List[Optional[SpawnRequest]] = [None] * maxsize
+        self._head = 0  # Index of the oldest pending request
+        self._count = 0
+        self._lock = threading.Lock()
+        
+        # Running totals (read by metrics)
+        self.enqueued = 0
+        self.dropped = 0
+    
+    @property
+    def capacity(self) -> int:
+        """Maximum number of pending spawn requests."""
+        return self._capacity
     
     def add(self, spawn_request: SpawnRequest) -> bool:
         """Add a spawn request to the queue.
@@ -36,25 +57,60 @@ class SpawnQueue:
         Returns:
             True if added successfully, False if queue is full
         """
-        try:
-            self._queue.put_nowait(spawn_request)
+        with self._lock:
+            if self._count >= self._capacity:
+                self.dropped += 1
+                return False
+            tail = (self._head + self._count) % self._capacity
+            self._buffer[tail] = spawn_request
+            self._count += 1
+            self.enqueued += 1
             return True
-        except queue.Full:
-            return False
+    
+    def add_batch(self, spawn_requests: Iterable[SpawnRequest]) -> int:
+        """Add several spawn requests under a single lock acquisition.
+        
+        Requests are accepted in order until the queue is full; the rest
+        are rejected.
+        
+        Args:
+            spawn_requests: Spawn requests to add
+            
+        Returns:
+            Number of requests accepted
+        """
+        spawn_requests = list(spawn_requests)
+        with self._lock:
+            accepted = min(len(spawn_requests), self._capacity - self._count)
+            tail = (self._head + self._count) % self._capacity
+            for i in range(accepted):
+                self._buffer[(tail + i) % self._capacity] = spawn_requests[i]
+            self._count += accepted
+            self.enqueued += accepted
+            self.dropped += len(spawn_requests) - accepted
+            return accepted
     
     def get_all(self) -> list:
         """Get all pending spawn requests (non-blocking).
         
         Returns:
-            List of spawn requests
+            List of spawn requests, oldest first
         """
-        requests = []
-        while not self._queue.empty():
-            try:
-                requests.append(self._queue.get_nowait())
-            except queue.Empty:
-                break
-        return requests
+        with self._lock:
+            if self._count == 0:
+                return []
+            end = self._head + self._count
+            if end <= self._capacity:
+                requests = self._buffer[self._head:end]
+                self._buffer[self._head:end] = [None] * self._count
+            else:
+                wrapped = end - self._capacity
+                requests = self._buffer[self._head:] + self._buffer[:wrapped]
+                self._buffer[self._head:] = [None] * (self._capacity - self._head)
+                self._buffer[:wrapped] = [None] * wrapped
+            self._head = 0
+            self._count = 0
+            return requests
     
     def size(self) -> int:
         """Get current queue size.
@@ -62,21 +118,31 @@ class SpawnQueue:
         Returns:
             Number of pending requests
         """
-        return self._queue.qsize()
+        return self._count
+    
+    def occupancy(self) -> Tuple[int, int]:
+        """Get a consistent (size, capacity) snapshot.
+        
+        Returns:
+            Tuple of (pending requests, capacity)
+        """
+        with self._lock:
+            return self._count, self._capacity
     
     def is_full(self) -> bool:
         """Check if queue is full.
         
+        Only advisory: another thread may add or drain right after the
+        check. Use the return value of ``add`` to detect a full queue.
+        
         Returns:
             True if queue is full
         """
-        return self._queue.full()
+        return self._count >= self._capacity
     
     def clear(self):
         """Clear all pending requests."""
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
-
+        with self._lock:
+            self._buffer = [None] * self._capacity
+            self._head = 0
+            self._count = 0
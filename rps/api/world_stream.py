@@ -0,0 +1,199 @@
+"""Live world-state streaming with delta encoding.
+
+The game thread calls ``WorldStream.publish`` after ``World.update``. Each
+published frame is encoded exactly once, as a Server-Sent Events message,
+and shared by every subscriber:
+
+- keyframes carry every living agent: ``[id, kind_code, x, y]``
+- deltas carry only what changed since the previous frame: ``spawned``
+  (``[id, kind_code, x, y]``), ``moved`` (``[id, dx, dy]``) and ``died``
+  (ids)
+  
+Positions are quantized to integer multiples of ``quantum`` pixels, so an
+agent that moved less than one quantum is not resent.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+from ..core.config import KINDS
+
+# (kind_code, quantized_x, quantized_y)
+AgentState = Tuple[int, int, int]
+
+
+def _sse(payload: dict) -> bytes:
+    """Encode a payload as a Server-Sent Events message."""
+    return f"data: {json.dumps(payload, separators=(',', ':'))}\n\n".encode()
+
+
+class WorldStream:
+    """Publishes quantized, delta-encoded world snapshots to subscribers."""
+    
+    def __init__(self, rate: float = 10.0, quantum: float = 1.0, keyframe_interval: int = 50):
+        """Initialize the stream.
+        
+        Args:
+            rate: Maximum published frames per second
+            quantum: Position quantization step in pixels
+            keyframe_interval: Number of frames between keyframes
+        """
+        self.min_interval = 1.0 / rate if rate > 0 else 0.0
+        self.quantum = quantum
+        self.keyframe_interval = keyframe_interval
+        
+        # Double buffer: the game thread fills _back, diffs it against
+        # _front, then swaps them. Only the game thread touches these.
+        self._front: Dict[int, AgentState] = {}
+        self._back: Dict[int, AgentState] = {}
+        self._last_publish = None
+        
+        # Encoded frames shared with subscriber threads
+        self._condition = threading.Condition()
+        self._seq = 0
+        self._keyframe: Optional[Tuple[int, bytes]] = None
+        self._key_delta: Optional[bytes] = None  # Delta form of the keyframe
+        self._deltas: deque = deque()  # (seq, bytes) published after _keyframe
+        self._closed = False
+    
+    @property
+    def seq(self) -> int:
+        """Sequence number of the latest published frame."""
+        return self._seq
+    
+    def publish(self, world, now: Optional[float] = None) -> bool:
+        """Snapshot the world and publish a frame (game thread only).
+        
+        Args:
+            world: World to snapshot
+            now: Optional monotonic timestamp (defaults to time.monotonic())
+            
+        Returns:
+            True if a frame was published
+        """
+        if now is None:
+            now = time.monotonic()
+        if self._last_publish is not None and now - self._last_publish < self.min_interval:
+            return False
+        
+        back = self._back
+        back.clear()
+        q = self.quantum
+        for agent in world.agents:
+            if agent.alive:
+                back[agent.id] = (
+                    agent.code,
+                    int(round(agent.pos.x / q)),
+                    int(round(agent.pos.y / q))
+                )
+        
+        front = self._front
+        spawned, moved, died = [], [], []
+        for agent_id, state in back.items():
+            previous = front.get(agent_id)
+            if previous is None:
+                spawned.append([agent_id, state[0], state[1], state[2]])
+            elif previous[1] != state[1] or previous[2] != state[2]:
+                moved.append([agent_id, state[1] - previous[1], state[2] - previous[2]])
+        for agent_id in front:
+            if agent_id not in back:
+                died.append(agent_id)
+        
+        needs_keyframe = self._keyframe is None or len(self._deltas) >= self.keyframe_interval
+        if not (spawned or moved or died or needs_keyframe):
+            return False
+        
+        self._front, self._back = back, front
+        self._last_publish = now
+        
+        seq = self._seq + 1
+        delta = _sse({
+            'type': 'delta', 'seq': seq, 'tick': world.tick,
+            'spawned': spawned, 'moved': moved, 'died': died
+        })
+        keyframe = None
+        if needs_keyframe:
+            keyframe = _sse({
+                'type': 'key', 'seq': seq, 'tick': world.tick,
+                'kinds': KINDS, 'quantum': q,
+                'agents': [[agent_id, *state] for agent_id, state in back.items()]
+            })
+        
+        with self._condition:
+            self._seq = seq
+            if keyframe is not None:
+                self._keyframe = (seq, keyframe)
+                self._key_delta = delta
+                self._deltas.clear()
+            else:
+                self._deltas.append((seq, delta))
+            self._condition.notify_all()
+        return True
+    
+    def close(self):
+        """Stop all subscribers."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+    
+    def subscribe(self, keepalive: float = 15.0) -> Iterator[bytes]:
+        """Yield encoded frames for one subscriber.
+        
+        Starts with the latest keyframe, then follows with deltas. A
+        subscriber that misses a keyframe resynchronizes from it.
+        
+        Args:
+            keepalive: Seconds without frames before a keepalive comment
+            
+        Yields:
+            Server-Sent Events messages
+        """
+        last_seq = None
+        while True:
+            with self._condition:
+                if not self._condition.wait_for(
+                    lambda: self._closed or (self._keyframe is not None and self._seq != last_seq),
+                    timeout=keepalive
+                ):
+                    frames = [b": keepalive\n\n"]
+                elif self._closed:
+                    return
+                else:
+                    frames = self._frames_after(last_seq)
+                    last_seq = self._seq
+            for frame in frames:
+                yield frame
+    
+    def _frames_after(self, last_seq: Optional[int]) -> List[bytes]:
+        """Frames a subscriber needs to catch up from ``last_seq`` (lock held)."""
+        key_seq, keyframe = self._keyframe
+        if last_seq is not None and last_seq >= key_seq:
+            return [frame for seq, frame in self._deltas if seq > last_seq]
+        if last_seq is not None and last_seq == key_seq - 1:
+            # Caught-up subscribers skip the keyframe
+            return [self._key_delta] + [frame for _, frame in self._deltas]
+        return [keyframe] + [frame for _, frame in self._deltas]
+
+
+def apply_frame(state: Dict[int, List[int]], frame: dict) -> Dict[int, List[int]]:
+    """Apply a decoded frame to a client-side state (reference decoder).
+    
+    Args:
+        state: Mapping of agent id to [kind_code, x, y]
+        frame: Decoded frame payload
+        
+    Returns:
+        Updated state
+    """
+    if frame['type'] == 'key':
+        return {agent[0]: list(agent[1:]) for agent in frame['agents']}
+    for agent_id, kind_code, x, y in frame['spawned']:
+        state[agent_id] = [kind_code, x, y]
+    for agent_id, dx, dy in frame['moved']:
+        state[agent_id][1] += dx
+        state[agent_id][2] += dy
+    for agent_id in frame['died']:
+        state.pop(agent_id, None)
+    return state
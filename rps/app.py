@@ -1,29 +1,50 @@
 """Main application entry point."""
 
+import os
 import pygame
 import sys
 import threading
-from .core.config import Config
+import time
+from .core.config import Config, KINDS
 from .core.world import World
 from .core.language import Language
+from .ui.camera import Camera
+from .ui.capture import FrameRecorder
+from .ui.dirty_rects import DirtyRectRenderer
 from .ui.hud import HUD
 from .ui.victory_screen import VictoryScreen
+from .analysis.heatmap import KillHeatmap
 from .analysis.logger import AnalysisLogger
+from .analysis.timeseries import PopulationSeries
+from .analysis.metrics import SimulationMetrics
 from .api.spawn_queue import SpawnQueue
+from .api.world_stream import WorldStream
+from .api.admission import AdmissionController
 
 
 class RPSApp:
     """Main application class for RPS World."""
     
-    def __init__(self, config: Config = None, api_enabled: bool = False):
+    # Camera controls
+    PAN_SPEED = 600  # Screen pixels per second
+    ZOOM_STEP = 1.1  # Zoom factor per wheel notch or +/- press
+    
+    # Longest idle wait while paused or game over (bounds API spawn latency)
+    IDLE_WAIT_MS = 250
+    
+    def __init__(self, config: Config = None, api_enabled: bool = False, api_process: bool = False):
         """Initialize the application.
         
         Args:
             config: Optional game configuration
             api_enabled: Enable API server for external spawning
+            api_process: Run the API server in a separate process
+                (spawns and status cross a pipe; no /api/stream or /metrics)
         """
         self.config = config or Config()
-        self.api_enabled = api_enabled
+        self.api_enabled = api_enabled or api_process
+        self.api_process = api_process
+        in_process_api = self.api_enabled and not api_process
         
         # Initialize Pygame
         pygame.init()
@@ -35,20 +56,54 @@ class RPSApp:
         self.clock = pygame.time.Clock()
         
         # Initialize components
-        self.logger = AnalysisLogger() if self.config.log_events else None
+        self.heatmap = KillHeatmap(
+            self.config.world_size, self.config.heatmap_cell_size
+        ) if self.config.log_events and self.config.heatmap_cell_size > 0 else None
+        self.heatmap_layer = None  # Overlay shown: None, 'kills' or 'occupancy'
+        self.logger = AnalysisLogger(self.heatmap) if self.config.log_events else None
+        self.history = PopulationSeries(
+            KINDS, self.config.history_capacity
+        ) if self.config.history_capacity > 0 else None
+        self.metrics = SimulationMetrics() if in_process_api else None
         self.language = Language(self.config.language)
-        self.world = World(self.config, self.logger)
+        self.world = World(self.config, self.logger, self.metrics)
         self.hud = HUD(self.config, self.language)
         self.victory_screen = VictoryScreen(self.language)
+        self.camera = Camera(
+            (self.config.screen_width, self.config.screen_height),
+            self.config.world_size
+        )
+        self.renderer = DirtyRectRenderer(
+            self.screen,
+            self.config.background_color,
+            self.config.dirty_rect_threshold
+        ) if self.config.dirty_rects else None
         
         # API spawn queue
-        self.spawn_queue = SpawnQueue() if api_enabled else None
+        self.spawn_queue = SpawnQueue() if in_process_api else None
+        self.world_stream = WorldStream(
+            rate=self.config.stream_rate,
+            quantum=self.config.stream_quantum
+        ) if in_process_api else None
+        self.admission = AdmissionController(
+            max_population=self.config.max_population,
+            rate=self.config.api_rate_limit,
+            burst=self.config.api_rate_burst
+        ) if in_process_api else None
         self.api_thread = None
+        self.api_bridge = None
+        
+        if self.metrics:
+            self.metrics.bind(self.world, self.spawn_queue, self.logger)
         
         # App state
         self.running = True
         self.message = None
         self.message_timer = 0
+        self._redraw = True  # Whether the next frame must be drawn even if idle
+        self._occupancy_tick = None
+        self._history_kills = 0  # Resolver kill count at the last history sample
+        self.recorder = None
         
         print(f"RPS World initialized with seed: {self.config.seed}")
         
@@ -61,12 +116,23 @@ class RPSApp:
         mouse_pos = pygame.mouse.get_pos()
         
         for event in pygame.event.get():
+            if event.type != pygame.MOUSEMOTION:
+                self._redraw = True
+            
             if event.type == pygame.QUIT:
                 self.running = False
             
             elif event.type == pygame.KEYDOWN:
                 self._handle_keydown(event, mouse_pos)
             
+            elif event.type == pygame.MOUSEWHEEL:
+                self.camera.zoom_at(self.ZOOM_STEP ** event.y, mouse_pos)
+            
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # The window system may have discarded what is on screen
+                if self.renderer:
+                    self.renderer.invalidate()
+            
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     self._handle_mouse_click(mouse_pos)
@@ -119,31 +185,60 @@ class RPSApp:
             new_seed = int(time.time() * 1000) % 1000000
             self.config.seed = new_seed
             self.world.reset()
+            if self.history is not None:
+                self.history.clear()
             
             # Auto-spawn balanced population
             self.world.spawn_batch()
             
             self.show_message(f"{self.language.get('new_seed_msg')}: {new_seed} - {self.language.get('spawned_balanced')}")
         
+        elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+            self.camera.zoom_at(self.ZOOM_STEP, mouse_pos)
+        
+        elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.camera.zoom_at(1 / self.ZOOM_STEP, mouse_pos)
+        
+        elif event.key == pygame.K_HOME:
+            self.camera.fit()
+        
+        elif event.key == pygame.K_m:
+            self._cycle_heatmap()
+        
+        elif event.key == pygame.K_g:
+            self.config.show_history = not self.config.show_history
+            status = self.language.get('graph_on') if self.config.show_history else self.language.get('graph_off')
+            self.show_message(status)
+        
+        elif event.key == pygame.K_F10:
+            self.toggle_recording()
+        
         elif event.key == pygame.K_F9:
             if self.logger:
                 spawn_file, collision_file = self.logger.export_csv()
                 print(f"Exported to:\n  {spawn_file}\n  {collision_file}")
+                if self.heatmap:
+                    print(f"  {self.heatmap.export()}")
+                if self.history is not None:
+                    # Same directory and timestamp as the event logs
+                    directory, name = os.path.split(spawn_file)
+                    population_file = os.path.join(directory, name.replace('spawns_', 'population_', 1))
+                    print(f"  {self.history.export_csv(population_file)}")
                 self.show_message(self.language.get('exported'))
             else:
                 self.show_message("Logging disabled")
         
         # Spawn at mouse position
         elif event.key == pygame.K_r:
-            self.world.spawn('rock', mouse_pos)
+            self.world.spawn('rock', self.camera.screen_to_world(*mouse_pos))
             self.show_message(f"{self.language.get('spawned')} {self.language.get('rock')}")
         
         elif event.key == pygame.K_p:
-            self.world.spawn('paper', mouse_pos)
+            self.world.spawn('paper', self.camera.screen_to_world(*mouse_pos))
             self.show_message(f"{self.language.get('spawned')} {self.language.get('paper')}")
         
         elif event.key == pygame.K_s:
-            self.world.spawn('scissors', mouse_pos)
+            self.world.spawn('scissors', self.camera.screen_to_world(*mouse_pos))
             self.show_message(f"{self.language.get('spawned')} {self.language.get('scissors')}")
         
         # Batch spawn
@@ -172,6 +267,39 @@ class RPSApp:
             
             self.show_message(f"{self.language.get('random_spawn_msg')}: {r} {self.language.get('rocks')}, {p} {self.language.get('papers')}, {s} {self.language.get('scissors')}")
     
+    def _cycle_heatmap(self):
+        """Switch the heatmap overlay: off -> kills -> occupancy (if sampled) -> off."""
+        if not self.heatmap:
+            self.show_message("Logging disabled")
+            return
+        layers = [None, 'kills']
+        if self.config.heatmap_occupancy_ticks > 0:
+            layers.append('occupancy')
+        self.heatmap_layer = layers[(layers.index(self.heatmap_layer) + 1) % len(layers)]
+        self.show_message(self.language.get(f'heatmap_{self.heatmap_layer or "off"}'))
+    
+    def toggle_recording(self):
+        """Start or stop capturing frames."""
+        if self.recorder is None:
+            self.recorder = FrameRecorder(
+                self.screen.get_size(),
+                directory=self.config.capture_dir,
+                fmt=self.config.capture_format,
+                slots=self.config.capture_slots,
+                fps=self.config.fps
+            )
+            print(f"Recording to {self.recorder.directory}")
+            self.show_message(self.language.get('recording'))
+        else:
+            directory = self.recorder.directory
+            captured, dropped = self.recorder.close()
+            self.recorder = None
+            print(f"Recorded {captured} frames ({dropped} dropped) to {directory}")
+            self.show_message(
+                f"{self.language.get('recorded')} {captured} {self.language.get('frames')}, "
+                f"{dropped} {self.language.get('dropped')}"
+            )
+    
     def _handle_mouse_click(self, pos):
         """Handle mouse click events.
         
@@ -190,6 +318,7 @@ class RPSApp:
         """
         self.message = text
         self.message_timer = duration
+        self._redraw = True
     
     def update(self, dt: float):
         """Update game state.
@@ -199,29 +328,90 @@ class RPSApp:
         """
         # Process API spawn requests
         if self.spawn_queue:
-            self._process_api_spawns()
-        
+            start = time.perf_counter()
+            self._process_api_spawns(self.spawn_queue.get_all())
+            if self.metrics:
+                self.metrics.observe_phase('api_spawns', time.perf_counter() - start)
+        elif self.api_bridge:
+            self._process_api_spawns(self.api_bridge.receive())
+        
+        tick = self.world.tick
         self.world.update(dt)
         
+        # Record population history once per simulated tick
+        if self.history is not None and self.world.tick != tick:
+            kills = self.world.collision_resolver.kills
+            self.history.record(tick, self.world.get_counts(), kills - self._history_kills)
+            self._history_kills = kills
+        
+        # Sample agent positions for the occupancy heatmap
+        interval = self.config.heatmap_occupancy_ticks
+        if self.heatmap and interval > 0 and self.world.tick % interval == 0 \
+                and self.world.tick != self._occupancy_tick:
+            self._occupancy_tick = self.world.tick
+            self.heatmap.record_occupancy(self.world.agents)
+        
+        # Publish a snapshot for /api/stream subscribers
+        if self.world_stream:
+            self.world_stream.publish(self.world)
+        
+        # Publish population for spawn admission control
+        if self.admission:
+            self.admission.publish(self.world.get_total_count(), self.config.max_population)
+        elif self.api_bridge:
+            self.api_bridge.send_status(self.world.get_total_count(), self.config.max_population)
+        
+        self._pan_camera(dt)
+        
         # Update message timer
         if self.message_timer > 0:
             self.message_timer -= dt
             if self.message_timer <= 0:
                 self.message = None
+                self._redraw = True
+    
+    def _pan_camera(self, dt: float):
+        """Pan the camera while arrow keys are held.
+        
+        Args:
+            dt: Time delta in seconds
+        """
+        dx, dy = self._pan_direction()
+        if dx or dy:
+            step = self.PAN_SPEED * dt
+            self.camera.pan(dx * step, dy * step)
+            self._redraw = True
+    
+    def _pan_direction(self):
+        """Camera pan direction from the arrow keys held down.
+        
+        Returns:
+            (dx, dy), each -1, 0 or 1
+        """
+        keys = pygame.key.get_pressed()
+        return keys[pygame.K_RIGHT] - keys[pygame.K_LEFT], keys[pygame.K_DOWN] - keys[pygame.K_UP]
     
     def draw(self):
         """Draw the game."""
-        # Clear screen
-        self.screen.fill(self.config.background_color)
+        # Clear screen (only last frame's regions with dirty rectangles)
+        if self.renderer:
+            self.renderer.begin()
+        else:
+            self.screen.fill(self.config.background_color)
         
         # Draw world
-        self.world.draw(self.screen)
+        drawn = self.world.draw(self.screen, self.camera)
+        
+        # Heatmap overlay
+        if self.heatmap_layer:
+            colors = {kind: getattr(self.config, f'color_{kind}') for kind in self.heatmap.kinds}
+            drawn += self.heatmap.draw(self.screen, colors, self.heatmap_layer, self.camera)
         
         # Draw HUD
         fps = self.clock.get_fps()
         total_collisions = len(self.logger.collision_events) if self.logger else 0
         
-        self.hud.draw(
+        drawn += self.hud.draw(
             self.screen,
             self.world.get_counts(),
             total_collisions,
@@ -232,25 +422,58 @@ class RPSApp:
             self.world.tick
         )
         
+        if self.history is not None and self.config.show_history:
+            drawn += self.hud.draw_history(self.screen, self.history)
+        
         # Draw victory screen if game over
         if self.world.game_over:
             scoreboard = self.world.get_scoreboard()
-            self.victory_screen.draw(self.screen, self.world.winner_kind, scoreboard)
+            drawn += self.victory_screen.draw(self.screen, self.world.winner_kind, scoreboard)
         
         # Draw message if active
         if self.message and not self.world.game_over:
-            self.hud.draw_message(self.screen, self.message)
+            drawn += self.hud.draw_message(self.screen, self.message)
+        
+        # Capture the finished frame (without the indicator), then mark it
+        if self.recorder:
+            self.recorder.capture(self.screen)
+            drawn += self.hud.draw_recording(self.screen, self.recorder.captured, self.recorder.dropped)
         
         # Update display
-        pygame.display.flip()
+        if self.renderer:
+            self.renderer.present(drawn)
+        else:
+            pygame.display.flip()
     
     def _start_api_server(self):
-        """Start the API server in a separate thread."""
+        """Start the API server in a separate thread or process."""
+        if self.api_process:
+            from .api.process_bridge import ApiProcessBridge
+            
+            self.api_bridge = ApiProcessBridge(self.config, host='127.0.0.1', port=5000)
+            try:
+                self.api_bridge.start()
+            except RuntimeError as e:
+                print(f"Warning: {e}. API server disabled.")
+                self.api_enabled = False
+                self.api_bridge = None
+                return
+            
+            print("API server process started on http://127.0.0.1:5000")
+            print("Spawn endpoint: POST http://127.0.0.1:5000/api/spawn")
+            self.show_message("API server started on port 5000")
+            return
+        
         try:
             import api_server
+            from .api.spawn_api import SpawnAPI
             
             # Set the spawn queue in the API server
             api_server.set_spawn_queue(self.spawn_queue)
+            api_server.set_world_stream(self.world_stream)
+            api_server.set_metrics(self.metrics)
+            api_server.set_admission(self.admission)
+            api_server.set_spawn_api(SpawnAPI(*self.config.world_size, margin=50))
             
             # Start server in background thread
             self.api_thread = threading.Thread(
@@ -269,11 +492,19 @@ class RPSApp:
             print("Install with: pip install -r requirements_api.txt")
             self.api_enabled = False
             self.spawn_queue = None
+            self.world_stream = None
+            self.metrics = None
+            self.world.metrics = None
+            self.admission = None
     
-    def _process_api_spawns(self):
-        """Process pending spawn requests from the API."""
-        requests = self.spawn_queue.get_all()
+    def _process_api_spawns(self, requests):
+        """Process pending spawn requests from the API.
         
+        Args:
+            requests: Spawn requests received this frame
+        """
+        if requests:
+            self._redraw = True
         for spawn_request in requests:
             # Spawn the agent
             agent = self.world.spawn(
@@ -289,20 +520,58 @@ class RPSApp:
                 # The API will handle this on next request
                 pass
     
+    def _is_idle(self) -> bool:
+        """Whether the simulation is frozen (paused or on the victory screen)."""
+        return self.world.paused or self.world.game_over
+    
+    def _wait_for_activity(self):
+        """Block until an event arrives, a message expires or API spawns may be pending."""
+        timeout = self.IDLE_WAIT_MS
+        if self.message_timer > 0:
+            timeout = min(timeout, int(self.message_timer * 1000) + 1)
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            # Leave it for handle_events
+            pygame.event.post(event)
+        # Restart frame timing so the wait is not counted as the next timestep
+        self.clock.tick()
+    
     def run(self):
         """Main game loop."""
         while self.running:
+            # Nothing moves while idle: sleep instead of redrawing the same frame
+            # (held arrow keys send no events, so keep polling while panning)
+            if self._is_idle() and not self._redraw and self._pan_direction() == (0, 0):
+                self._wait_for_activity()
+            
             # Handle events
             self.handle_events()
             
             # Update
             dt = self.clock.tick(self.config.fps) / 1000.0
+            start = time.perf_counter()
+            was_idle = self._is_idle()
             self.update(dt)
             
+            # Skip idle frames where nothing visible changed
+            if was_idle and self._is_idle() and not self._redraw:
+                continue
+            
             # Draw
+            drawn = time.perf_counter()
             self.draw()
+            self._redraw = False
+            
+            if self.metrics:
+                end = time.perf_counter()
+                self.metrics.observe_phase('draw', end - drawn)
+                self.metrics.observe_phase('frame', end - start)
         
         # Cleanup
+        if self.recorder:
+            self.toggle_recording()
+        if self.api_bridge:
+            self.api_bridge.stop()
         pygame.quit()
         sys.exit(0)
 
@@ -316,9 +585,20 @@ def main():
     parser.add_argument('--seed', type=int, help='Random seed')
     parser.add_argument('--width', type=int, default=1200, help='Screen width')
     parser.add_argument('--height', type=int, default=800, help='Screen height')
+    parser.add_argument('--world-width', type=int, default=0,
+                        help='Arena width (default: screen width)')
+    parser.add_argument('--world-height', type=int, default=0,
+                        help='Arena height (default: screen height)')
     parser.add_argument('--fps', type=int, default=60, help='Target FPS')
     parser.add_argument('--no-log', action='store_true', help='Disable event logging')
+    parser.add_argument('--record', action='store_true', help='Start recording frames (F10 toggles)')
+    parser.add_argument('--record-format', choices=['png', 'raw'], default='png',
+                        help='PNG sequence or raw rgb24 stream')
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help='Present only changed screen regions (faster on software renderers)')
     parser.add_argument('--api-enabled', action='store_true', help='Enable API server for external spawning')
+    parser.add_argument('--api-process', action='store_true',
+                        help='Run the API server in a separate process (implies --api-enabled)')
     
     args = parser.parse_args()
     
@@ -326,13 +606,19 @@ def main():
     config = Config(
         screen_width=args.width,
         screen_height=args.height,
+        world_width=args.world_width,
+        world_height=args.world_height,
         fps=args.fps,
         seed=args.seed,
-        log_events=not args.no_log
+        log_events=not args.no_log,
+        dirty_rects=args.dirty_rects,
+        capture_format=args.record_format
     )
     
     # Create and run app
-    app = RPSApp(config, api_enabled=args.api_enabled)
+    app = RPSApp(config, api_enabled=args.api_enabled, api_process=args.api_process)
+    if args.record:
+        app.toggle_recording()
     app.run()
 
 
@@ -1,10 +1,30 @@
 """Agent base class and Rock/Paper/Scissors implementations."""
 
-import pygame
 import random
 import math
 from typing import Tuple, Optional, List
-from .config import Config, BEATS
+from .config import Config, KIND_CODES, PAYOFF, PREY_CODES
+from .vector import Vector2
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(x: int) -> int:
+    """SplitMix64 finalizer: scramble a 64-bit integer."""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def _hashed_uniform(seed: int, serial: int, tick: int) -> float:
+    """Uniform float in [0, 1) determined by (seed, serial, tick) alone.
+    
+    Unlike a shared random stream, the value does not depend on how many
+    draws other agents made first, so it is independent of update order.
+    """
+    x = _mix64((seed * 0x9E3779B97F4A7C15 + serial) & _MASK64)
+    x = _mix64((x + tick * 0xD1B54A32D192ED03) & _MASK64)
+    return (x >> 11) * (1.0 / (1 << 53))
 
 
 class Agent:
@@ -34,13 +54,21 @@ class Agent:
             config: Game configuration
             rng: Random number generator
             name: Agent name (optional)
+            
+        Raises:
+            ValueError: If kind is not one of KINDS
         """
         self.id = Agent._id_counter
         Agent._id_counter += 1
+        self.serial = self.id  # Per-world creation number (set by AgentFactory); keys wander draws
         
         self.kind = kind
+        try:
+            self.code = KIND_CODES[kind]  # Small integer used by the hot paths
+        except KeyError:
+            raise ValueError(f"Unknown agent kind: {kind}") from None
         self.name = name or f"{kind.capitalize()}-{self.id}"
-        self.pos = pygame.Vector2(pos)
+        self.pos = Vector2(pos)
         self.radius = radius
         self.color = color
         self.config = config
@@ -54,67 +82,53 @@ class Agent:
             # Random direction and speed based on kind
             angle = rng.uniform(0, 2 * math.pi)
             speed = self._get_random_speed()
-            self.vel = pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
+            self.vel = Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
             self.max_speed = speed
         else:
-            self.vel = pygame.Vector2(vel)
+            self.vel = Vector2(vel)
             # Calculate max speed from provided velocity
-            self.max_speed = self.vel.length() if self.vel.length() > 0 else self._get_random_speed()
+            speed = self.vel.length()
+            self.max_speed = speed if speed > 0 else self._get_random_speed()
         
         self.alive = True
         self.last_collision_tick = -10**9
         
         # Steering behavior properties
         self.max_force = self.max_speed * 0.1  # Steering force
-        self.detection_range = float('inf')  # Global search - no range limit
+        if config.limited_vision:
+            self.detection_range = config.agent_detection_range
+        else:
+            self.detection_range = float('inf')  # Global search - no range limit
         self.target = None  # Current target agent
-        
-        # Create sprite surface
-        self.sprite = self._create_sprite()
-        self.rect = self.sprite.get_rect(center=self.pos)
+        self.wander_angle = 0.0  # Wander heading offset (limited vision)
     
     def _get_random_speed(self) -> float:
         """Get random speed based on agent kind."""
-        if self.kind == 'rock':
-            return self.rng.uniform(*self.config.agent_speed_rock)
-        elif self.kind == 'paper':
-            return self.rng.uniform(*self.config.agent_speed_paper)
-        else:  # scissors
-            return self.rng.uniform(*self.config.agent_speed_scissors)
-    
-    def _create_sprite(self) -> pygame.Surface:
-        """Create a sprite for the agent."""
-        # Import here to avoid circular dependency
-        from ..assets.sprites import create_rock_sprite, create_paper_sprite, create_scissors_sprite
-        
-        if self.kind == 'rock':
-            return create_rock_sprite(self.radius, self.color)
-        elif self.kind == 'paper':
-            return create_paper_sprite(self.radius, self.color)
-        elif self.kind == 'scissors':
-            return create_scissors_sprite(self.radius, self.color)
-        else:
-            # Fallback to simple circle
-            size = self.radius * 2
-            surface = pygame.Surface((size, size), pygame.SRCALPHA)
-            pygame.draw.circle(surface, self.color, (self.radius, self.radius), self.radius)
-            border_color = tuple(max(0, c - 40) for c in self.color)
-            pygame.draw.circle(surface, border_color, (self.radius, self.radius), self.radius, 2)
-            return surface
+        return self.rng.uniform(*self.config.kind_table.speed[self.code])
     
-    def update(self, dt: float, nearby_agents: Optional[List['Agent']] = None):
+    def update(
+        self,
+        dt: float,
+        nearby_agents: Optional[List['Agent']] = None,
+        tick: int = 0,
+        grid=None,
+        prey_index=None
+    ):
         """Update agent position and handle boundaries.
         
         Args:
             dt: Time delta in seconds
             nearby_agents: Optional list of nearby agents for steering behavior
+            tick: Current game tick (schedules target re-acquisition)
+            grid: Optional SpatialGrid for local prey checks
+            prey_index: Optional PreyQuadtree for the full prey search
         """
         if not self.alive:
             return
         
         # Apply steering behavior if enabled and agents provided
         if self.config.enable_steering and nearby_agents:
-            self._apply_steering(nearby_agents, dt)
+            self._apply_steering(nearby_agents, dt, tick, grid, prey_index)
         
         # Limit velocity to max speed
         if self.vel.length() > self.max_speed:
@@ -128,46 +142,82 @@ class Agent:
             self._wrap_boundaries()
         else:  # bounce
             self._bounce_boundaries()
+    
+    def plan(
+        self,
+        dt: float,
+        nearby_agents: Optional[List['Agent']] = None,
+        tick: int = 0,
+        grid=None,
+        prey_index=None
+    ):
+        """Compute this tick's movement into a back buffer.
+        
+        Runs ``update`` on a private copy of the position and velocity and
+        stores the result in ``next_pos``/``next_vel``; other agents keep
+        seeing the current state until ``commit``.
         
-        # Update rect for drawing
-        self.rect.center = (int(self.pos.x), int(self.pos.y))
+        Args:
+            dt: Time delta in seconds
+            nearby_agents: Optional list of nearby agents for steering behavior
+            tick: Current game tick
+            grid: Optional SpatialGrid for local prey checks
+            prey_index: Optional PreyQuadtree for the full prey search
+        """
+        front_pos, front_vel = self.pos, self.vel
+        self.pos, self.vel = front_pos.copy(), front_vel.copy()
+        try:
+            self.update(dt, nearby_agents, tick, grid, prey_index)
+        finally:
+            self.next_pos, self.next_vel = self.pos, self.vel
+            self.pos, self.vel = front_pos, front_vel
+    
+    def commit(self):
+        """Make the state computed by ``plan`` current."""
+        self.pos, self.vel = self.next_pos, self.next_vel
     
     def _wrap_boundaries(self):
-        """Wrap position around screen boundaries."""
+        """Wrap position around the arena boundaries."""
+        width, height = self.config.world_size
         if self.pos.x < 0:
-            self.pos.x += self.config.screen_width
-        elif self.pos.x >= self.config.screen_width:
-            self.pos.x -= self.config.screen_width
+            self.pos.x += width
+        elif self.pos.x >= width:
+            self.pos.x -= width
         
         if self.pos.y < 0:
-            self.pos.y += self.config.screen_height
-        elif self.pos.y >= self.config.screen_height:
-            self.pos.y -= self.config.screen_height
+            self.pos.y += height
+        elif self.pos.y >= height:
+            self.pos.y -= height
     
     def _bounce_boundaries(self):
-        """Bounce off screen boundaries."""
+        """Bounce off the arena boundaries."""
+        width, height = self.config.world_size
         if self.pos.x - self.radius < 0:
             self.pos.x = self.radius
             self.vel.x = abs(self.vel.x)
-        elif self.pos.x + self.radius >= self.config.screen_width:
-            self.pos.x = self.config.screen_width - self.radius
+        elif self.pos.x + self.radius >= width:
+            self.pos.x = width - self.radius
             self.vel.x = -abs(self.vel.x)
         
         if self.pos.y - self.radius < 0:
             self.pos.y = self.radius
             self.vel.y = abs(self.vel.y)
-        elif self.pos.y + self.radius >= self.config.screen_height:
-            self.pos.y = self.config.screen_height - self.radius
+        elif self.pos.y + self.radius >= height:
+            self.pos.y = height - self.radius
             self.vel.y = -abs(self.vel.y)
     
-    def draw(self, surface: pygame.Surface):
-        """Draw the agent on the surface.
+    def draw(self, surface):
+        """Draw the agent on the surface (see rps.ui.render.draw_agent).
         
         Args:
             surface: Pygame surface to draw on
+            
+        Returns:
+            Screen rectangle drawn, or None if the agent is dead
         """
-        if self.alive:
-            surface.blit(self.sprite, self.rect)
+        # Imported here so the simulation runs without pygame
+        from ..ui.render import draw_agent
+        return draw_agent(surface, self)
     
     def collides_with(self, other: 'Agent') -> bool:
         """Check if this agent collides with another.
@@ -182,7 +232,10 @@ class Agent:
             return False
         
         r = self.radius + other.radius
-        return self.pos.distance_squared_to(other.pos) <= r * r
+        pos, other_pos = self.pos, other.pos
+        dx = other_pos.x - pos.x
+        dy = other_pos.y - pos.y
+        return dx * dx + dy * dy <= r * r
     
     def compare(self, other: 'Agent') -> int:
         """Compare this agent with another using R-P-S rules.
@@ -193,9 +246,7 @@ class Agent:
         Returns:
             1 if this agent wins, -1 if loses, 0 if tie
         """
-        if self.kind == other.kind:
-            return 0
-        return 1 if BEATS[self.kind] == other.kind else -1
+        return PAYOFF[self.code][other.code]
     
     def kill(self):
         """Mark this agent as dead."""
@@ -211,7 +262,7 @@ class Agent:
         if self.pos.distance_squared_to(other.pos) < 0.01:
             # Too close, random bounce
             angle = self.rng.uniform(0, 2 * math.pi)
-            normal = pygame.Vector2(math.cos(angle), math.sin(angle))
+            normal = Vector2(math.cos(angle), math.sin(angle))
         else:
             normal = (self.pos - other.pos).normalize()
         
@@ -220,36 +271,34 @@ class Agent:
         if dot < 0:  # Moving towards each other
             self.vel -= 2 * dot * normal
     
-    def _apply_steering(self, nearby_agents: List['Agent'], dt: float):
+    def _apply_steering(self, nearby_agents: List['Agent'], dt: float, tick: int = 0, grid=None,
+                        prey_index=None):
         """Apply steering behavior to hunt prey (global search, no flee behavior).
         
         Args:
             nearby_agents: All agents in the world
             dt: Time delta in seconds
+            tick: Current game tick
+            grid: Optional SpatialGrid for local prey checks
+            prey_index: Optional PreyQuadtree for the full prey search
         """
-        # Find prey (agents this one beats) - GLOBAL SEARCH
-        prey = []
+        nearest_prey = self._select_target(nearby_agents, tick, grid, prey_index)
         
-        for other in nearby_agents:
-            if not other.alive or other.id == self.id:
-                continue
-            
-            comparison = self.compare(other)
-            if comparison > 0:  # This agent beats other
-                distance = self.pos.distance_to(other.pos)
-                prey.append((other, distance))
+        # Nothing in sight: roam until prey comes into range
+        if nearest_prey is None and self.config.limited_vision:
+            self.target = None
+            self._wander(dt, tick)
+            return
         
         # If no prey exists anywhere in the world, STOP and accept defeat
-        if not prey:
+        if nearest_prey is None:
             # Gradually slow down to a stop
             self.vel *= 0.95  # Damping factor
             if self.vel.length() < 1.0:  # Stop completely when very slow
-                self.vel = pygame.Vector2(0, 0)
+                self.vel = Vector2(0, 0)
             return
         
         # Seek nearest prey (NO FLEE BEHAVIOR - prey is clueless)
-        prey.sort(key=lambda x: x[1])
-        nearest_prey = prey[0][0]
         self.target = nearest_prey
         seek_force = self._seek(nearest_prey.pos)
         
@@ -259,6 +308,75 @@ class Agent:
                 seek_force.scale_to_length(self.max_force)
             self.vel += seek_force
     
+    def _select_target(self, nearby_agents: List['Agent'], tick: int, grid=None,
+                       prey_index=None) -> Optional['Agent']:
+        """Choose the prey to chase this tick.
+        
+        With ``config.target_reacquire_ticks`` K > 1 the current target is
+        kept while it lives; the full search runs only every K ticks
+        (staggered by agent id), when the target dies, or when a prey
+        inside ``target_alert_radius`` is much closer than the target.
+        
+        With ``config.limited_vision`` only prey within the detection range
+        is considered, found by a range query on the grid (or the quadtree)
+        so the cost depends on local density instead of population.
+        
+        Args:
+            nearby_agents: All agents in the world
+            tick: Current game tick
+            grid: Optional SpatialGrid for the alert-radius check
+            prey_index: Optional PreyQuadtree answering the full search
+            
+        Returns:
+            Prey agent, or None if there is no prey
+        """
+        interval = self.config.target_reacquire_ticks
+        target = self.target
+        vision_sq = self.detection_range ** 2
+        if (interval > 1 and target is not None and target.alive
+                and (tick + self.id) % interval != 0
+                and self.pos.distance_squared_to(target.pos) <= vision_sq):
+            if grid is not None:
+                limit = self.pos.distance_squared_to(target.pos) * self.config.target_switch_ratio ** 2
+                radius = self.config.target_alert_radius
+                limit = min(limit, radius * radius)
+                closer = self._nearest_prey(grid.query(self.pos.x, self.pos.y, radius), limit)
+                if closer is not None:
+                    return closer
+            return target
+        
+        # Find prey (agents this one beats) - GLOBAL SEARCH
+        if prey_index is not None:
+            return prey_index.nearest(self.pos.x, self.pos.y, PREY_CODES[self.code], self.id, vision_sq)
+        if grid is not None and self.detection_range != float('inf'):
+            candidates = grid.query(self.pos.x, self.pos.y, self.detection_range)
+            return self._nearest_prey(candidates, vision_sq)
+        return self._nearest_prey(nearby_agents, vision_sq)
+    
+    def _nearest_prey(self, candidates, limit_sq: float = float('inf')) -> Optional['Agent']:
+        """Find the nearest living prey among candidates.
+        
+        Args:
+            candidates: Agents to consider
+            limit_sq: Only consider prey closer than this squared distance
+            
+        Returns:
+            Nearest prey (first in candidate order on ties), or None
+        """
+        nearest = None
+        best = limit_sq
+        x, y = self.pos.x, self.pos.y
+        prey = PREY_CODES[self.code]
+        for other in candidates:
+            if other.code == prey and other.alive:  # Prey is never this agent
+                dx = other.pos.x - x  # Inlined distance_squared_to
+                dy = other.pos.y - y
+                distance_sq = dx * dx + dy * dy
+                if distance_sq < best:
+                    nearest = other
+                    best = distance_sq
+        return nearest
+    
     def _has_prey_in_world(self, all_agents: List['Agent']) -> bool:
         """Check if any prey exists in the entire world.
         
@@ -268,14 +386,40 @@ class Agent:
         Returns:
             True if at least one prey exists, False otherwise
         """
+        prey = PREY_CODES[self.code]
         for other in all_agents:
-            if not other.alive or other.id == self.id:
-                continue
-            if self.compare(other) > 0:  # Found prey
+            if other.code == prey and other.alive:  # Found prey
                 return True
         return False
     
-    def _seek(self, target_pos: pygame.Vector2) -> pygame.Vector2:
+    def _wander(self, dt: float, tick: int = 0):
+        """Steer along a smoothly drifting random heading.
+        
+        The heading change is hashed from the seed, this agent's serial and
+        the tick rather than drawn from the shared stream, so the result
+        does not depend on the order agents are updated in.
+        
+        Args:
+            dt: Time delta in seconds
+            tick: Current game tick
+        """
+        jitter = self.config.wander_jitter * dt
+        u = _hashed_uniform(self.config.seed, self.serial, tick)
+        self.wander_angle += jitter * (2.0 * u - 1.0)
+        if self.vel.length_squared() > 0:
+            heading = self.vel.normalize()
+        else:
+            heading = Vector2(1, 0)
+        
+        # Aim at a point on a circle ahead of the agent (Reynolds wander)
+        ahead = heading * 2 + heading.rotate_rad(self.wander_angle)
+        desired = ahead.normalize() * self.max_speed
+        steer = desired - self.vel
+        if steer.length() > self.max_force:
+            steer.scale_to_length(self.max_force)
+        self.vel += steer
+    
+    def _seek(self, target_pos: Vector2) -> Vector2:
         """Calculate steering force to seek a target position.
         
         Args:
@@ -289,9 +433,9 @@ class Agent:
             desired.scale_to_length(self.max_speed)
             steering = desired - self.vel
             return steering
-        return pygame.Vector2(0, 0)
+        return Vector2(0, 0)
     
-    def _flee(self, threat_pos: pygame.Vector2) -> pygame.Vector2:
+    def _flee(self, threat_pos: Vector2) -> Vector2:
         """Calculate steering force to flee from a threat.
         
         Args:
@@ -305,7 +449,7 @@ class Agent:
             desired.scale_to_length(self.max_speed)
             steering = desired - self.vel
             return steering
-        return pygame.Vector2(0, 0)
+        return Vector2(0, 0)
 
 
 class Rock(Agent):
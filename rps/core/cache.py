@@ -0,0 +1,150 @@
+"""Content-addressed on-disk cache of headless run results."""
+
+import dataclasses
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Optional
+from .config import Config
+from .headless import ENGINE_VERSION, RunResult
+
+
+def run_key(config: Config, count_per_kind: Optional[int] = None, dt: float = 1 / 60,
+            max_ticks: int = 100000, validate: bool = False) -> str:
+    """Stable hash of everything that determines a headless run's outcome.
+    
+    Args:
+        config: Game configuration, including the seed
+        count_per_kind: Initial agents per kind
+        dt: Fixed timestep in seconds
+        max_ticks: Tick limit
+        validate: run_headless's validate flag (changes what the result holds)
+        
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {
+        'engine': ENGINE_VERSION,
+        'config': dataclasses.asdict(config),
+        'count_per_kind': count_per_kind,
+        'dt': dt,
+        'max_ticks': max_ticks,
+        'validate': validate,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """RunResults stored as small JSON files, evicted least recently used first.
+    
+    Files live under ``directory/<first two hex digits>/<key>.json``. Each
+    read refreshes the file's modification time, so the recency order
+    survives between sessions; it is rebuilt from the file times when the
+    cache is opened. Only one process should write to a cache directory
+    at a time.
+    """
+    
+    def __init__(self, directory: str = ".rps_cache", max_bytes: int = 64 * 1024 * 1024):
+        """Open (or create) a cache directory.
+        
+        Args:
+            directory: Cache directory
+            max_bytes: Total size of stored results before the oldest are evicted
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._index: "OrderedDict[str, int]" = OrderedDict()  # key -> bytes, oldest first
+        self.size_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+        
+        entries = []
+        for shard in os.scandir(directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith('.json'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[:-5], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self.size_bytes += size
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + '.json')
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+    
+    def get(self, key: str) -> Optional[RunResult]:
+        """Look up a result, marking it as recently used.
+        
+        Args:
+            key: Key from run_key
+            
+        Returns:
+            The stored RunResult, or None
+        """
+        if key not in self._index:
+            self.misses += 1
+            return None
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                result = RunResult(**json.load(f))
+            os.utime(path)
+        except (OSError, ValueError, TypeError):
+            # Removed behind our back or unreadable: treat as a miss
+            self._forget(key)
+            self.misses += 1
+            return None
+        self._index.move_to_end(key)
+        self.hits += 1
+        return result
+    
+    def put(self, key: str, result: RunResult):
+        """Store a result, evicting the least recently used ones if over size.
+        
+        Args:
+            key: Key from run_key
+            result: Result to store
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps(dataclasses.asdict(result)).encode('utf-8')
+        temp = path + '.tmp'
+        with open(temp, 'wb') as f:
+            f.write(data)
+        os.replace(temp, path)  # Readers never see a partial file
+        
+        self._forget(key, unlink=False)
+        self._index[key] = len(data)
+        self.size_bytes += len(data)
+        while self.size_bytes > self.max_bytes and len(self._index) > 1:
+            oldest = next(iter(self._index))
+            self._forget(oldest)
+            self.evictions += 1
+    
+    def _forget(self, key: str, unlink: bool = True):
+        """Drop a key from the index (and its file)."""
+        size = self._index.pop(key, None)
+        if size is None:
+            return
+        self.size_bytes -= size
+        if unlink:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+    
+    def clear(self):
+        """Remove every stored result."""
+        for key in list(self._index):
+            self._forget(key)
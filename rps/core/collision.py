@@ -1,6 +1,7 @@
 """Collision detection and resolution."""
 
-from typing import List, Tuple, Optional
+import math
+from typing import Dict, List, Tuple, Optional
 from .agent import Agent
 
 
@@ -15,6 +16,10 @@ class CollisionResolver:
         """
         self.config = config
         self.collision_pairs = []
+        
+        # Running totals (read by metrics)
+        self.kills = 0
+        self.bounces = 0
     
     def detect_collisions(self, agents: List[Agent], tick: int) -> List[Tuple[Agent, Agent]]:
         """Detect all colliding pairs of agents.
@@ -52,11 +57,88 @@ class CollisionResolver:
         
         return pairs
     
+    def detect_collisions_swept(
+        self,
+        agents: List[Agent],
+        start_positions: Dict[int, Tuple[float, float]],
+        tick: int
+    ) -> List[Tuple[Agent, Agent]]:
+        """Detect pairs whose circles touched at any time during the step.
+        
+        Each agent is assumed to move in a straight line from its start
+        position to its current one. Pairs are found with a sweep-and-prune
+        over the swept bounding boxes, then the time of first contact is
+        solved exactly, so fast agents cannot pass through each other
+        between ticks.
+        
+        Args:
+            agents: List of active agents
+            start_positions: Agent id -> (x, y) before this step's movement
+            tick: Current game tick
+            
+        Returns:
+            Colliding pairs ordered by time of first contact (then by id)
+        """
+        cooldown = self.config.collision_cooldown_frames
+        # Half the arena: larger jumps are boundary wraps, not motion
+        max_jump = min(self.config.world_size) / 2
+        
+        entries = []
+        for agent in agents:
+            if not agent.alive or tick - agent.last_collision_tick < cooldown:
+                continue
+            ex, ey = agent.pos.x, agent.pos.y
+            sx, sy = start_positions.get(agent.id, (ex, ey))
+            if abs(ex - sx) > max_jump or abs(ey - sy) > max_jump:
+                sx, sy = ex, ey
+            r = agent.radius
+            entries.append((min(sx, ex) - r, max(sx, ex) + r, sx, sy, ex, ey, agent))
+        entries.sort(key=lambda e: e[0])
+        
+        hits = []
+        n = len(entries)
+        for i in range(n):
+            min_x_i, max_x_i, sx_i, sy_i, ex_i, ey_i, agent_i = entries[i]
+            for j in range(i + 1, n):
+                min_x_j, max_x_j, sx_j, sy_j, ex_j, ey_j, agent_j = entries[j]
+                if min_x_j > max_x_i:
+                    break
+                
+                # Relative motion d(t) = d0 + v * t for t in [0, 1]
+                d0x, d0y = sx_i - sx_j, sy_i - sy_j
+                vx = (ex_i - ex_j) - d0x
+                vy = (ey_i - ey_j) - d0y
+                r = agent_i.radius + agent_j.radius
+                
+                c = d0x * d0x + d0y * d0y - r * r
+                if c <= 0:
+                    toi = 0.0
+                else:
+                    a = vx * vx + vy * vy
+                    b = 2 * (d0x * vx + d0y * vy)
+                    if a == 0 or b >= 0:
+                        continue  # Not approaching
+                    disc = b * b - 4 * a * c
+                    if disc < 0:
+                        continue
+                    toi = (-b - math.sqrt(disc)) / (2 * a)
+                    if toi > 1:
+                        continue
+                
+                if agent_i.id < agent_j.id:
+                    hits.append((toi, agent_i.id, agent_j.id, agent_i, agent_j))
+                else:
+                    hits.append((toi, agent_j.id, agent_i.id, agent_j, agent_i))
+        
+        hits.sort(key=lambda h: h[:3])
+        return [(h[3], h[4]) for h in hits]
+    
     def resolve_collisions(
         self, 
         pairs: List[Tuple[Agent, Agent]], 
         tick: int,
-        logger=None
+        logger=None,
+        presorted: bool = False
     ) -> List[Tuple[Agent, Agent, str]]:
         """Resolve collisions between agent pairs.
         
@@ -64,14 +146,19 @@ class CollisionResolver:
             pairs: List of colliding agent pairs
             tick: Current game tick
             logger: Optional event logger
-            
+            presorted: Keep the given order (e.g. time of first contact)
+                instead of sorting by agent ids
+                
         Returns:
             List of (winner, loser, outcome_type) tuples
         """
         outcomes = []
         
         # Sort pairs for deterministic processing
-        sorted_pairs = sorted(pairs, key=lambda p: (min(p[0].id, p[1].id), max(p[0].id, p[1].id)))
+        if presorted:
+            sorted_pairs = pairs
+        else:
+            sorted_pairs = sorted(pairs, key=lambda p: (min(p[0].id, p[1].id), max(p[0].id, p[1].id)))
         
         for agent_a, agent_b in sorted_pairs:
             # Skip if either agent is already dead
@@ -89,6 +176,7 @@ class CollisionResolver:
                 # agent_a wins
                 agent_a.kills += 1  # Track kill
                 agent_b.kill()
+                self.kills += 1
                 outcomes.append((agent_a, agent_b, 'kill'))
                 
                 if logger:
@@ -106,6 +194,7 @@ class CollisionResolver:
                 # agent_b wins
                 agent_b.kills += 1  # Track kill
                 agent_a.kill()
+                self.kills += 1
                 outcomes.append((agent_b, agent_a, 'kill'))
                 
                 if logger:
@@ -125,6 +214,7 @@ class CollisionResolver:
                     agent_a.soft_bounce(agent_b)
                     agent_b.soft_bounce(agent_a)
                     outcomes.append((agent_a, agent_b, 'bounce'))
+                    self.bounces += 1
         
         return outcomes
 
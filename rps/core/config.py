@@ -5,6 +5,14 @@ from typing import Tuple
 import random
 
 
+@dataclass(frozen=True)
+class KindTable:
+    """Per-kind agent parameters indexed by kind code (position in KINDS)."""
+    radius: Tuple[int, ...]
+    speed: Tuple[Tuple[float, float], ...]  # min, max pixels/sec
+    color: Tuple[Tuple[int, int, int], ...]
+
+
 @dataclass
 class Config:
     """Configuration for the RPS simulation."""
@@ -15,6 +23,10 @@ class Config:
     fps: int = 60
     background_color: Tuple[int, int, int] = (20, 20, 30)
     
+    # Arena size (0 = same as the screen; larger worlds are viewed through a camera)
+    world_width: int = 0
+    world_height: int = 0
+    
     # Agent settings
     agent_radius_rock: int = 15
     agent_radius_paper: int = 12
@@ -33,29 +45,94 @@ class Config:
     collision_cooldown_frames: int = 8
     bounce_on_tie: bool = True
     boundary_mode: str = "bounce"  # "wrap" or "bounce" - changed to bounce
+    continuous_collisions: bool = False  # Swept-circle detection (for large timesteps)
     
     # Steering behavior
     enable_steering: bool = True
     agent_detection_range: float = 200.0
+    limited_vision: bool = False  # Only see prey within agent_detection_range (wander otherwise)
+    wander_jitter: float = 4.0  # Max wander heading change in radians per second
+    
+    # Target persistence: full nearest-prey search every K ticks (1 = every tick)
+    target_reacquire_ticks: int = 1
+    target_alert_radius: float = 60.0  # Prey this close is checked every tick
+    target_switch_ratio: float = 0.5  # Switch if it is closer than ratio * target distance
+    prey_search: str = "linear"  # Full nearest-prey search: "linear" or "quadtree"
+    
+    # Legacy update: agents steer in list order towards positions already moved this tick,
+    # and spawn one at a time from the shared random stream, reproducing old seeds
+    sequential_update: bool = False
+    
+    # Vectorized update: > 0 steers and moves all agents with NumPy on this many threads
+    update_threads: int = 0
     
     # Display options
     show_names: bool = False
     language: str = 'en'  # 'en' or 'ro'  # How far agents can detect others
     
+    # Dirty-rectangle rendering: erase, redraw and present only changed regions
+    dirty_rects: bool = False
+    dirty_rect_threshold: float = 0.5  # Full flip when the dirty area exceeds this screen fraction
+    
+    # Headless early termination: stop once the outcome is settled
+    early_termination: bool = False  # Two kinds left: the one that beats the other cannot lose
+    decided_minority: float = 0.0  # Also stop when a kind falls to this share of the living; its prey is predicted to win (0 disables)
+    
     # Spawning
     spawn_batch_size: int = 10
     max_population: int = 500
     
+    # Spawn API admission control (per client)
+    api_rate_limit: float = 10.0  # Spawn requests per second, 0 disables
+    api_rate_burst: int = 20
+    
+    # Live streaming (/api/stream)
+    stream_rate: float = 10.0  # Max frames per second
+    stream_quantum: float = 1.0  # Position quantization in pixels
+    
     # Analysis
     log_events: bool = True
+    heatmap_cell_size: int = 10  # World units per kill heatmap cell, 0 disables
+    heatmap_occupancy_ticks: int = 0  # Sample agent positions every N ticks, 0 disables
+    history_capacity: int = 512  # Population history rows per resolution tier, 0 disables
+    show_history: bool = True  # Population graph in the HUD
+    
+    # Frame capture (F10): "png" sequence or "raw" rgb24 stream, written by a separate process
+    capture_format: str = "png"
+    capture_dir: str = "captures"
+    capture_slots: int = 8  # Frames that may wait for the writer before new ones are dropped
     
     # Random seed
     seed: int = None
     
     def __post_init__(self):
-        """Initialize random seed if not provided."""
+        """Initialize random seed if not provided and build the kind table."""
         if self.seed is None:
             self.seed = random.randint(0, 999999)
+        self._build_kind_table()
+    
+    def __setattr__(self, name, value):
+        """Set a field, rebuilding kind_table when a per-kind field changes."""
+        object.__setattr__(self, name, value)
+        if name in _KIND_FIELDS and 'kind_table' in self.__dict__:
+            self._build_kind_table()
+    
+    @property
+    def world_size(self) -> Tuple[int, int]:
+        """Arena (width, height) used by the simulation."""
+        return (self.world_width or self.screen_width, self.world_height or self.screen_height)
+    
+    def _build_kind_table(self):
+        """Gather agent radius, speed range and color per kind code into kind_table.
+        
+        Kept in step with the per-kind fields by __setattr__, so hot paths
+        read one attribute instead of formatting field names.
+        """
+        self.kind_table = KindTable(
+            radius=tuple(getattr(self, f"agent_radius_{kind}") for kind in KINDS),
+            speed=tuple(tuple(getattr(self, f"agent_speed_{kind}")) for kind in KINDS),
+            color=tuple(getattr(self, f"color_{kind}") for kind in KINDS)
+        )
 
 
 # Game rules
@@ -67,3 +144,17 @@ BEATS = {
 
 KINDS = ['rock', 'paper', 'scissors']
 
+# Kinds are interned to small integer codes (positions in KINDS) for hot
+# paths; names remain the public form
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+_KIND_FIELDS = frozenset(
+    f"{prefix}_{kind}" for prefix in ('agent_radius', 'agent_speed', 'color') for kind in KINDS
+)
+PREY_CODES = [KIND_CODES[BEATS[kind]] for kind in KINDS]  # Code each kind beats
+
+# PAYOFF[a][b]: 1 if kind a beats kind b, -1 if it loses, 0 for a tie
+PAYOFF = [
+    [1 if PREY_CODES[a] == b else -1 if PREY_CODES[b] == a else 0 for b in range(len(KINDS))]
+    for a in range(len(KINDS))
+]
+
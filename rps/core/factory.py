@@ -1,9 +1,11 @@
 """Factory for creating agents with proper encapsulation."""
 
+import math
 import random
+import numpy as np
 from typing import Tuple, Optional, Dict, Type
 from .agent import Agent, Rock, Paper, Scissors
-from .config import Config, KINDS
+from .config import Config, KIND_CODES, KINDS
 from .names import NameGenerator
 
 
@@ -25,6 +27,12 @@ class AgentFactory:
         self.rng = rng
         self.name_generator = NameGenerator(config.seed)
         
+        # Vectorized generator for bulk creation
+        self.np_rng = np.random.default_rng(config.seed)
+        
+        # Agents created so far; numbers each agent's serial
+        self.created = 0
+        
         # Registry mapping kind strings to agent classes
         self._registry: Dict[str, Type[Agent]] = {
             'rock': Rock,
@@ -56,7 +64,10 @@ class AgentFactory:
         
         agent_class = self._registry[kind]
         name = self.name_generator.generate_name(kind)
-        return agent_class(pos, vel, self.config, self.rng, name)
+        agent = agent_class(pos, vel, self.config, self.rng, name)
+        agent.serial = self.created
+        self.created += 1
+        return agent
     
     def create_random_agent(
         self, 
@@ -73,7 +84,7 @@ class AgentFactory:
             New agent at random position
         """
         if bounds is None:
-            bounds = (self.config.screen_width, self.config.screen_height)
+            bounds = self.config.world_size
         
         x = self.rng.uniform(0, bounds[0])
         y = self.rng.uniform(0, bounds[1])
@@ -88,6 +99,10 @@ class AgentFactory:
     ) -> list:
         """Create multiple agents of the same type.
         
+        Positions, headings and speeds are drawn in one vectorized pass
+        from ``np_rng`` and names are allocated in bulk, so large batches
+        cost little more than the agent objects themselves.
+        
         Args:
             kind: Type of agent to create
             count: Number of agents to create
@@ -95,8 +110,39 @@ class AgentFactory:
             
         Returns:
             List of newly created agents
+            
+        Raises:
+            ValueError: If kind is not recognized
         """
-        return [self.create_random_agent(kind, bounds) for _ in range(count)]
+        if kind not in self._registry:
+            raise ValueError(f"Unknown agent kind: {kind}. Valid kinds: {list(self._registry.keys())}")
+        if count <= 0:
+            return []
+        
+        speed_range = self.config.kind_table.speed[KIND_CODES[kind]]
+        
+        if bounds is None:
+            bounds = self.config.world_size
+        
+        rng = self.np_rng
+        xs = rng.uniform(0, bounds[0], count)
+        ys = rng.uniform(0, bounds[1], count)
+        angles = rng.uniform(0, 2 * math.pi, count)
+        speeds = rng.uniform(speed_range[0], speed_range[1], count)
+        vxs = np.cos(angles) * speeds
+        vys = np.sin(angles) * speeds
+        names = self.name_generator.generate_names(kind, count)
+        
+        agent_class = self._registry[kind]
+        config, agent_rng = self.config, self.rng
+        agents = [
+            agent_class((x, y), (vx, vy), config, agent_rng, name)
+            for x, y, vx, vy, name in zip(xs.tolist(), ys.tolist(), vxs.tolist(), vys.tolist(), names)
+        ]
+        for serial, agent in enumerate(agents, self.created):
+            agent.serial = serial
+        self.created += count
+        return agents
     
     def create_balanced_population(
         self, 
@@ -120,12 +166,19 @@ class AgentFactory:
     def register_agent_type(self, kind: str, agent_class: Type[Agent]):
         """Register a new agent type with the factory.
         
-        This allows for runtime extension of available agent types.
+        This allows for runtime extension of available agent types, e.g.
+        replacing the class used for a kind. Kinds are interned to codes
+        that index the payoff matrix, so they must be one of KINDS.
         
         Args:
             kind: String identifier for the agent type
             agent_class: Agent class to register
+            
+        Raises:
+            ValueError: If kind is not one of KINDS
         """
+        if kind not in KIND_CODES:
+            raise ValueError(f"Unknown agent kind: {kind}. Valid kinds: {KINDS}")
         self._registry[kind] = agent_class
     
     def get_available_kinds(self) -> list:
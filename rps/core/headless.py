@@ -0,0 +1,115 @@
+"""Headless (no window) simulation runs."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from .config import BEATS, Config
+from .world import World
+
+# Bump whenever a change to the simulation can alter run outcomes, so
+# cached results from older engines are not reused
+ENGINE_VERSION = 2
+
+
+@dataclass
+class RunResult:
+    """Outcome of a single headless run."""
+    seed: int
+    winner: Optional[str]  # None if max_ticks was reached first
+    ticks: int
+    sim_time: float  # Simulated seconds (ticks * dt)
+    kills: int
+    final_counts: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0  # Wall-clock seconds
+    
+    # Early termination (Config.early_termination): the decided state, if one was reached
+    predicted_winner: Optional[str] = None
+    decided_tick: Optional[int] = None
+    decided_reason: Optional[str] = None  # 'two_kinds' or 'minority'
+    decided_counts: Dict[str, int] = field(default_factory=dict)
+
+
+def decided_winner(counts: Dict[str, int], minority: float = 0.0) -> Optional[Tuple[str, str]]:
+    """Predict the winner of a state whose outcome is settled.
+    
+    With two kinds left, the one that beats the other can no longer lose.
+    With three, a kind at or below ``minority`` of the living agents is
+    treated as extinct, which leaves its prey unopposed; this is a
+    heuristic, so its accuracy should be checked with validation runs.
+    
+    Args:
+        counts: Living agents per kind
+        minority: Share at which a kind counts as extinct (0 disables)
+        
+    Returns:
+        (winner, reason) with reason 'two_kinds' or 'minority', or None if undecided
+    """
+    alive = [kind for kind, count in counts.items() if count > 0]
+    if len(alive) == 2:
+        first, second = alive
+        return (first if BEATS[first] == second else second), 'two_kinds'
+    if minority > 0 and len(alive) == 3:
+        weakest = min(alive, key=counts.get)
+        if counts[weakest] <= minority * sum(counts.values()):
+            # Its predator wins against its prey, and nothing else hunts the prey
+            return BEATS[weakest], 'minority'
+    return None
+
+
+def run_headless(
+    config: Config,
+    count_per_kind: Optional[int] = None,
+    dt: float = 1 / 60,
+    max_ticks: int = 100000,
+    validate: bool = False
+) -> RunResult:
+    """Run one simulation to victory (or max_ticks) without rendering.
+    
+    With config.early_termination the run stops at the first decided
+    state (see decided_winner) and reports the predicted winner, unless
+    validate is set, in which case it carries on to the real victory so
+    the prediction can be compared with the outcome.
+    
+    Args:
+        config: Game configuration (config.seed selects the run)
+        count_per_kind: Initial agents per kind (uses config.spawn_batch_size if None)
+        dt: Fixed timestep in seconds
+        max_ticks: Tick limit
+        validate: Keep simulating after a decided state
+        
+    Returns:
+        RunResult for the run
+    """
+    world = World(config)
+    world.spawn_batch(count_per_kind)
+    decision = None
+    decided_tick = None
+    decided_counts = {}
+    
+    start = time.perf_counter()
+    while not world.game_over and world.tick < max_ticks:
+        world.update(dt)
+        if config.early_termination and decision is None:
+            counts = world.get_counts()
+            decision = decided_winner(counts, config.decided_minority)
+            if decision is not None:
+                decided_tick, decided_counts = world.tick, counts
+                if not validate:
+                    break
+    elapsed = time.perf_counter() - start
+    
+    predicted, reason = decision or (None, None)
+    stopped = decision is not None and not validate
+    return RunResult(
+        seed=config.seed,
+        winner=predicted if stopped else world.winner_kind,
+        ticks=world.tick,
+        sim_time=world.tick * dt,
+        kills=world.collision_resolver.kills,
+        final_counts=world.get_counts(),
+        elapsed=elapsed,
+        predicted_winner=predicted,
+        decided_tick=decided_tick,
+        decided_reason=reason,
+        decided_counts=decided_counts
+    )
@@ -90,6 +90,15 @@ class Language:
             'hunting_off': 'Hunting: OFF',
             'names_on_msg': 'Names: ON',
             'names_off_msg': 'Names: OFF',
+            'heatmap_kills': 'Heatmap: kills',
+            'heatmap_occupancy': 'Heatmap: occupancy',
+            'heatmap_off': 'Heatmap: OFF',
+            'graph_on': 'Population graph: ON',
+            'graph_off': 'Population graph: OFF',
+            'recording': 'Recording',
+            'recorded': 'Recorded',
+            'frames': 'frames',
+            'dropped': 'dropped',
             'exported': 'Analysis exported!',
             'new_seed_msg': 'New seed',
             'spawned_balanced': 'Spawned balanced population',
@@ -110,8 +119,8 @@ class Language:
             'lang_changed': 'Language changed to English',
             
             # Control hints
-            'controls_line1': 'Controls: R/P/S=Spawn at mouse | 1/2/3=Batch spawn | B=Random Spawn | Space=Pause',
-            'controls_line2': 'H=Toggle Hunt | N=Toggle Names | L=Language | C=Clear | D=Debug | F9=Export CSV | F5=New seed+spawn | ESC=Quit',
+            'controls_line1': 'Controls: R/P/S=Spawn at mouse | 1/2/3=Batch spawn | B=Random Spawn | Space=Pause | M=Heatmap | G=Graph',
+            'controls_line2': 'H=Toggle Hunt | N=Toggle Names | L=Language | C=Clear | D=Debug | F9=Export CSV | F10=Record | F5=New seed+spawn | ESC=Quit',
         }
     
     @staticmethod
@@ -162,6 +171,15 @@ class Language:
             'hunting_off': 'Vânătoare: OPRITĂ',
             'names_on_msg': 'Nume: ACTIVE',
             'names_off_msg': 'Nume: OPRITE',
+            'heatmap_kills': 'Hartă termică: eliminări',
+            'heatmap_occupancy': 'Hartă termică: ocupare',
+            'heatmap_off': 'Hartă termică: OPRITĂ',
+            'graph_on': 'Grafic populație: ACTIV',
+            'graph_off': 'Grafic populație: OPRIT',
+            'recording': 'Înregistrare',
+            'recorded': 'Înregistrate',
+            'frames': 'cadre',
+            'dropped': 'pierdute',
             'exported': 'Analiză exportată!',
             'new_seed_msg': 'Seed nou',
             'spawned_balanced': 'Populație echilibrată creată',
@@ -182,7 +200,7 @@ class Language:
             'lang_changed': 'Limba schimbată în Română',
             
             # Control hints
-            'controls_line1': 'Comenzi: R/P/S=Creare la mouse | 1/2/3=Creare lot | B=Creare Aleatorie | Space=Pauză',
-            'controls_line2': 'H=Comută Vânătoare | N=Comută Nume | L=Limbă | C=Șterge | D=Debug | F9=Export CSV | F5=Seed nou+creare | ESC=Ieșire',
+            'controls_line1': 'Comenzi: R/P/S=Creare la mouse | 1/2/3=Creare lot | B=Creare Aleatorie | Space=Pauză | M=Hartă termică | G=Grafic',
+            'controls_line2': 'H=Comută Vânătoare | N=Comută Nume | L=Limbă | C=Șterge | D=Debug | F9=Export CSV | F10=Înregistrare | F5=Seed nou+creare | ESC=Ieșire',
         }
 
@@ -1,6 +1,7 @@
 """Name generation for agents."""
 
 import random
+from typing import List
 
 # Name lists for each agent type
 ROCK_NAMES = [
@@ -78,6 +79,39 @@ class NameGenerator:
         self.used_names[kind].add(name)
         return name
     
+    def generate_names(self, kind: str, count: int) -> List[str]:
+        """Generate many unique names at once.
+        
+        Unused base names are handed out first (in random order), then
+        numbered variants. Cost is linear in ``count``, unlike repeated
+        ``generate_name`` calls once the base names run out.
+        
+        Args:
+            kind: Agent type ('rock', 'paper', or 'scissors')
+            count: Number of names to generate
+            
+        Returns:
+            List of unique name strings
+        """
+        name_list = {'rock': ROCK_NAMES, 'paper': PAPER_NAMES, 'scissors': SCISSORS_NAMES}.get(kind)
+        if name_list is None:
+            return [self.generate_name(kind) for _ in range(count)]
+        
+        used = self.used_names[kind]
+        available = [name for name in name_list if name not in used]
+        names = self.rng.sample(available, min(count, len(available)))
+        
+        next_suffix = {}
+        for base_name in self.rng.choices(name_list, k=count - len(names)):
+            counter = next_suffix.get(base_name, 2)
+            while f"{base_name}-{counter}" in used:
+                counter += 1
+            names.append(f"{base_name}-{counter}")
+            next_suffix[base_name] = counter + 1
+        
+        used.update(names)
+        return names
+    
     def release_name(self, kind: str, name: str):
         """Release a name back to the pool.
         
@@ -0,0 +1,235 @@
+"""Vectorized, multi-threaded agent update."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+import numpy as np
+from .config import Config, KINDS, PREY_CODES
+
+
+class ParallelStepper:
+    """Steers and integrates all agents with NumPy kernels on a thread pool.
+    
+    Like the default object update, every steering decision reads a frozen
+    snapshot of the positions at the start of the tick and writes into
+    separate next-state arrays. The agents are split into fixed-size
+    chunks and each row depends only on the snapshot, so results are
+    identical for any thread count. NumPy releases the GIL inside its
+    array kernels, so chunks run concurrently on several cores (without
+    any GIL on free-threaded CPython builds).
+    
+    Covers the object path's hunting, damping, limited-vision wandering,
+    speed limit and boundary handling. Target persistence and the prey
+    quadtree only apply to the object path; the vectorized search is a
+    full nearest-prey search every tick.
+    """
+    
+    def __init__(self, config: Config, threads: int, chunk_size: int = 128):
+        """Initialize the stepper.
+        
+        Args:
+            config: Game configuration
+            threads: Worker threads (1 runs chunks on the calling thread)
+            chunk_size: Agents per work unit
+        """
+        self.config = config
+        self.threads = threads
+        self.chunk_size = chunk_size
+        self.rng = np.random.default_rng(config.seed)
+        self._pool = ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
+    
+    def reseed(self, seed: int):
+        """Restart the wander random stream.
+        
+        Args:
+            seed: New random seed
+        """
+        self.rng = np.random.default_rng(seed)
+    
+    def close(self):
+        """Shut down the worker threads."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def step(self, agents: List, dt: float):
+        """Advance all living agents by one tick.
+        
+        Args:
+            agents: Agents to update (dead ones are skipped)
+            dt: Time delta in seconds
+        """
+        living = [a for a in agents if a.alive]
+        n = len(living)
+        if n == 0:
+            return
+        
+        next_pos, next_vel, targets, wander = self.step_arrays(
+            pos=np.array([(a.pos.x, a.pos.y) for a in living], dtype=np.float64),
+            vel=np.array([(a.vel.x, a.vel.y) for a in living], dtype=np.float64),
+            max_speed=np.array([a.max_speed for a in living]),
+            max_force=np.array([a.max_force for a in living]),
+            radius=np.array([a.radius for a in living], dtype=np.float64),
+            kind=np.array([a.code for a in living], dtype=np.intp),
+            wander=np.array([a.wander_angle for a in living]),
+            dt=dt
+        )
+        
+        limited = self.config.limited_vision
+        for agent, (x, y), (vx, vy), target in zip(
+                living, next_pos.tolist(), next_vel.tolist(), targets.tolist()):
+            agent.pos.update(x, y)
+            agent.vel.update(vx, vy)
+            if target >= 0:
+                agent.target = living[target]
+            elif limited:
+                agent.target = None
+        if limited:
+            for agent, angle in zip(living, wander.tolist()):
+                agent.wander_angle = angle
+    
+    def step_arrays(self, pos: np.ndarray, vel: np.ndarray, max_speed: np.ndarray,
+                    max_force: np.ndarray, radius: np.ndarray, kind: np.ndarray,
+                    wander: np.ndarray, dt: float, active: Optional[int] = None):
+        """Advance agents held in arrays by one tick.
+        
+        The first ``active`` rows are stepped; every row (including any
+        after ``active``, e.g. agents owned by another shard) is visible
+        as prey.
+        
+        Args:
+            pos: (n, 2) positions
+            vel: (n, 2) velocities
+            max_speed: (n,) speed limits
+            max_force: (n,) steering force limits
+            radius: (n,) collision radii
+            kind: (n,) indices into KINDS
+            wander: (n,) wander heading offsets
+            dt: Time delta in seconds
+            active: Number of leading rows to step (all if None)
+            
+        Returns:
+            (next_pos, next_vel, target, wander) for the active rows;
+            target holds row indices of the chased prey, -1 for none
+        """
+        n = len(pos) if active is None else active
+        self._pos, self._vel = pos, vel
+        self._max_speed, self._max_force, self._radius = max_speed, max_force, radius
+        self._kind = kind
+        self._wander = np.array(wander[:n], dtype=np.float64)
+        self._by_kind = [np.flatnonzero(kind == k) for k in range(len(KINDS))]
+        # Drawn up front on this thread so chunking cannot change the stream
+        self._jitter = self.rng.uniform(-1.0, 1.0, n) * (self.config.wander_jitter * dt)
+        self._dt = dt
+        self._active = n
+        
+        self._next_pos = np.empty((n, 2))
+        self._next_vel = np.empty((n, 2))
+        self._target = np.full(n, -1, dtype=np.intp)
+        
+        starts = range(0, n, self.chunk_size)
+        if self._pool is None:
+            for start in starts:
+                self._step_chunk(start)
+        else:
+            list(self._pool.map(self._step_chunk, starts))
+        return self._next_pos, self._next_vel, self._target, self._wander
+    
+    def _step_chunk(self, start: int):
+        """Compute the next state of agents [start, start + chunk_size)."""
+        end = min(start + self.chunk_size, self._active)
+        config = self.config
+        pos = self._pos
+        p = pos[start:end]
+        v = self._vel[start:end].copy()
+        max_speed = self._max_speed[start:end]
+        max_force = self._max_force[start:end]
+        
+        if config.enable_steering:
+            target = self._find_targets(start, end)
+            self._target[start:end] = target
+            hunting = target >= 0
+            
+            # Seek: full-speed desired velocity towards the prey
+            desired = pos[np.where(hunting, target, 0)] - p
+            length = np.hypot(desired[:, 0], desired[:, 1])
+            moving = hunting & (length > 0)
+            scale = np.divide(max_speed, length, out=np.zeros_like(length), where=moving)
+            force = np.where(moving[:, None], desired * scale[:, None] - v, 0.0)
+            v += _clamp_length(force, max_force)
+            
+            idle = ~hunting
+            if config.limited_vision:
+                self._wander_rows(start, end, idle, v, max_speed, max_force)
+            else:
+                # No prey anywhere: slow to a stop
+                v[idle] *= 0.95
+                slow = idle & (np.hypot(v[:, 0], v[:, 1]) < 1.0)
+                v[slow] = 0.0
+        
+        v = _clamp_length(v, max_speed)
+        p = p + v * self._dt
+        
+        width, height = config.world_size
+        if config.boundary_mode == "wrap":
+            for axis, size in ((0, width), (1, height)):
+                c = p[:, axis]
+                c[:] = np.where(c < 0, c + size, np.where(c >= size, c - size, c))
+        else:
+            radius = self._radius[start:end]
+            for axis, size in ((0, width), (1, height)):
+                c = p[:, axis]
+                vc = v[:, axis]
+                low = c - radius < 0
+                high = ~low & (c + radius >= size)
+                c[low] = radius[low]
+                vc[low] = np.abs(vc[low])
+                c[high] = size - radius[high]
+                vc[high] = -np.abs(vc[high])
+        
+        self._next_pos[start:end] = p
+        self._next_vel[start:end] = v
+    
+    def _find_targets(self, start: int, end: int) -> np.ndarray:
+        """Index of each agent's nearest visible prey, or -1."""
+        pos = self._pos
+        kinds = self._kind[start:end]
+        target = np.full(end - start, -1, dtype=np.intp)
+        vision = self.config.agent_detection_range if self.config.limited_vision else np.inf
+        for k in range(len(KINDS)):
+            rows = np.flatnonzero(kinds == k)
+            prey = self._by_kind[PREY_CODES[k]]
+            if rows.size == 0 or prey.size == 0:
+                continue
+            dx = pos[start + rows, 0][:, None] - pos[prey, 0][None, :]
+            dy = pos[start + rows, 1][:, None] - pos[prey, 1][None, :]
+            dist_sq = dx * dx
+            dist_sq += dy * dy
+            best = dist_sq.argmin(axis=1)  # First in agent order on ties
+            visible = dist_sq[np.arange(rows.size), best] < vision * vision
+            target[rows[visible]] = prey[best[visible]]
+        return target
+    
+    def _wander_rows(self, start: int, end: int, idle: np.ndarray, v: np.ndarray,
+                     max_speed: np.ndarray, max_force: np.ndarray):
+        """Apply the wander steering to idle rows of a chunk in place."""
+        angle = self._wander[start:end]
+        angle[idle] += self._jitter[start:end][idle]
+        speed = np.hypot(v[:, 0], v[:, 1])
+        heading = np.divide(v, speed[:, None], out=np.zeros_like(v), where=speed[:, None] > 0)
+        heading[speed == 0] = (1.0, 0.0)
+        cos, sin = np.cos(angle), np.sin(angle)
+        rotated = np.stack([heading[:, 0] * cos - heading[:, 1] * sin,
+                            heading[:, 0] * sin + heading[:, 1] * cos], axis=1)
+        ahead = heading * 2 + rotated
+        length = np.hypot(ahead[:, 0], ahead[:, 1])
+        desired = ahead / np.where(length > 0, length, 1.0)[:, None] * max_speed[:, None]
+        steer = _clamp_length(desired - v, max_force)
+        v[idle] += steer[idle]
+
+
+def _clamp_length(vectors: np.ndarray, limit: np.ndarray) -> np.ndarray:
+    """Scale rows longer than their limit down to it."""
+    length = np.hypot(vectors[:, 0], vectors[:, 1])
+    over = length > limit
+    scale = np.divide(limit, length, out=np.ones_like(length), where=over)
+    return vectors * scale[:, None]
@@ -0,0 +1,245 @@
+"""Quadtree for nearest-prey queries over the whole arena."""
+
+import heapq
+import itertools
+from typing import Dict, List, Optional, Tuple, Union
+from .config import KIND_CODES
+
+
+class _Node:
+    """Quadtree node: a rectangle with per-kind agent counts."""
+    
+    __slots__ = ('x0', 'y0', 'x1', 'y1', 'parent', 'children', 'items', 'counts', 'total', 'depth')
+    
+    def __init__(self, x0: float, y0: float, x1: float, y1: float, parent: Optional['_Node'], depth: int):
+        self.x0, self.y0, self.x1, self.y1 = x0, y0, x1, y1
+        self.parent = parent
+        self.depth = depth
+        self.children: Optional[List['_Node']] = None
+        self.items: Dict[int, tuple] = {}  # Leaf only: id -> (x, y, kind code, agent)
+        self.counts: Dict[int, int] = {}  # Agents per kind code in this subtree
+        self.total = 0
+    
+    def contains(self, x: float, y: float) -> bool:
+        return self.x0 <= x < self.x1 and self.y0 <= y < self.y1
+    
+    def min_dist_sq(self, x: float, y: float) -> float:
+        """Squared distance from a point to this rectangle."""
+        dx = self.x0 - x if x < self.x0 else (x - self.x1 if x > self.x1 else 0.0)
+        dy = self.y0 - y if y < self.y0 else (y - self.y1 if y > self.y1 else 0.0)
+        return dx * dx + dy * dy
+
+
+class PreyQuadtree:
+    """Region quadtree of agents with per-node counts by kind.
+    
+    Answers "nearest living agent of kind X" with best-first
+    branch-and-bound: subtrees holding no agents of that kind are skipped
+    via their counts, and the search stops once the nearest remaining
+    rectangle is farther than the best match. Positions are indexed as of
+    the last ``sync``; the tree is maintained incrementally as agents move
+    (usually a coordinate update inside the same leaf), spawn and die.
+    """
+    
+    def __init__(self, width: float, height: float, capacity: int = 8, max_depth: int = 12):
+        """Initialize an empty tree.
+        
+        Args:
+            width: Arena width
+            height: Arena height
+            capacity: Agents per leaf before it splits
+            max_depth: Maximum tree depth
+        """
+        self.width = width
+        self.height = height
+        self.capacity = capacity
+        self.max_depth = max_depth
+        self.clear()
+    
+    def clear(self):
+        """Remove all agents."""
+        self.root = _Node(0.0, 0.0, float(self.width), float(self.height), None, 0)
+        self._where: Dict[int, _Node] = {}
+    
+    def __len__(self) -> int:
+        return self.root.total
+    
+    def _clamp(self, x: float, y: float) -> Tuple[float, float]:
+        """Clamp a position into the root rectangle."""
+        max_x = self.width - 1e-6
+        max_y = self.height - 1e-6
+        return min(max(x, 0.0), max_x), min(max(y, 0.0), max_y)
+    
+    def sync(self, agents: List):
+        """Bring the tree up to date with living agents' positions.
+        
+        Unknown living agents are inserted and known ones moved. Dead
+        agents must be removed with ``remove``.
+        
+        Args:
+            agents: Agents to index
+        """
+        where = self._where
+        for agent in agents:
+            if not agent.alive:
+                continue
+            x, y = self._clamp(agent.pos.x, agent.pos.y)
+            leaf = where.get(agent.id)
+            if leaf is None:
+                self._insert_below(self.root, (x, y, agent.code, agent), count_start=True)
+            elif leaf.contains(x, y):
+                leaf.items[agent.id] = (x, y, agent.code, agent)
+            else:
+                self._move(leaf, agent, x, y)
+    
+    def insert(self, agent):
+        """Index a single agent.
+        
+        Args:
+            agent: Agent to insert
+        """
+        if agent.id in self._where:
+            return
+        x, y = self._clamp(agent.pos.x, agent.pos.y)
+        self._insert_below(self.root, (x, y, agent.code, agent), count_start=True)
+    
+    def remove(self, agent):
+        """Remove an agent (e.g. after it died).
+        
+        Args:
+            agent: Agent to remove
+        """
+        leaf = self._where.pop(agent.id, None)
+        if leaf is None:
+            return
+        x, y, kind, _ = leaf.items.pop(agent.id)
+        node = leaf
+        while node is not None:
+            node.counts[kind] -= 1
+            node.total -= 1
+            node = node.parent
+        self._collapse_from(leaf.parent, None)
+    
+    def count(self, kind: Union[str, int]) -> int:
+        """Number of indexed agents of a kind (name or code)."""
+        return self.root.counts.get(KIND_CODES.get(kind, kind), 0)
+    
+    def nearest(self, x: float, y: float, kind: Union[str, int], exclude_id: Optional[int] = None,
+                max_dist_sq: float = float('inf')):
+        """Find the nearest indexed living agent of a kind.
+        
+        Args:
+            x: Query x
+            y: Query y
+            kind: Kind name or code to search for
+            exclude_id: Optional agent id to ignore (the searcher)
+            max_dist_sq: Only consider agents closer than this squared distance
+            
+        Returns:
+            Nearest agent, or None if there is none
+        """
+        kind = KIND_CODES.get(kind, kind)
+        best = None
+        best_d = max_dist_sq
+        tie = itertools.count()
+        heap = [(0.0, 0, self.root)]
+        while heap:
+            d, _, node = heapq.heappop(heap)
+            if d >= best_d:
+                break
+            if node.children is None:
+                for agent_id, (ax, ay, agent_kind, agent) in node.items.items():
+                    if agent_kind != kind or agent_id == exclude_id or not agent.alive:
+                        continue
+                    dd = (ax - x) * (ax - x) + (ay - y) * (ay - y)
+                    if dd < best_d:
+                        best, best_d = agent, dd
+            else:
+                for child in node.children:
+                    if child.counts.get(kind):
+                        child_d = child.min_dist_sq(x, y)
+                        if child_d < best_d:
+                            heapq.heappush(heap, (child_d, next(tie), child))
+        return best
+    
+    def _insert_below(self, node: _Node, entry: tuple, count_start: bool):
+        """Insert an entry into node's subtree.
+        
+        Args:
+            node: Subtree root that contains the entry's position
+            entry: (x, y, kind code, agent)
+            count_start: Whether node's own counts still need incrementing
+        """
+        x, y, kind, agent = entry
+        if count_start:
+            node.counts[kind] = node.counts.get(kind, 0) + 1
+            node.total += 1
+        while node.children is not None:
+            node = self._child_for(node, x, y)
+            node.counts[kind] = node.counts.get(kind, 0) + 1
+            node.total += 1
+        node.items[agent.id] = entry
+        self._where[agent.id] = node
+        if len(node.items) > self.capacity and node.depth < self.max_depth:
+            self._split(node)
+    
+    def _child_for(self, node: _Node, x: float, y: float) -> _Node:
+        """Child quadrant containing a point."""
+        mx = (node.x0 + node.x1) / 2
+        my = (node.y0 + node.y1) / 2
+        return node.children[(2 if y >= my else 0) + (1 if x >= mx else 0)]
+    
+    def _split(self, node: _Node):
+        """Turn a leaf into an internal node with four children."""
+        mx = (node.x0 + node.x1) / 2
+        my = (node.y0 + node.y1) / 2
+        depth = node.depth + 1
+        node.children = [
+            _Node(node.x0, node.y0, mx, my, node, depth),
+            _Node(mx, node.y0, node.x1, my, node, depth),
+            _Node(node.x0, my, mx, node.y1, node, depth),
+            _Node(mx, my, node.x1, node.y1, node, depth),
+        ]
+        items = node.items
+        node.items = {}
+        for entry in items.values():
+            child = self._child_for(node, entry[0], entry[1])
+            child.counts[entry[2]] = child.counts.get(entry[2], 0) + 1
+            child.total += 1
+            child.items[entry[3].id] = entry
+            self._where[entry[3].id] = child
+        for child in node.children:
+            if len(child.items) > self.capacity and child.depth < self.max_depth:
+                self._split(child)
+    
+    def _move(self, leaf: _Node, agent, x: float, y: float):
+        """Move an agent whose new position left its leaf."""
+        kind = agent.code
+        del leaf.items[agent.id]
+        node = leaf
+        # Walk up to the lowest ancestor still containing the position
+        while not node.contains(x, y):
+            node.counts[kind] -= 1
+            node.total -= 1
+            node = node.parent
+        ancestor = node
+        self._insert_below(ancestor, (x, y, kind, agent), count_start=False)
+        self._collapse_from(leaf.parent, ancestor)
+    
+    def _collapse_from(self, node: Optional[_Node], stop: Optional[_Node]):
+        """Merge sparse subtrees back into leaves, walking up to ``stop``."""
+        while node is not None and node is not stop:
+            if node.children is not None and node.total <= self.capacity // 2:
+                items = {}
+                stack = list(node.children)
+                while stack:
+                    child = stack.pop()
+                    if child.children is None:
+                        items.update(child.items)
+                    else:
+                        stack.extend(child.children)
+                node.children = None
+                node.items = items
+                for agent_id in items:
+                    self._where[agent_id] = node
+            node = node.parent
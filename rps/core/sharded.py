@@ -0,0 +1,518 @@
+"""Spatially partitioned multi-process world for very large maps.
+
+The arena is split into a grid of tiles, each owned by a worker process
+that steps its agents with the vectorized kernels from ``parallel``. Every
+tick runs in three phases separated by barriers:
+
+1. Each worker publishes its agents within the halo width of its tile
+   border into shared memory, reads its neighbours' border agents as
+   read-only ghosts and steers/moves its own agents against them.
+2. Workers publish the moved border agents and resolve collisions for
+   their own agents against owned agents and ghosts.
+3. Agents that left their tile are published as migrants and adopted by
+   the worker whose tile now contains them.
+
+Collisions are resolved simultaneously (every eligible pair is judged on
+the state at the start of the phase): an agent dies if any partner beats
+it, the kill is credited to the lowest-id partner that beat it, and ties
+bounce each agent off its same-kind partners in id order. Each agent's
+fate depends only on agents within a few radii of it, which the halo
+always covers, so both sides of a tile border reach the same result
+without talking to each other.
+
+Sharded worlds always use limited vision (``agent_detection_range`` sets
+the halo width) and bounded arenas. The coordinator, ``ShardedWorld``,
+offers the ``World`` calls needed to drive a simulation headless:
+spawning, ``update``, ``get_counts``/``get_total_count`` and the same
+victory rules.
+"""
+
+import math
+import multiprocessing
+from dataclasses import replace
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .config import Config, KIND_CODES, KINDS, PREY_CODES
+from .parallel import ParallelStepper
+
+# One agent, as stored in shared memory and sent to workers
+AGENT_DTYPE = np.dtype([
+    ('id', 'i8'), ('kind', 'i8'),
+    ('x', 'f8'), ('y', 'f8'), ('vx', 'f8'), ('vy', 'f8'),
+    ('max_speed', 'f8'), ('max_force', 'f8'), ('radius', 'f8'), ('wander', 'f8'),
+    ('last_collision', 'i8'), ('kills', 'i8'),
+])
+
+# Shared-memory regions per worker
+_PRE, _POST, _MIGRANTS = 0, 1, 2
+
+_BEATS_INDEX = np.array(PREY_CODES)
+
+
+def tile_layout(workers: int) -> Tuple[int, int]:
+    """Choose a (columns, rows) grid with ``workers`` tiles, as square as possible.
+    
+    Args:
+        workers: Number of tiles
+        
+    Returns:
+        Tuple of (columns, rows)
+    """
+    rows = max(r for r in range(1, int(math.isqrt(workers)) + 1) if workers % r == 0)
+    return workers // rows, rows
+
+
+def _tile_rects(width: float, height: float, workers: int) -> List[Tuple[float, float, float, float]]:
+    """Tile rectangles (x0, y0, x1, y1), row-major."""
+    columns, rows = tile_layout(workers)
+    return [
+        (width * c / columns, height * r / rows, width * (c + 1) / columns, height * (r + 1) / rows)
+        for r in range(rows) for c in range(columns)
+    ]
+
+
+def _tile_of(records: np.ndarray, width: float, height: float, workers: int) -> np.ndarray:
+    """Index of the tile containing each record's position."""
+    columns, rows = tile_layout(workers)
+    column = np.clip((records['x'] * columns // width).astype(np.intp), 0, columns - 1)
+    row = np.clip((records['y'] * rows // height).astype(np.intp), 0, rows - 1)
+    return row * columns + column
+
+
+def resolve_contacts(owned: np.ndarray, others: np.ndarray, tick: int, config: Config) -> np.ndarray:
+    """Resolve collisions for owned agents simultaneously, in place.
+    
+    Updates kills, collision cooldowns and tie bounces of the owned
+    records; the others (ghosts) are only read.
+    
+    Args:
+        owned: Records of the agents to update
+        others: Records of other visible agents (ghosts)
+        tick: Current game tick
+        config: Game configuration
+        
+    Returns:
+        Boolean mask of owned agents killed this tick
+    """
+    n = len(owned)
+    dead = np.zeros(n, dtype=bool)
+    everyone = np.concatenate([owned, others]) if len(others) else owned
+    if len(everyone) < 2:
+        return dead
+    eligible = tick - everyone['last_collision'] >= config.collision_cooldown_frames
+    
+    # Sweep and prune along x: partners lie within the widest contact distance
+    order = np.argsort(everyone['x'], kind='stable')
+    xs = everyone['x'][order]
+    upper = np.searchsorted(xs, xs + 2 * everyone['radius'].max(), side='right')
+    counts = upper - np.arange(1, len(xs) + 1)
+    first = np.repeat(np.arange(len(xs)), counts)
+    second = first + 1 + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    a, b = order[first], order[second]
+    
+    # Touching, eligible pairs (ghost pairs included: they decide kill credit)
+    dx = everyone['x'][a] - everyone['x'][b]
+    dy = everyone['y'][a] - everyone['y'][b]
+    r = everyone['radius'][a] + everyone['radius'][b]
+    keep = (dx * dx + dy * dy <= r * r) & eligible[a] & eligible[b]
+    a, b = a[keep], b[keep]
+    if a.size == 0:
+        return dead
+    
+    # Every pair in both orientations: (agent, partner)
+    agent = np.concatenate([a, b])
+    partner = np.concatenate([b, a])
+    kinds = everyone['kind']
+    ids = everyone['id']
+    beaten = _BEATS_INDEX[kinds[partner]] == kinds[agent]
+    losers, winners = agent[beaten], partner[beaten]
+    dead = np.zeros(len(everyone), dtype=bool)
+    dead[losers] = True
+    
+    # Each loser is credited to its lowest-id winner
+    killer_id = np.full(len(everyone), np.iinfo(np.int64).max)
+    np.minimum.at(killer_id, losers, ids[winners])
+    credited = winners[ids[winners] == killer_id[losers]]
+    np.add.at(owned['kills'], credited[credited < n], 1)
+    
+    owned['last_collision'][np.unique(agent[agent < n])] = tick
+    
+    if config.bounce_on_tie:
+        tie = (kinds[agent] == kinds[partner]) & (agent < n)
+        bounces = sorted(zip(agent[tie].tolist(), ids[partner[tie]].tolist(), partner[tie].tolist()))
+        for i, partner_id, j in bounces:
+            _bounce(owned, i, everyone[j], partner_id)
+    
+    return dead[:n]
+
+
+def _bounce(owned: np.ndarray, i: int, other, other_id: int):
+    """Reflect owned[i]'s velocity off another agent (as Agent.soft_bounce)."""
+    dx = owned['x'][i] - other['x']
+    dy = owned['y'][i] - other['y']
+    if dx * dx + dy * dy < 0.01:
+        # Too close: pseudo-random normal derived from the ids, same on every shard
+        angle = ((int(owned['id'][i]) * 2654435761 + other_id) % 2**32) / 2**32 * 2 * math.pi
+        nx, ny = math.cos(angle), math.sin(angle)
+    else:
+        length = math.hypot(dx, dy)
+        nx, ny = dx / length, dy / length
+    dot = owned['vx'][i] * nx + owned['vy'][i] * ny
+    if dot < 0:
+        owned['vx'][i] -= 2 * dot * nx
+        owned['vy'][i] -= 2 * dot * ny
+
+
+class _Shard:
+    """Worker-side state of one tile."""
+    
+    def __init__(self, index: int, workers: int, config: Config, halo: float,
+                 buffers: np.ndarray, counts: np.ndarray, barrier):
+        self.index = index
+        self.workers = workers
+        self.config = config
+        self.halo = halo
+        self.rect = _tile_rects(*config.world_size, workers)[index]
+        self.buffers = buffers  # (workers, 3, capacity) records
+        self.counts = counts  # (workers, 3) valid records per region
+        self.barrier = barrier
+        self.owned = np.empty(0, dtype=AGENT_DTYPE)
+        self.stepper = ParallelStepper(config, threads=1)
+        self.stepper.rng = np.random.default_rng([config.seed, index])
+    
+    def _inside(self, records: np.ndarray, margin: float) -> np.ndarray:
+        """Mask of records inside this tile grown by ``margin``."""
+        x0, y0, x1, y1 = self.rect
+        return ((records['x'] >= x0 - margin) & (records['x'] < x1 + margin)
+                & (records['y'] >= y0 - margin) & (records['y'] < y1 + margin))
+    
+    def _publish(self, region: int, records: np.ndarray):
+        """Write records to this worker's shared-memory region."""
+        capacity = self.buffers.shape[2]
+        if len(records) > capacity:
+            raise RuntimeError(f"Shard {self.index}: {len(records)} records exceed capacity {capacity}")
+        self.buffers[self.index, region, :len(records)] = records
+        self.counts[self.index, region] = len(records)
+    
+    def _ghosts(self, region: int) -> np.ndarray:
+        """Records other workers published in a region that lie within the halo."""
+        parts = [self.buffers[w, region, :self.counts[w, region]]
+                 for w in range(self.workers) if w != self.index]
+        ghosts = np.concatenate(parts) if parts else np.empty(0, dtype=AGENT_DTYPE)
+        return ghosts[self._inside(ghosts, self.halo)]
+    
+    def _border(self) -> np.ndarray:
+        """Owned agents within the halo width of the tile border (or outside it)."""
+        return self.owned[~self._inside(self.owned, -self.halo)]
+    
+    def step(self, dt: float, tick: int) -> Tuple[List[int], int]:
+        """Run one tick.
+        
+        Args:
+            dt: Time delta in seconds
+            tick: Current game tick
+            
+        Returns:
+            (owned agents per kind, owned agents killed)
+        """
+        # Phase 1: steer and move against ghosts at their starting positions
+        self._publish(_PRE, self._border())
+        self.barrier.wait()
+        ghosts = self._ghosts(_PRE)
+        owned = self.owned
+        if len(owned):
+            everyone = np.concatenate([owned, ghosts])
+            next_pos, next_vel, _, wander = self.stepper.step_arrays(
+                np.stack([everyone['x'], everyone['y']], axis=1),
+                np.stack([everyone['vx'], everyone['vy']], axis=1),
+                everyone['max_speed'], everyone['max_force'], everyone['radius'],
+                everyone['kind'].astype(np.intp), everyone['wander'], dt, active=len(owned)
+            )
+            owned['x'], owned['y'] = next_pos[:, 0], next_pos[:, 1]
+            owned['vx'], owned['vy'] = next_vel[:, 0], next_vel[:, 1]
+            owned['wander'] = wander
+        
+        # Phase 2: collisions against ghosts at their new positions
+        self._publish(_POST, self._border())
+        self.barrier.wait()
+        dead = resolve_contacts(owned, self._ghosts(_POST), tick, self.config)
+        killed = int(dead.sum())
+        owned = owned[~dead]
+        
+        # Phase 3: hand agents that left the tile to their new owner
+        leaving = ~self._inside(owned, 0.0)
+        self._publish(_MIGRANTS, owned[leaving])
+        self.barrier.wait()
+        arrivals = [self.buffers[w, _MIGRANTS, :self.counts[w, _MIGRANTS]]
+                    for w in range(self.workers) if w != self.index]
+        arrivals = np.concatenate([owned[~leaving]] + arrivals)
+        owned = arrivals[self._inside(arrivals, 0.0)]
+        self.owned = owned[np.argsort(owned['id'], kind='stable')]
+        
+        return np.bincount(self.owned['kind'], minlength=len(KINDS)).tolist(), killed
+
+
+def _run_shard(conn, index: int, workers: int, config: Config, halo: float,
+               buffers_name: str, counts_name: str, capacity: int, barrier):
+    """Worker process entry point: serve commands from the coordinator."""
+    buffers_shm = shared_memory.SharedMemory(name=buffers_name)
+    counts_shm = shared_memory.SharedMemory(name=counts_name)
+    
+    shard = _Shard(
+        index, workers, config, halo,
+        np.ndarray((workers, 3, capacity), dtype=AGENT_DTYPE, buffer=buffers_shm.buf),
+        np.ndarray((workers, 3), dtype=np.int64, buffer=counts_shm.buf),
+        barrier
+    )
+    try:
+        while True:
+            message = conn.recv()
+            command = message[0]
+            if command == 'spawn':
+                shard.owned = np.concatenate([shard.owned, message[1]])
+            elif command == 'step':
+                try:
+                    conn.send(('ok', shard.step(message[1], message[2])))
+                except Exception as e:
+                    barrier.abort()
+                    conn.send(('error', f"{type(e).__name__}: {e}"))
+            elif command == 'agents':
+                conn.send(shard.owned.copy())
+            else:
+                break
+    except EOFError:
+        pass
+    finally:
+        shard.buffers = shard.counts = None
+        buffers_shm.close()
+        counts_shm.close()
+
+
+class ShardedWorld:
+    """Coordinator for a world split into tiles owned by worker processes."""
+    
+    def __init__(self, config: Config, workers: int = 2, capacity: Optional[int] = None):
+        """Start the workers.
+        
+        Args:
+            config: Game configuration (limited vision is always enabled)
+            workers: Number of tiles / worker processes
+            capacity: Agents each worker may publish per phase
+                (defaults to config.max_population)
+                
+        Raises:
+            ValueError: If the configuration cannot be sharded
+        """
+        if config.boundary_mode == "wrap":
+            raise ValueError("Sharded worlds require boundary_mode='bounce'")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.config = replace(config, limited_vision=True)
+        self.workers = workers
+        max_radius = max(config.kind_table.radius)
+        # Vision range, plus contact-of-contact distance for kill credit, plus movement slack
+        self.halo = max(config.agent_detection_range, 4 * max_radius) + 2 * max_radius
+        capacity = capacity or config.max_population
+        
+        self._buffers = shared_memory.SharedMemory(
+            create=True, size=workers * 3 * capacity * AGENT_DTYPE.itemsize
+        )
+        self._counts = shared_memory.SharedMemory(create=True, size=workers * 3 * 8)
+        context = multiprocessing.get_context('spawn')
+        barrier = self._barrier = context.Barrier(workers)
+        self._conns = []
+        self._processes = []
+        for index in range(workers):
+            conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_run_shard,
+                args=(child_conn, index, workers, self.config, self.halo,
+                      self._buffers.name, self._counts.name, capacity, barrier),
+                daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._conns.append(conn)
+            self._processes.append(process)
+        
+        self.rng = np.random.default_rng(config.seed)
+        self._next_id = 0
+        self._counts_by_kind = [0] * len(KINDS)
+        self.kills = 0
+        self.tick = 0
+        self.paused = False
+        self.game_over = False
+        self.winner_kind = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _records(self, kind: str, xs: np.ndarray, ys: np.ndarray,
+                 vxs: np.ndarray, vys: np.ndarray) -> np.ndarray:
+        """Build agent records with fresh ids."""
+        count = len(xs)
+        records = np.zeros(count, dtype=AGENT_DTYPE)
+        records['id'] = np.arange(self._next_id, self._next_id + count)
+        self._next_id += count
+        code = KIND_CODES[kind]
+        records['kind'] = code
+        records['x'], records['y'] = xs, ys
+        records['vx'], records['vy'] = vxs, vys
+        speed_range = self.config.kind_table.speed[code]
+        speeds = np.hypot(vxs, vys)
+        speeds = np.where(speeds > 0, speeds, self.rng.uniform(speed_range[0], speed_range[1], count))
+        records['max_speed'] = speeds
+        records['max_force'] = speeds * 0.1
+        records['radius'] = self.config.kind_table.radius[code]
+        records['last_collision'] = -10**9
+        return records
+    
+    def _dispatch(self, records: np.ndarray):
+        """Send new agents to the workers owning their positions."""
+        tiles = _tile_of(records, *self.config.world_size, self.workers)
+        for index, conn in enumerate(self._conns):
+            mine = records[tiles == index]
+            if len(mine):
+                conn.send(('spawn', mine))
+        for kind in np.unique(records['kind']).tolist():
+            self._counts_by_kind[kind] += int((records['kind'] == kind).sum())
+    
+    def spawn(self, kind: str, pos: Tuple[float, float],
+              vel: Optional[Tuple[float, float]] = None) -> Optional[int]:
+        """Spawn a single agent at a specific position.
+        
+        Args:
+            kind: Agent type
+            pos: Position (x, y)
+            vel: Optional velocity (vx, vy)
+            
+        Returns:
+            The new agent's id, or None if population cap reached
+        """
+        if self.get_total_count() >= self.config.max_population:
+            return None
+        if vel is None:
+            speed_range = self.config.kind_table.speed[KIND_CODES[kind]]
+            angle = self.rng.uniform(0, 2 * math.pi)
+            speed = self.rng.uniform(speed_range[0], speed_range[1])
+            vel = (math.cos(angle) * speed, math.sin(angle) * speed)
+        records = self._records(kind, np.array([pos[0]]), np.array([pos[1]]),
+                                np.array([vel[0]]), np.array([vel[1]]))
+        self._dispatch(records)
+        return int(records['id'][0])
+    
+    def spawn_random(self, kind: str, count: int = 1) -> int:
+        """Spawn agents at random positions.
+        
+        Args:
+            kind: Agent type
+            count: Number of agents to spawn
+            
+        Returns:
+            Number of agents spawned
+        """
+        count = min(count, self.config.max_population - self.get_total_count())
+        if count <= 0:
+            return 0
+        rng = self.rng
+        speed_range = self.config.kind_table.speed[KIND_CODES[kind]]
+        width, height = self.config.world_size
+        xs = rng.uniform(0, width, count)
+        ys = rng.uniform(0, height, count)
+        angles = rng.uniform(0, 2 * math.pi, count)
+        speeds = rng.uniform(speed_range[0], speed_range[1], count)
+        self._dispatch(self._records(kind, xs, ys, np.cos(angles) * speeds, np.sin(angles) * speeds))
+        return count
+    
+    def spawn_batch(self, batch_size: int = None):
+        """Spawn a batch of each agent type.
+        
+        Args:
+            batch_size: Number of each type to spawn (uses config default if None)
+        """
+        size = batch_size or self.config.spawn_batch_size
+        for kind in KINDS:
+            self.spawn_random(kind, size)
+    
+    def update(self, dt: float):
+        """Advance every tile by one tick.
+        
+        Args:
+            dt: Time delta in seconds
+            
+        Raises:
+            RuntimeError: If a worker failed
+        """
+        if self.paused or self.game_over:
+            return
+        for conn in self._conns:
+            conn.send(('step', dt, self.tick))
+        replies = [conn.recv() for conn in self._conns]
+        errors = [reply[1] for reply in replies if reply[0] == 'error']
+        if errors:
+            raise RuntimeError(f"Shard worker failed: {errors[0]}")
+        
+        counts = [0] * len(KINDS)
+        for _, (shard_counts, killed) in replies:
+            counts = [total + c for total, c in zip(counts, shard_counts)]
+            self.kills += killed
+        self._counts_by_kind = counts
+        self.tick += 1
+        self._check_victory()
+    
+    def agents(self) -> np.ndarray:
+        """Records of all living agents, ordered by id."""
+        for conn in self._conns:
+            conn.send(('agents',))
+        records = np.concatenate([conn.recv() for conn in self._conns])
+        return records[np.argsort(records['id'], kind='stable')]
+    
+    def get_counts(self) -> Dict[str, int]:
+        """Get count of living agents by kind.
+        
+        Returns:
+            Dictionary mapping kind to count
+        """
+        return dict(zip(KINDS, self._counts_by_kind))
+    
+    def get_total_count(self) -> int:
+        """Get total number of living agents.
+        
+        Returns:
+            Total count
+        """
+        return sum(self._counts_by_kind)
+    
+    def _check_victory(self):
+        """Check if one faction has won."""
+        if self.game_over:
+            return
+        kinds_alive = [kind for kind, count in self.get_counts().items() if count > 0]
+        if len(kinds_alive) == 1:
+            self.game_over = True
+            self.winner_kind = kinds_alive[0]
+    
+    def close(self):
+        """Stop the workers and release shared memory."""
+        if not self._processes:
+            return
+        for conn in self._conns:
+            try:
+                conn.send(('stop',))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(2.0)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._conns:
+            conn.close()
+        self._processes = []
+        self._buffers.close()
+        self._buffers.unlink()
+        self._counts.close()
+        self._counts.unlink()
@@ -0,0 +1,84 @@
+"""Spatial indexing for neighbourhood queries."""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class SpatialGrid:
+    """Uniform grid of agents bucketed by position.
+    
+    Rebuilt from scratch each tick; building is O(n) and a radius query
+    only visits the cells overlapping the query circle's bounding box.
+    """
+    
+    def __init__(self, cell_size: float):
+        """Initialize an empty grid.
+        
+        Args:
+            cell_size: Width and height of a grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List] = {}
+        self.built_tick: Optional[int] = None  # Tick of the last rebuild (None = stale)
+    
+    def rebuild(self, agents: List, tick: Optional[int] = None):
+        """Replace the grid contents with the given living agents.
+        
+        Args:
+            agents: Agents to index
+            tick: Optional tick the positions belong to (stored as built_tick)
+        """
+        cells = {}
+        size = self.cell_size
+        for agent in agents:
+            if agent.alive:
+                key = (int(agent.pos.x // size), int(agent.pos.y // size))
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [agent]
+                else:
+                    bucket.append(agent)
+        self.cells = cells
+        self.built_tick = tick
+    
+    def query(self, x: float, y: float, radius: float) -> Iterator:
+        """Yield agents in cells overlapping a circle's bounding box.
+        
+        Callers filter by exact distance; this only prunes by cell.
+        
+        Args:
+            x: Circle center x
+            y: Circle center y
+            radius: Circle radius
+            
+        Yields:
+            Candidate agents
+        """
+        size = self.cell_size
+        cells = self.cells
+        min_cx, max_cx = int((x - radius) // size), int((x + radius) // size)
+        min_cy, max_cy = int((y - radius) // size), int((y + radius) // size)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+    
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> Iterator:
+        """Yield agents in cells overlapping a rectangle.
+        
+        Args:
+            x0: Left edge
+            y0: Top edge
+            x1: Right edge
+            y1: Bottom edge
+            
+        Yields:
+            Candidate agents
+        """
+        size = self.cell_size
+        cells = self.cells
+        for cx in range(int(x0 // size), int(x1 // size) + 1):
+            for cy in range(int(y0 // size), int(y1 // size) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
@@ -0,0 +1,185 @@
+"""Pure-Python 2D vector for the simulation core.
+
+A drop-in for the subset of ``pygame.Vector2`` the simulation uses, so
+the core runs without importing pygame. Operations are computed with the
+same formulas as pygame's, so runs give bit-identical results with
+either implementation.
+"""
+
+import math
+from typing import Iterator, Union
+
+_HALF_PI = math.pi / 2
+_EPSILON = 1e-6  # pygame's threshold for zero lengths and right-angle rotations
+_new = object.__new__
+
+
+def _vector(x: float, y: float) -> 'Vector2':
+    """Build a vector from floats, skipping __init__'s argument handling."""
+    vector = _new(Vector2)
+    vector.x = x
+    vector.y = y
+    return vector
+
+
+class Vector2:
+    """Mutable 2D vector with x and y components."""
+    
+    __slots__ = ('x', 'y')
+    
+    def __init__(self, x: Union[float, 'Vector2', tuple] = 0.0, y: float = None):
+        if y is None:
+            if isinstance(x, (int, float)):
+                self.x = self.y = float(x)
+            else:
+                self.x, self.y = float(x[0]), float(x[1])
+        else:
+            self.x = float(x)
+            self.y = float(y)
+    
+    def __repr__(self) -> str:
+        return f"Vector2({self.x}, {self.y})"
+    
+    def __iter__(self) -> Iterator[float]:
+        yield self.x
+        yield self.y
+    
+    def __len__(self) -> int:
+        return 2
+    
+    def __getitem__(self, index: int) -> float:
+        if index == 0:
+            return self.x
+        if index == 1:
+            return self.y
+        return (self.x, self.y)[index]
+    
+    def __eq__(self, other) -> bool:
+        try:
+            return len(other) == 2 and self.x == other[0] and self.y == other[1]
+        except TypeError:
+            return NotImplemented
+    
+    __hash__ = None  # Mutable
+    
+    def __bool__(self) -> bool:
+        return self.x != 0 or self.y != 0
+    
+    def __add__(self, other) -> 'Vector2':
+        if other.__class__ is not Vector2:
+            other = Vector2(other)
+        return _vector(self.x + other.x, self.y + other.y)
+    
+    __radd__ = __add__
+    
+    def __sub__(self, other) -> 'Vector2':
+        if other.__class__ is not Vector2:
+            other = Vector2(other)
+        return _vector(self.x - other.x, self.y - other.y)
+    
+    def __rsub__(self, other) -> 'Vector2':
+        other = Vector2(other)
+        return _vector(other.x - self.x, other.y - self.y)
+    
+    def __mul__(self, scalar: float) -> 'Vector2':
+        return _vector(self.x * scalar, self.y * scalar)
+    
+    __rmul__ = __mul__
+    
+    def __truediv__(self, scalar: float) -> 'Vector2':
+        return _vector(self.x / scalar, self.y / scalar)
+    
+    def __neg__(self) -> 'Vector2':
+        return _vector(-self.x, -self.y)
+    
+    def __iadd__(self, other) -> 'Vector2':
+        if other.__class__ is not Vector2:
+            other = Vector2(other)
+        self.x += other.x
+        self.y += other.y
+        return self
+    
+    def __isub__(self, other) -> 'Vector2':
+        if other.__class__ is not Vector2:
+            other = Vector2(other)
+        self.x -= other.x
+        self.y -= other.y
+        return self
+    
+    def __imul__(self, scalar: float) -> 'Vector2':
+        self.x *= scalar
+        self.y *= scalar
+        return self
+    
+    def copy(self) -> 'Vector2':
+        return _vector(self.x, self.y)
+    
+    def update(self, x: Union[float, 'Vector2', tuple] = 0.0, y: float = None):
+        """Set both components in place."""
+        if y is None:
+            x, y = x
+        self.x = float(x)
+        self.y = float(y)
+    
+    def dot(self, other) -> float:
+        if other.__class__ is not Vector2:
+            other = Vector2(other)
+        return self.x * other.x + self.y * other.y
+    
+    def length(self) -> float:
+        return math.sqrt(self.x * self.x + self.y * self.y)
+    
+    def length_squared(self) -> float:
+        return self.x * self.x + self.y * self.y
+    
+    def distance_squared_to(self, other) -> float:
+        if other.__class__ is not Vector2:
+            other = Vector2(other)
+        dx = other.x - self.x
+        dy = other.y - self.y
+        return dx * dx + dy * dy
+    
+    def distance_to(self, other) -> float:
+        return math.sqrt(self.distance_squared_to(other))
+    
+    def normalize(self) -> 'Vector2':
+        """Unit vector in the same direction.
+        
+        Raises:
+            ValueError: If the vector has zero length
+        """
+        length = math.sqrt(self.x * self.x + self.y * self.y)
+        if length == 0:
+            raise ValueError("Can't normalize Vector of length zero")
+        return _vector(self.x / length, self.y / length)
+    
+    def scale_to_length(self, new_length: float):
+        """Scale in place to the given length.
+        
+        Raises:
+            ValueError: If the vector has zero length
+        """
+        length = math.sqrt(self.x * self.x + self.y * self.y)
+        if length < _EPSILON:
+            raise ValueError("Cannot scale a vector with zero length")
+        fraction = new_length / length
+        self.x *= fraction
+        self.y *= fraction
+    
+    def rotate_rad(self, angle: float) -> 'Vector2':
+        """Copy rotated counterclockwise by an angle in radians."""
+        angle = math.fmod(angle, 2 * math.pi)
+        if angle < 0:
+            angle += 2 * math.pi
+        x, y = self.x, self.y
+        # Exact results for right angles, as pygame does
+        if abs(angle) < _EPSILON or abs(angle - 2 * math.pi) < _EPSILON:
+            return _vector(x, y)
+        if abs(angle - _HALF_PI) < _EPSILON:
+            return _vector(-y, x)
+        if abs(angle - math.pi) < _EPSILON:
+            return _vector(-x, -y)
+        if abs(angle - 3 * _HALF_PI) < _EPSILON:
+            return _vector(y, -x)
+        cos, sin = math.cos(angle), math.sin(angle)
+        return _vector(x * cos - y * sin, x * sin + y * cos)
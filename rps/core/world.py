@@ -1,26 +1,31 @@
 """World orchestration and simulation management."""
 
-import pygame
 import random
+import time
 from typing import List, Tuple, Optional, Dict
 from .agent import Agent
 from .factory import AgentFactory
 from .collision import CollisionResolver
-from .config import Config, KINDS
+from .spatial import SpatialGrid
+from .quadtree import PreyQuadtree
+from .parallel import ParallelStepper
+from .config import Config, KIND_CODES, KINDS
 
 
 class World:
     """Manages all agents and simulation state."""
     
-    def __init__(self, config: Config, logger=None):
+    def __init__(self, config: Config, logger=None, metrics=None):
         """Initialize the world.
         
         Args:
             config: Game configuration
             logger: Optional analysis logger
+            metrics: Optional SimulationMetrics for per-phase timings
         """
         self.config = config
         self.logger = logger
+        self.metrics = metrics
         self.rng = random.Random(config.seed)
         
         # Agent factory for creating all agents
@@ -28,11 +33,23 @@ class World:
         
         # Agent management
         self.agents: List[Agent] = []
-        self.by_kind: Dict[str, List[Agent]] = {kind: [] for kind in KINDS}
+        self.by_code: List[List[Agent]] = [[] for _ in KINDS]  # Living agents per kind code
         
         # Collision handling
         self.collision_resolver = CollisionResolver(config)
         
+        # Neighbourhood index for steering (rebuilt each tick when used)
+        cell_size = config.agent_detection_range if config.limited_vision else config.target_alert_radius
+        self.grid = SpatialGrid(cell_size=max(cell_size, 1.0))
+        
+        # Whole-arena prey index (maintained incrementally when used)
+        self.prey_tree = PreyQuadtree(*config.world_size)
+        
+        # Vectorized multi-threaded update (replaces per-agent updates when enabled)
+        self.stepper = None
+        if config.update_threads > 0:
+            self.stepper = ParallelStepper(config, config.update_threads)
+        
         # Simulation state
         self.tick = 0
         self.paused = False
@@ -45,6 +62,14 @@ class World:
         
         # Track all agents ever spawned (for victory scoreboard)
         self.all_agents_history = []
+        
+        # Pygame drawing, created by the first draw call
+        self.renderer = None
+    
+    @property
+    def by_kind(self) -> Dict[str, List[Agent]]:
+        """Living agents per kind name (the lists in by_code)."""
+        return dict(zip(KINDS, self.by_code))
     
     def spawn(
         self, 
@@ -69,7 +94,8 @@ class World:
         agent = self.factory.create_agent(kind, pos, vel)
         
         self.agents.append(agent)
-        self.by_kind[kind].append(agent)
+        self.by_code[agent.code].append(agent)
+        self.grid.built_tick = None
         self.all_agents_history.append(agent)  # Track for victory scoreboard
         
         # Log spawn event
@@ -88,26 +114,27 @@ class World:
         Returns:
             List of spawned agents
         """
-        spawned = []
-        for _ in range(count):
-            if len(self.agents) >= self.config.max_population:
-                break
-            
-            # Use factory to create agent at random position
-            agent = self.factory.create_random_agent(
-                kind, 
-                (self.config.screen_width, self.config.screen_height)
-            )
-            
-            self.agents.append(agent)
-            self.by_kind[kind].append(agent)
-            self.all_agents_history.append(agent)  # Track for victory scoreboard
-            
-            # Log spawn event
-            if self.logger:
+        count = min(count, self.config.max_population - len(self.agents))
+        if count <= 0:
+            return []
+        
+        if self.config.sequential_update:
+            # Legacy per-agent draws from the shared stream, so old seeds reproduce
+            spawned = [self.factory.create_random_agent(kind, self.config.world_size)
+                       for _ in range(count)]
+        else:
+            # Use factory to create all agents at random positions in one pass
+            spawned = self.factory.create_batch(kind, count, self.config.world_size)
+        
+        self.agents.extend(spawned)
+        self.by_code[KIND_CODES[kind]].extend(spawned)
+        self.grid.built_tick = None
+        self.all_agents_history.extend(spawned)  # Track for victory scoreboard
+        
+        # Log spawn events
+        if self.logger:
+            for agent in spawned:
                 self.logger.log_spawn(agent.id, agent.kind, agent.pos.x, agent.pos.y, self.tick)
-            
-            spawned.append(agent)
         
         return spawned
     
@@ -130,15 +157,30 @@ class World:
         if self.paused or self.game_over:
             return
         
-        # Update all living agents with steering behavior
-        for agent in self.agents:
-            if agent.alive:
-                # Pass all agents for steering behavior
-                # (agents will filter based on detection range)
-                agent.update(dt, self.agents if self.config.enable_steering else None)
+        metrics = self.metrics
+        if metrics:
+            start = time.perf_counter()
+        
+        # Remember where agents started for swept collision detection
+        start_positions = None
+        if self.config.continuous_collisions:
+            start_positions = {a.id: (a.pos.x, a.pos.y) for a in self.agents if a.alive}
+        
+        if self.stepper is not None:
+            self.stepper.step(self.agents, dt)
+        else:
+            self._update_agents(dt)
+        
+        if metrics:
+            steered = time.perf_counter()
+            metrics.observe_phase('steering', steered - start)
         
         # Detect and resolve collisions
-        self.resolve_collisions()
+        self.resolve_collisions(start_positions)
+        
+        if metrics:
+            collided = time.perf_counter()
+            metrics.observe_phase('collisions', collided - steered)
         
         # Remove dead agents
         self.remove_dead()
@@ -148,102 +190,144 @@ class World:
         
         # Increment tick
         self.tick += 1
+        
+        if metrics:
+            metrics.observe_phase('cleanup', time.perf_counter() - collided)
+            metrics.ticks.inc()
     
-    def resolve_collisions(self):
-        """Detect and resolve all collisions."""
+    def _update_agents(self, dt: float):
+        """Steer and move agents one at a time.
+        
+        By default the update is double-buffered: every agent plans its
+        move against the positions at the start of the tick and all moves
+        are committed together, so the outcome does not depend on list
+        order. ``config.sequential_update`` restores the legacy in-place
+        update, where later agents see earlier agents' new positions.
+        
+        Args:
+            dt: Time delta in seconds
+        """
+        # Persistent targets and limited vision check nearby prey through the grid
+        grid = None
+        if self.config.enable_steering and (self.config.target_reacquire_ticks > 1
+                                            or self.config.limited_vision):
+            self.grid.rebuild(self.agents, self.tick)
+            grid = self.grid
+        
+        # Nearest-prey queries against positions at the start of the tick
+        prey_index = None
+        if self.config.enable_steering and self.config.prey_search == 'quadtree':
+            self.prey_tree.sync(self.agents)
+            prey_index = self.prey_tree
+        
+        # Pass all agents for steering behavior
+        # (agents will filter based on detection range)
+        nearby = self.agents if self.config.enable_steering else None
+        
+        if self.config.sequential_update:
+            for agent in self.agents:
+                if agent.alive:
+                    agent.update(dt, nearby, self.tick, grid, prey_index)
+            return
+        
+        living = [a for a in self.agents if a.alive]
+        for agent in living:
+            agent.plan(dt, nearby, self.tick, grid, prey_index)
+        for agent in living:
+            agent.commit()
+    
+    def resolve_collisions(self, start_positions: Optional[Dict[int, Tuple[float, float]]] = None):
+        """Detect and resolve all collisions.
+        
+        Args:
+            start_positions: Optional agent id -> (x, y) before this step's
+                movement; enables swept (continuous) detection
+        """
         # Get all living agents
         living = [a for a in self.agents if a.alive]
         
         # Detect collisions
-        pairs = self.collision_resolver.detect_collisions(living, self.tick)
+        if start_positions is not None:
+            pairs = self.collision_resolver.detect_collisions_swept(living, start_positions, self.tick)
+            presorted = True  # Resolve in time-of-contact order
+        else:
+            pairs = self.collision_resolver.detect_collisions(living, self.tick)
+            presorted = False
         
         # Resolve collisions
-        self.collision_resolver.resolve_collisions(pairs, self.tick, self.logger)
+        self.collision_resolver.resolve_collisions(pairs, self.tick, self.logger, presorted)
     
     def remove_dead(self):
         """Remove dead agents from tracking lists."""
+        if len(self.prey_tree):
+            for agent in self.agents:
+                if not agent.alive:
+                    self.prey_tree.remove(agent)
+        
         # Filter out dead agents
         self.agents = [a for a in self.agents if a.alive]
         
-        # Update by_kind tracking
-        for kind in KINDS:
-            self.by_kind[kind] = [a for a in self.by_kind[kind] if a.alive]
+        # Update per-kind tracking
+        self.by_code = [[a for a in group if a.alive] for group in self.by_code]
     
-    def draw(self, surface: pygame.Surface):
-        """Draw all agents.
+    def draw(self, surface, camera=None) -> list:
+        """Draw all agents (see rps.ui.render.WorldRenderer).
         
         Args:
             surface: Pygame surface to draw on
+            camera: Optional Camera; only agents in its viewport are drawn
+            
+        Returns:
+            Screen rectangles drawn (for dirty-rectangle updates)
         """
-        for agent in self.agents:
-            if agent.alive:
-                agent.draw(surface)
-                
-                # Draw name if enabled
-                if self.config.show_names:
-                    self._draw_agent_name(surface, agent)
-        
-        # Draw debug info if enabled
-        if self.debug_mode:
-            self._draw_debug(surface)
+        if self.renderer is None:
+            # Imported here so the simulation runs without pygame
+            from ..ui.render import WorldRenderer
+            self.renderer = WorldRenderer(self)
+        return self.renderer.draw(surface, camera)
     
-    def _draw_agent_name(self, surface: pygame.Surface, agent):
-        """Draw agent name above sprite.
-        
-        Args:
-            surface: Surface to draw on
-            agent: Agent to draw name for
-        """
-        if not hasattr(self, '_name_font'):
-            self._name_font = pygame.font.Font(None, 16)
-        
-        # Render name
-        name_surface = self._name_font.render(agent.name, True, (255, 255, 255))
-        name_rect = name_surface.get_rect(center=(agent.pos.x, agent.pos.y - agent.radius - 10))
-        
-        # Draw semi-transparent background
-        bg_rect = name_rect.inflate(4, 2)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 180))
-        surface.blit(bg_surface, bg_rect.topleft)
+    def visible_agents(self, x0: float, y0: float, x1: float, y1: float) -> List[Agent]:
+        """Living agents whose positions lie inside a world rectangle.
         
-        # Draw name
-        surface.blit(name_surface, name_rect)
-    
-    def _draw_debug(self, surface: pygame.Surface):
-        """Draw debug information (collision radii, velocities, etc.).
+        Uses the spatial grid, reusing the one built for steering during
+        the last update when it is still current.
         
         Args:
-            surface: Pygame surface to draw on
+            x0: Left edge
+            y0: Top edge
+            x1: Right edge
+            y1: Bottom edge
+            
+        Returns:
+            Agents inside the rectangle
         """
-        for agent in self.agents:
-            if agent.alive:
-                # Draw collision circle
-                pygame.draw.circle(
-                    surface, 
-                    (255, 255, 255), 
-                    (int(agent.pos.x), int(agent.pos.y)), 
-                    agent.radius, 
-                    1
-                )
-                
-                # Draw velocity vector (only if moving)
-                if agent.vel.length() > 0:
-                    end_pos = agent.pos + agent.vel.normalize() * agent.radius * 2
-                    pygame.draw.line(
-                        surface,
-                        (0, 255, 0),
-                        (int(agent.pos.x), int(agent.pos.y)),
-                        (int(end_pos.x), int(end_pos.y)),
-                        2
-                    )
+        width, height = self.config.world_size
+        x0, y0 = max(x0, 0.0), max(y0, 0.0)
+        x1, y1 = min(x1, width), min(y1, height)
+        grid = self.grid
+        cells = ((x1 - x0) // grid.cell_size + 1) * ((y1 - y0) // grid.cell_size + 1)
+        if cells >= len(self.agents):
+            # Cheaper to scan every agent than every cell
+            candidates = self.agents
+        else:
+            # Built during the last update, agents have moved at most one
+            # step since; callers pad the rectangle by more than that
+            if grid.built_tick not in (self.tick, self.tick - 1):
+                grid.rebuild(self.agents, self.tick)
+            candidates = grid.query_rect(x0, y0, x1, y1)
+        return [
+            a for a in candidates
+            if a.alive and x0 <= a.pos.x <= x1 and y0 <= a.pos.y <= y1
+        ]
     
     def clear(self):
         """Remove all agents and reset game state."""
         self.agents.clear()
-        for kind in KINDS:
-            self.by_kind[kind].clear()
+        for group in self.by_code:
+            group.clear()
+        self.grid.built_tick = None
         self.all_agents_history.clear()
+        self.prey_tree.clear()
         
         # Reset victory state
         self.game_over = False
@@ -265,6 +349,8 @@ class World:
         
         # Recreate factory with new RNG
         self.factory = AgentFactory(self.config, self.rng)
+        if self.stepper is not None:
+            self.stepper.reseed(self.config.seed)
         
         self.tick = 0
         if self.logger:
@@ -276,7 +362,7 @@ class World:
         Returns:
             Dictionary mapping kind to count
         """
-        return {kind: len(agents) for kind, agents in self.by_kind.items()}
+        return dict(zip(KINDS, map(len, self.by_code)))
     
     def get_total_count(self) -> int:
         """Get total number of living agents.
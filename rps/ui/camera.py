@@ -0,0 +1,92 @@
+"""Pan/zoom camera mapping world coordinates to the screen."""
+
+from typing import Tuple
+
+
+class Camera:
+    """Viewport onto the arena.
+    
+    ``x``/``y`` are the world coordinates shown at the screen's top-left
+    corner and ``zoom`` is screen pixels per world unit.
+    """
+    
+    MAX_ZOOM = 4.0
+    
+    def __init__(self, view_size: Tuple[int, int], world_size: Tuple[int, int]):
+        """Initialize the camera centred on the world at zoom 1.
+        
+        Args:
+            view_size: Screen (width, height) in pixels
+            world_size: Arena (width, height)
+        """
+        self.view_width, self.view_height = view_size
+        self.world_width, self.world_height = world_size
+        self.zoom = 1.0
+        self.x = (self.world_width - self.view_width) / 2
+        self.y = (self.world_height - self.view_height) / 2
+        self._clamp()
+    
+    @property
+    def is_identity(self) -> bool:
+        """Whether world coordinates equal screen coordinates."""
+        return self.zoom == 1.0 and self.x == 0 and self.y == 0
+    
+    @property
+    def min_zoom(self) -> float:
+        """Zoom at which the whole world fits on screen (never above 1)."""
+        return min(1.0, self.view_width / self.world_width, self.view_height / self.world_height)
+    
+    def world_to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        """Convert a world position to screen pixels."""
+        return (x - self.x) * self.zoom, (y - self.y) * self.zoom
+    
+    def screen_to_world(self, sx: float, sy: float) -> Tuple[float, float]:
+        """Convert a screen position to world coordinates."""
+        return self.x + sx / self.zoom, self.y + sy / self.zoom
+    
+    def view_rect(self) -> Tuple[float, float, float, float]:
+        """Visible world area as (x0, y0, x1, y1)."""
+        return (self.x, self.y,
+                self.x + self.view_width / self.zoom, self.y + self.view_height / self.zoom)
+    
+    def pan(self, dx: float, dy: float):
+        """Move the view by a screen-space offset.
+        
+        Args:
+            dx: Horizontal offset in screen pixels
+            dy: Vertical offset in screen pixels
+        """
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self._clamp()
+    
+    def zoom_at(self, factor: float, screen_pos: Tuple[float, float]):
+        """Zoom by a factor, keeping the world point under screen_pos fixed.
+        
+        Args:
+            factor: Zoom multiplier (> 1 zooms in)
+            screen_pos: Screen position to zoom around
+        """
+        wx, wy = self.screen_to_world(*screen_pos)
+        self.zoom = max(self.min_zoom, min(self.MAX_ZOOM, self.zoom * factor))
+        self.x = wx - screen_pos[0] / self.zoom
+        self.y = wy - screen_pos[1] / self.zoom
+        self._clamp()
+    
+    def fit(self):
+        """Zoom out to show the whole world."""
+        self.zoom = self.min_zoom
+        self._clamp()
+    
+    def _clamp(self):
+        """Keep the view inside the world (centred if the world is smaller)."""
+        visible_w = self.view_width / self.zoom
+        visible_h = self.view_height / self.zoom
+        if visible_w >= self.world_width:
+            self.x = (self.world_width - visible_w) / 2
+        else:
+            self.x = min(max(self.x, 0.0), self.world_width - visible_w)
+        if visible_h >= self.world_height:
+            self.y = (self.world_height - visible_h) / 2
+        else:
+            self.y = min(max(self.y, 0.0), self.world_height - visible_h)
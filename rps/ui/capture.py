@@ -0,0 +1,149 @@
+"""Non-blocking frame capture to a PNG sequence or raw video stream."""
+
+import json
+import multiprocessing
+import os
+import queue
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+import numpy as np
+import pygame
+
+FORMATS = ('png', 'raw')
+
+
+def _write_frames(shm_name: str, slots: int, size: Tuple[int, int], fmt: str,
+                  directory: str, tasks, done):
+    """Writer process: encode frames from shared-memory slots until told to stop."""
+    width, height = size
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray((slots, height, width, 3), dtype=np.uint8, buffer=shm.buf)
+    raw = open(os.path.join(directory, 'frames.rgb'), 'wb') if fmt == 'raw' else None
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            slot, number = task
+            if raw is not None:
+                raw.write(frames[slot].data)
+            else:
+                image = pygame.image.frombuffer(frames[slot], size, 'RGB')
+                pygame.image.save(image, os.path.join(directory, f"frame_{number:06d}.png"))
+            done.put(slot)
+    finally:
+        if raw is not None:
+            raw.close()
+        del frames
+        shm.close()
+
+
+class FrameRecorder:
+    """Copies frames into shared memory for a writer process to encode.
+    
+    The game loop's cost per frame is one copy of the display surface's
+    pixels (through ``pygame.surfarray``) into a free slot. Encoding and
+    disk I/O happen in a separate process, so they never hold the game's
+    GIL. When every slot is still waiting to be written the frame is
+    dropped and counted instead of stalling the loop.
+    """
+    
+    def __init__(self, size: Tuple[int, int], directory: str = "captures", fmt: str = "png",
+                 slots: int = 8, fps: Optional[float] = None):
+        """Start the writer process.
+        
+        Args:
+            size: Frame (width, height)
+            directory: Parent directory; each recording gets a timestamped subdirectory
+            fmt: 'png' for a PNG sequence, 'raw' for one rgb24 stream (frames.rgb)
+            slots: Frames that may wait for the writer before new ones are dropped
+            fps: Nominal frame rate, recorded in the raw stream's metadata
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown capture format: {fmt}. Valid formats: {list(FORMATS)}")
+        self.size = size
+        self.fmt = fmt
+        self.directory = os.path.join(directory, datetime.now().strftime("capture_%Y%m%d_%H%M%S"))
+        os.makedirs(self.directory, exist_ok=True)
+        if fmt == 'raw':
+            width, height = size
+            with open(os.path.join(self.directory, 'frames.json'), 'w') as f:
+                json.dump({'width': width, 'height': height, 'pixel_format': 'rgb24', 'fps': fps}, f)
+        
+        self.captured = 0
+        self.dropped = 0
+        self.slots = slots
+        width, height = size
+        self._shm = shared_memory.SharedMemory(create=True, size=slots * height * width * 3)
+        self._frames = np.ndarray((slots, height, width, 3), dtype=np.uint8, buffer=self._shm.buf)
+        self._free = list(range(slots))
+        
+        # Spawn (not fork) so the child never inherits pygame/SDL state
+        context = multiprocessing.get_context('spawn')
+        self._tasks = context.Queue()
+        self._done = context.Queue()
+        self.process = context.Process(
+            target=_write_frames,
+            args=(self._shm.name, slots, size, fmt, self.directory, self._tasks, self._done),
+            daemon=True
+        )
+        self.process.start()
+    
+    def capture(self, surface: pygame.Surface) -> bool:
+        """Queue the surface's current contents for writing.
+        
+        Args:
+            surface: Surface to capture (normally the display)
+            
+        Returns:
+            True if queued, False if the frame was dropped
+        """
+        self._reclaim()
+        if not self._free:
+            self.dropped += 1
+            return False
+        slot = self._free.pop()
+        pixels = pygame.surfarray.pixels3d(surface)  # (x, y, rgb) view, no copy
+        np.copyto(self._frames[slot], pixels.transpose(1, 0, 2))
+        del pixels  # Unlock the surface
+        self._tasks.put((slot, self.captured))
+        self.captured += 1
+        return True
+    
+    def _reclaim(self):
+        """Take back slots the writer has finished with."""
+        try:
+            while True:
+                self._free.append(self._done.get_nowait())
+        except queue.Empty:
+            pass
+    
+    @property
+    def pending(self) -> int:
+        """Frames queued but not yet written (0 once closed)."""
+        if self.process is None:
+            return 0
+        self._reclaim()
+        return self.slots - len(self._free)
+    
+    def close(self, timeout: Optional[float] = 30.0) -> Tuple[int, int]:
+        """Write the remaining frames and stop the writer.
+        
+        Args:
+            timeout: Seconds to wait for the writer to finish
+            
+        Returns:
+            (frames captured, frames dropped)
+        """
+        if self.process is None:
+            return self.captured, self.dropped
+        self._tasks.put(None)
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process = None
+        del self._frames
+        self._shm.close()
+        self._shm.unlink()
+        return self.captured, self.dropped
@@ -0,0 +1,83 @@
+"""Dirty-rectangle presentation for software-rendered displays."""
+
+import pygame
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class DirtyRectRenderer:
+    """Erases and presents only the screen regions that changed.
+    
+    Every frame the caller draws onto the screen and hands over the
+    rectangles it touched. The renderer remembers them so the next frame
+    can erase exactly those regions back to the background, then presents
+    the previous and current rectangles with ``pygame.display.update``.
+    Anything not covered by either list is unchanged on screen. When the
+    dirty area grows past ``threshold`` of the screen (crowded arenas,
+    full-screen overlays) a single ``pygame.display.flip`` is cheaper and
+    is used instead.
+    """
+    
+    # Cached background tiles (one per distinct rect size)
+    MAX_TILES = 256
+    
+    def __init__(self, surface: pygame.Surface, background: Tuple[int, int, int], threshold: float = 0.5):
+        """Initialize the renderer.
+        
+        Args:
+            surface: Display surface
+            background: Background fill color
+            threshold: Dirty fraction of the screen above which to flip
+        """
+        self.surface = surface
+        self.background = background
+        self.threshold = threshold
+        self._previous: List[pygame.Rect] = []
+        self._tiles: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._full = True
+        self.last_full = True  # Whether the last present was a full flip
+    
+    def invalidate(self):
+        """Repaint and present the whole screen on the next frame."""
+        self._full = True
+    
+    def begin(self):
+        """Erase last frame's drawing (call before drawing a frame)."""
+        if self._full:
+            self.surface.fill(self.background)
+            return
+        # Blitting a pre-filled tile is much cheaper than a per-rect fill
+        tiles = self._tiles
+        if len(tiles) > self.MAX_TILES:
+            tiles.clear()
+        blit = self.surface.blit
+        for rect in self._previous:
+            tile = tiles.get(rect.size)
+            if tile is None:
+                tile = tiles[rect.size] = pygame.Surface(rect.size).convert(self.surface)
+                tile.fill(self.background)
+            blit(tile, rect)
+    
+    def present(self, drawn: Sequence[Optional[pygame.Rect]]):
+        """Show the frame.
+        
+        Args:
+            drawn: Rectangles drawn this frame (None entries are ignored)
+        """
+        bounds = self.surface.get_rect()
+        current = [bounds.clip(rect) for rect in drawn if rect]
+        current = [rect for rect in current if rect.width and rect.height]
+        
+        full = self._full
+        if not full:
+            dirty = self._previous + current
+            # Overlaps are counted twice, which only makes flips a little likelier
+            area = sum(rect.width * rect.height for rect in dirty)
+            full = area > self.threshold * bounds.width * bounds.height
+        if full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
+        
+        self._previous = current
+        self._full = False
+        self.last_full = full
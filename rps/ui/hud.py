@@ -1,7 +1,8 @@
 """HUD overlay for displaying game information."""
 
+import numpy as np
 import pygame
-from typing import Dict
+from typing import Dict, List
 
 
 class HUD:
@@ -19,6 +20,8 @@ class HUD:
         self.font_large = None
         self.font_small = None
         self.font_tiny = None
+        self._history_panel = None
+        self._history_key = None
         
     def initialize_fonts(self):
         """Initialize pygame fonts (must be called after pygame.init())."""
@@ -36,7 +39,7 @@ class HUD:
         paused: bool,
         debug_mode: bool,
         tick: int
-    ):
+    ) -> List[pygame.Rect]:
         """Draw the HUD overlay.
         
         Args:
@@ -48,10 +51,14 @@ class HUD:
             paused: Whether game is paused
             debug_mode: Whether debug mode is enabled
             tick: Current game tick
+            
+        Returns:
+            Screen rectangles drawn
         """
         if self.font_large is None:
             self.initialize_fonts()
         
+        drawn = []
         x, y = 10, 10
         line_height = 30
         
@@ -59,11 +66,11 @@ class HUD:
         info_height = 240
         bg_surface = pygame.Surface((320, info_height), pygame.SRCALPHA)
         bg_surface.fill((0, 0, 0, 180))
-        surface.blit(bg_surface, (5, 5))
+        drawn.append(surface.blit(bg_surface, (5, 5)))
         
         # Title
         text = self.font_large.render("RPS World", True, (255, 255, 255))
-        surface.blit(text, (x, y))
+        drawn.append(surface.blit(text, (x, y)))
         y += 40
         
         # Agent counts with colors
@@ -72,95 +79,172 @@ class HUD:
         scissors_color = self.config.color_scissors
         
         text = self.font_small.render(f"{self.language.get('rock')}:", True, (200, 200, 200))
-        surface.blit(text, (x, y))
+        drawn.append(surface.blit(text, (x, y)))
         count_text = self.font_small.render(f"{counts.get('rock', 0)}", True, rock_color)
-        surface.blit(count_text, (x + 100, y))
+        drawn.append(surface.blit(count_text, (x + 100, y)))
         y += line_height
         
         text = self.font_small.render(f"{self.language.get('paper')}:", True, (200, 200, 200))
-        surface.blit(text, (x, y))
+        drawn.append(surface.blit(text, (x, y)))
         count_text = self.font_small.render(f"{counts.get('paper', 0)}", True, paper_color)
-        surface.blit(count_text, (x + 100, y))
+        drawn.append(surface.blit(count_text, (x + 100, y)))
         y += line_height
         
         text = self.font_small.render(f"{self.language.get('scissors')}:", True, (200, 200, 200))
-        surface.blit(text, (x, y))
+        drawn.append(surface.blit(text, (x, y)))
         count_text = self.font_small.render(f"{counts.get('scissors', 0)}", True, scissors_color)
-        surface.blit(count_text, (x + 100, y))
+        drawn.append(surface.blit(count_text, (x + 100, y)))
         y += line_height
         
         # Total
         total = sum(counts.values())
         text = self.font_small.render(f"{self.language.get('total')}: {total}", True, (255, 255, 255))
-        surface.blit(text, (x, y))
+        drawn.append(surface.blit(text, (x, y)))
         y += line_height
         
         # Stats
         text = self.font_small.render(f"{self.language.get('collisions')}: {total_interactions}", True, (200, 200, 200))
-        surface.blit(text, (x, y))
+        drawn.append(surface.blit(text, (x, y)))
         y += line_height
         
         text = self.font_small.render(f"FPS: {fps:.1f}", True, (200, 200, 200))
-        surface.blit(text, (x, y))
+        drawn.append(surface.blit(text, (x, y)))
         y += line_height
         
         text = self.font_small.render(f"{self.language.get('seed')}: {seed}", True, (200, 200, 200))
-        surface.blit(text, (x, y))
+        drawn.append(surface.blit(text, (x, y)))
         y += line_height
         
         # Status indicators
         if paused:
             pause_text = self.font_large.render(self.language.get('paused'), True, (255, 255, 0))
             text_rect = pause_text.get_rect(center=(surface.get_width() // 2, 50))
-            surface.blit(pause_text, text_rect)
+            drawn.append(surface.blit(pause_text, text_rect))
         
         if debug_mode:
             debug_text = self.font_small.render(self.language.get('debug'), True, (0, 255, 0))
-            surface.blit(debug_text, (surface.get_width() - 80, 10))
+            drawn.append(surface.blit(debug_text, (surface.get_width() - 80, 10)))
         
         # Show steering status
         steering_status = self.language.get('hunt_on') if self.config.enable_steering else self.language.get('hunt_off')
         steering_color = (0, 255, 0) if self.config.enable_steering else (255, 100, 100)
         steering_text = self.font_small.render(steering_status, True, steering_color)
-        surface.blit(steering_text, (surface.get_width() - 180, 40))
+        drawn.append(surface.blit(steering_text, (surface.get_width() - 180, 40)))
         
         # Show names status
         names_status = self.language.get('names_on') if self.config.show_names else self.language.get('names_off')
         names_color = (0, 255, 0) if self.config.show_names else (255, 100, 100)
         names_text = self.font_small.render(names_status, True, names_color)
-        surface.blit(names_text, (surface.get_width() - 180, 70))
+        drawn.append(surface.blit(names_text, (surface.get_width() - 180, 70)))
         
         # Show language
         lang_text = self.font_small.render(self.language.get('language'), True, (200, 200, 200))
-        surface.blit(lang_text, (surface.get_width() - 180, 100))
+        drawn.append(surface.blit(lang_text, (surface.get_width() - 180, 100)))
         
         # Controls help (bottom)
-        self._draw_controls(surface)
+        drawn.extend(self._draw_controls(surface))
+        return drawn
     
-    def _draw_controls(self, surface: pygame.Surface):
+    def _draw_controls(self, surface: pygame.Surface) -> List[pygame.Rect]:
         """Draw controls help at the bottom of the screen.
         
         Args:
             surface: Surface to draw on
+            
+        Returns:
+            Screen rectangles drawn
         """
         help_lines = [
             self.language.get('controls_line1'),
             self.language.get('controls_line2')
         ]
         
+        drawn = []
         y = surface.get_height() - 60
         for line in help_lines:
             text = self.font_tiny.render(line, True, (180, 180, 180))
-            surface.blit(text, (10, y))
+            drawn.append(surface.blit(text, (10, y)))
             y += 20
+        return drawn
     
-    def draw_message(self, surface: pygame.Surface, message: str, duration: float = 2.0):
+    def draw_history(self, surface: pygame.Surface, series, refresh_ticks: int = 5) -> List[pygame.Rect]:
+        """Draw the population sparkline panel (top right).
+        
+        The panel is re-rendered at most every ``refresh_ticks`` recorded
+        ticks and blitted from a cached surface otherwise.
+        
+        Args:
+            surface: Surface to draw on
+            series: PopulationSeries to plot
+            refresh_ticks: Recorded ticks between re-renders
+            
+        Returns:
+            Screen rectangles drawn
+        """
+        key = (series.generation, series.samples // refresh_ticks)
+        if key != self._history_key:
+            self._history_key = key
+            self._history_panel = self._render_history(series, 240, 80)
+        position = (surface.get_width() - self._history_panel.get_width() - 10, 130)
+        return [surface.blit(self._history_panel, position)]
+    
+    def _render_history(self, series, width: int, height: int) -> pygame.Surface:
+        """Render population per kind over the whole run as line graphs.
+        
+        Args:
+            series: PopulationSeries to plot
+            width: Panel width
+            height: Panel height
+            
+        Returns:
+            Panel surface
+        """
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        rows = series.series(series.covering_tier())
+        if len(rows) < 2:
+            return panel
+        
+        # At most one point per pixel column
+        plot_width = width - 8
+        if len(rows) > plot_width:
+            rows = rows[np.linspace(0, len(rows) - 1, plot_width).astype(np.intp)]
+        counts = rows[:, 1:-1]
+        peak = max(1, int(counts.max()))
+        xs = np.linspace(4, width - 4, len(rows))
+        for column, kind in enumerate(series.kinds):
+            ys = height - 4 - counts[:, column] * ((height - 8) / peak)
+            color = getattr(self.config, f'color_{kind}', (255, 255, 255))
+            pygame.draw.lines(panel, color, False, np.column_stack((xs, ys)).tolist())
+        return panel
+    
+    def draw_recording(self, surface: pygame.Surface, captured: int, dropped: int) -> List[pygame.Rect]:
+        """Draw the recording indicator with frame counts (top centre).
+        
+        Args:
+            surface: Surface to draw on
+            captured: Frames captured so far
+            dropped: Frames dropped because the writer fell behind
+            
+        Returns:
+            Screen rectangles drawn
+        """
+        text = f"REC {captured}"
+        if dropped:
+            text += f" ({dropped} {self.language.get('dropped')})"
+        rendered = self.font_small.render(text, True, (255, 60, 60))
+        return [surface.blit(rendered, rendered.get_rect(midtop=(surface.get_width() // 2, 80)))]
+    
+    def draw_message(self, surface: pygame.Surface, message: str, duration: float = 2.0) -> List[pygame.Rect]:
         """Draw a temporary message on screen.
         
         Args:
             surface: Surface to draw on
             message: Message text
             duration: How long to show (unused here, managed by caller)
+            
+        Returns:
+            Screen rectangles drawn
         """
         if self.font_small is None:
             self.initialize_fonts()
@@ -175,6 +259,7 @@ class HUD:
         x = (surface.get_width() - bg_width) // 2
         y = surface.get_height() - 120
         
-        surface.blit(bg_surface, (x, y))
+        drawn = [surface.blit(bg_surface, (x, y))]
         surface.blit(text, (x + 10, y + 5))
+        return drawn
 
@@ -0,0 +1,228 @@
+"""Pygame rendering of a World.
+
+The simulation core never imports pygame; ``World.draw`` creates a
+WorldRenderer on first use, so only processes that draw pay for it.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import pygame
+from ..core.agent import Agent
+
+# Sprites are never modified after creation, so agents share them
+_sprites: Dict[Tuple[int, int, Tuple[int, int, int]], pygame.Surface] = {}
+
+
+def agent_sprite(agent: Agent) -> pygame.Surface:
+    """Shared sprite for an agent's kind, radius and color.
+    
+    Args:
+        agent: Agent to draw
+        
+    Returns:
+        Sprite surface (do not modify)
+    """
+    key = (agent.code, agent.radius, agent.color)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        sprite = _sprites[key] = _create_sprite(*key)
+    return sprite
+
+
+def _create_sprite(code: int, radius: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Create a sprite for an agent's kind code."""
+    from ..assets.sprites import create_rock_sprite, create_paper_sprite, create_scissors_sprite
+    
+    # Indexed by kind code (order of KINDS)
+    builders = (create_rock_sprite, create_paper_sprite, create_scissors_sprite)
+    return builders[code](radius, color)
+
+
+def draw_agent(surface: pygame.Surface, agent: Agent) -> Optional[pygame.Rect]:
+    """Draw an agent's sprite centred on its position.
+    
+    Args:
+        surface: Pygame surface to draw on
+        agent: Agent to draw
+        
+    Returns:
+        Screen rectangle drawn, or None if the agent is dead
+    """
+    if not agent.alive:
+        return None
+    sprite = agent_sprite(agent)
+    return surface.blit(sprite, sprite.get_rect(center=(int(agent.pos.x), int(agent.pos.y))))
+
+
+class WorldRenderer:
+    """Draws a World's agents, names and debug overlay."""
+    
+    def __init__(self, world):
+        """Initialize the renderer.
+        
+        Args:
+            world: World to draw
+        """
+        self.world = world
+        self._name_font = None
+        self._scaled_zoom = None
+        self._scaled_sprites: Dict[int, pygame.Surface] = {}
+    
+    def draw(self, surface: pygame.Surface, camera=None) -> List[pygame.Rect]:
+        """Draw all agents.
+        
+        Args:
+            surface: Pygame surface to draw on
+            camera: Optional Camera; only agents in its viewport are drawn
+            
+        Returns:
+            Screen rectangles drawn (for dirty-rectangle updates)
+        """
+        if camera is not None and not camera.is_identity:
+            return self._draw_view(surface, camera)
+        
+        world = self.world
+        drawn = []
+        for agent in world.agents:
+            if agent.alive:
+                drawn.append(draw_agent(surface, agent))
+                
+                # Draw name if enabled
+                if world.config.show_names:
+                    drawn.append(self._draw_agent_name(surface, agent))
+        
+        # Draw debug info if enabled
+        if world.debug_mode:
+            drawn.extend(self._draw_debug(surface))
+        return drawn
+    
+    def _draw_view(self, surface: pygame.Surface, camera) -> List[pygame.Rect]:
+        """Draw the agents inside a camera's viewport, scaled by its zoom.
+        
+        Args:
+            surface: Pygame surface to draw on
+            camera: Camera mapping world to screen
+            
+        Returns:
+            Screen rectangles drawn
+        """
+        world = self.world
+        x0, y0, x1, y1 = camera.view_rect()
+        pad = world.grid.cell_size + 40  # Sprite size, name label and one step of movement
+        visible = world.visible_agents(x0 - pad, y0 - pad, x1 + pad, y1 + pad)
+        
+        zoom = camera.zoom
+        if self._scaled_zoom != zoom:
+            self._scaled_zoom = zoom
+            self._scaled_sprites = {}
+        scaled = self._scaled_sprites
+        show_names = world.config.show_names and zoom >= 0.5
+        
+        drawn = []
+        for agent in visible:
+            sx = (agent.pos.x - camera.x) * zoom
+            sy = (agent.pos.y - camera.y) * zoom
+            radius = agent.radius * zoom
+            if radius < 1.5:
+                # Too small for a sprite: draw a dot
+                drawn.append(surface.fill(agent.color, (int(sx), int(sy), 2, 2)))
+                continue
+            
+            original = agent_sprite(agent)
+            sprite = scaled.get(id(original))
+            if sprite is None:
+                if zoom == 1.0:
+                    sprite = original
+                else:
+                    width, height = original.get_size()
+                    sprite = pygame.transform.scale(
+                        original, (max(1, round(width * zoom)), max(1, round(height * zoom)))
+                    )
+                scaled[id(original)] = sprite
+            drawn.append(surface.blit(sprite, sprite.get_rect(center=(int(sx), int(sy)))))
+            
+            if show_names:
+                drawn.append(self._draw_agent_name(surface, agent, (sx, sy - radius - 10)))
+        
+        if world.debug_mode:
+            drawn.extend(self._draw_debug(surface, visible, camera))
+        
+        # Arena border, as four edges so dirty rectangles stay thin
+        left, top = camera.world_to_screen(0, 0)
+        width, height = world.config.world_size
+        left, top = int(left), int(top)
+        width, height = int(width * zoom), int(height * zoom)
+        for edge in ((left, top, width, 1), (left, top + height - 1, width, 1),
+                     (left, top, 1, height), (left + width - 1, top, 1, height)):
+            drawn.append(surface.fill((90, 90, 110), edge))
+        return drawn
+    
+    def _draw_agent_name(self, surface: pygame.Surface, agent, center: Optional[Tuple[float, float]] = None):
+        """Draw agent name above sprite.
+        
+        Args:
+            surface: Surface to draw on
+            agent: Agent to draw name for
+            center: Optional screen position of the label (defaults to above the agent)
+            
+        Returns:
+            Screen rectangle covered by the label
+        """
+        if self._name_font is None:
+            self._name_font = pygame.font.Font(None, 16)
+        
+        # Render name
+        name_surface = self._name_font.render(agent.name, True, (255, 255, 255))
+        if center is None:
+            center = (agent.pos.x, agent.pos.y - agent.radius - 10)
+        name_rect = name_surface.get_rect(center=center)
+        
+        # Draw semi-transparent background
+        bg_rect = name_rect.inflate(4, 2)
+        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
+        bg_surface.fill((0, 0, 0, 180))
+        drawn = surface.blit(bg_surface, bg_rect.topleft)
+        
+        # Draw name
+        surface.blit(name_surface, name_rect)
+        return drawn
+    
+    def _draw_debug(self, surface: pygame.Surface, agents: Optional[List[Agent]] = None,
+                    camera=None) -> List[pygame.Rect]:
+        """Draw debug information (collision radii, velocities, etc.).
+        
+        Args:
+            surface: Pygame surface to draw on
+            agents: Agents to annotate (all if None)
+            camera: Optional Camera mapping world to screen
+            
+        Returns:
+            Screen rectangles drawn
+        """
+        drawn = []
+        zoom = camera.zoom if camera else 1.0
+        for agent in (self.world.agents if agents is None else agents):
+            if agent.alive:
+                pos = pygame.Vector2(agent.pos.x, agent.pos.y)
+                if camera:
+                    pos = pygame.Vector2(camera.world_to_screen(pos.x, pos.y))
+                
+                # Draw collision circle
+                drawn.append(pygame.draw.circle(
+                    surface,
+                    (255, 255, 255),
+                    (int(pos.x), int(pos.y)),
+                    max(1, int(agent.radius * zoom)),
+                    1
+                ))
+                
+                # Draw velocity vector (only if moving)
+                if agent.vel.length() > 0:
+                    end_pos = pos + pygame.Vector2(agent.vel.normalize()) * agent.radius * 2 * zoom
+                    drawn.append(pygame.draw.line(
+                        surface,
+                        (0, 255, 0),
+                        (int(pos.x), int(pos.y)),
+                        (int(end_pos.x), int(end_pos.y)),
+                        2
+                    ))
+        return drawn
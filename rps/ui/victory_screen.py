@@ -29,13 +29,16 @@ class VictoryScreen:
         surface: pygame.Surface, 
         winner_kind: str,
         scoreboard: List[Tuple[str, int]]
-    ):
+    ) -> List[pygame.Rect]:
         """Draw the victory screen.
         
         Args:
             surface: Surface to draw on
             winner_kind: Winning faction ('rock', 'paper', or 'scissors')
             scoreboard: List of (name, kills) tuples
+            
+        Returns:
+            Screen rectangles drawn (the overlay covers the whole surface)
         """
         if self.font_title is None:
             self.initialize_fonts()
@@ -43,7 +46,7 @@ class VictoryScreen:
         # Semi-transparent overlay
         overlay = pygame.Surface((surface.get_width(), surface.get_height()), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 200))
-        surface.blit(overlay, (0, 0))
+        drawn = [surface.blit(overlay, (0, 0))]
         
         # Winner announcement
         winner_text = f"{self.language.get(winner_kind + 's').upper()} {self.language.get('win').upper()}"
@@ -100,6 +103,7 @@ class VictoryScreen:
         instructions = self.font_scoreboard.render(self.language.get('press_c'), True, (255, 255, 100))
         inst_rect = instructions.get_rect(center=(surface.get_width() // 2, surface.get_height() - 50))
         surface.blit(instructions, inst_rect)
+        return drawn
     
     def _get_rank_color(self, rank: int) -> Tuple[int, int, int]:
         """Get color for rank.
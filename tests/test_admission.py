@@ -0,0 +1,70 @@
+"""Tests for spawn API rate limiting and admission control."""
+
+import unittest
+from rps.api.admission import AdmissionController, RateLimiter, TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test token bucket refill and retry hints."""
+    
+    def test_burst_then_throttle(self):
+        """Test that a full bucket allows a burst, then throttles."""
+        bucket = TokenBucket(rate=2.0, burst=3, now=0.0)
+        
+        self.assertEqual([bucket.acquire(0.0) for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.acquire(0.0), 0.5)
+    
+    def test_refill(self):
+        """Test that tokens accumulate over time up to the burst size."""
+        bucket = TokenBucket(rate=2.0, burst=2, now=0.0)
+        bucket.acquire(0.0)
+        bucket.acquire(0.0)
+        
+        self.assertEqual(bucket.acquire(0.5), 0.0)
+        self.assertTrue(bucket.is_full(10.0))
+        self.assertEqual(bucket.tokens, 2)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test per-client rate limiting."""
+    
+    def test_clients_are_independent(self):
+        """Test that one client's burst does not affect another."""
+        limiter = RateLimiter(rate=1.0, burst=1)
+        
+        self.assertEqual(limiter.acquire('a', now=0.0), 0.0)
+        self.assertGreater(limiter.acquire('a', now=0.0), 0.0)
+        self.assertEqual(limiter.acquire('b', now=0.0), 0.0)
+    
+    def test_idle_buckets_are_swept(self):
+        """Test that refilled buckets are forgotten."""
+        limiter = RateLimiter(rate=1.0, burst=1)
+        limiter.SWEEP_INTERVAL = 2
+        
+        limiter.acquire('a', now=0.0)
+        limiter.acquire('b', now=100.0)
+        
+        self.assertEqual(limiter.client_count(), 1)
+
+
+class TestAdmissionController(unittest.TestCase):
+    """Test population-based admission."""
+    
+    def test_capacity_uses_published_population_and_queue(self):
+        """Test rejection once population plus queued spawns reach the cap."""
+        admission = AdmissionController(max_population=10, rate=0, burst=0)
+        admission.publish(population=8, max_population=10)
+        
+        self.assertIsNone(admission.check_capacity(queued=1))
+        self.assertEqual(admission.check_capacity(queued=2), (8, 10))
+    
+    def test_rate_limit_disabled(self):
+        """Test that a zero rate disables rate limiting."""
+        admission = AdmissionController(max_population=10, rate=0, burst=0)
+        
+        self.assertEqual(admission.check_rate('a', now=0.0), 0.0)
+        self.assertEqual(admission.check_rate('a', now=0.0), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ import unittest
 import random
 import pygame
 from rps.core.agent import Agent, Rock, Paper, Scissors
-from rps.core.config import Config
+from rps.core.config import BEATS, KINDS, PAYOFF, Config
 
 
 class TestAgent(unittest.TestCase):
@@ -67,6 +67,38 @@ class TestAgent(unittest.TestCase):
         self.assertEqual(rock1.compare(rock2), 0)  # Tie
         self.assertEqual(rock2.compare(rock1), 0)  # Tie
     
+    def test_payoff_matrix_matches_beats(self):
+        """Test the payoff matrix agrees with BEATS for every pair of kinds."""
+        for a, first in enumerate(KINDS):
+            for b, second in enumerate(KINDS):
+                expected = 1 if BEATS[first] == second else -1 if BEATS[second] == first else 0
+                self.assertEqual(PAYOFF[a][b], expected)
+    
+    def test_kind_codes_and_table(self):
+        """Test agents carry their kind code and per-kind parameters match the config."""
+        scissors = Scissors((100, 100), None, self.config, self.rng)
+        table = self.config.kind_table
+        
+        self.assertEqual(KINDS[scissors.code], 'scissors')
+        self.assertEqual(table.radius[scissors.code], self.config.agent_radius_scissors)
+        self.assertEqual(table.color[scissors.code], self.config.color_scissors)
+        low, high = table.speed[scissors.code]
+        self.assertTrue(low <= scissors.vel.length() <= high)
+    
+    def test_kind_table_follows_config_changes(self):
+        """Test per-kind fields changed after agents exist are used from then on."""
+        rock = Rock((100, 100), None, self.config, self.rng)
+        self.config.agent_speed_rock = (500, 500)
+        self.config.agent_radius_rock = 30
+        
+        self.assertEqual(rock._get_random_speed(), 500)
+        self.assertEqual(self.config.kind_table.radius[rock.code], 30)
+    
+    def test_unknown_kind_rejected(self):
+        """Test an agent cannot be created with a kind outside KINDS."""
+        with self.assertRaises(ValueError):
+            Agent('lizard', (100, 100), None, 10, (0, 200, 0), self.config, self.rng)
+    
     def test_collision_detection_touching(self):
         """Test collision detection for touching agents."""
         rock = Rock((100, 100), None, self.config, self.rng)
@@ -126,6 +158,102 @@ class TestAgent(unittest.TestCase):
         self.assertEqual(len(ids), 3)  # All unique
 
 
+class TestTargetPersistence(unittest.TestCase):
+    """Test periodic target re-acquisition."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame for tests."""
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    
+    def setUp(self):
+        """Set up a rock with two scissors as prey."""
+        self.config = Config(seed=42, target_reacquire_ticks=10, target_alert_radius=50)
+        self.rng = random.Random(42)
+        self.rock = Rock((100, 100), None, self.config, self.rng)
+        self.far = Scissors((400, 100), None, self.config, self.rng)
+        self.near = Scissors((300, 100), None, self.config, self.rng)
+        self.agents = [self.rock, self.far, self.near]
+        self.rock.target = self.far
+        # A tick that is not a scheduled re-acquisition for this rock
+        self.tick = 1 if (1 + self.rock.id) % 10 else 2
+    
+    def test_keeps_live_target_between_searches(self):
+        """Test that a live target is kept even if another prey is closer."""
+        target = self.rock._select_target(self.agents, self.tick)
+        self.assertIs(target, self.far)
+    
+    def test_reacquires_on_schedule(self):
+        """Test that the full search runs every K ticks."""
+        tick = 10 - self.rock.id % 10
+        target = self.rock._select_target(self.agents, tick)
+        self.assertIs(target, self.near)
+    
+    def test_reacquires_when_target_dies(self):
+        """Test that a dead target triggers a new search."""
+        self.far.kill()
+        target = self.rock._select_target(self.agents, self.tick)
+        self.assertIs(target, self.near)
+    
+    def test_switches_to_much_closer_prey_in_alert_radius(self):
+        """Test that prey inside the alert radius overrides the target."""
+        from rps.core.spatial import SpatialGrid
+        self.near.pos.x = 130
+        grid = SpatialGrid(cell_size=50)
+        grid.rebuild(self.agents)
+        
+        target = self.rock._select_target(self.agents, self.tick, grid)
+        self.assertIs(target, self.near)
+
+
+class TestLimitedVision(unittest.TestCase):
+    """Test range-limited hunting."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame for tests."""
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    
+    def setUp(self):
+        """Set up a rock with one scissors out of sight."""
+        self.config = Config(seed=42, limited_vision=True, agent_detection_range=100)
+        self.rng = random.Random(42)
+        self.rock = Rock((100, 100), (50, 0), self.config, self.rng)
+        self.scissors = Scissors((400, 100), (0, 0), self.config, self.rng)
+        self.agents = [self.rock, self.scissors]
+    
+    def _grid(self):
+        from rps.core.spatial import SpatialGrid
+        grid = SpatialGrid(cell_size=100)
+        grid.rebuild(self.agents)
+        return grid
+    
+    def test_detection_range_from_config(self):
+        """Test that the configured range is used."""
+        self.assertEqual(self.rock.detection_range, 100)
+        self.assertEqual(Rock((0, 0), None, Config(seed=1), self.rng).detection_range, float('inf'))
+    
+    def test_ignores_prey_out_of_range(self):
+        """Test that distant prey is invisible."""
+        self.assertIsNone(self.rock._select_target(self.agents, 0, self._grid()))
+        self.assertIsNone(self.rock._select_target(self.agents, 0))
+    
+    def test_sees_prey_in_range(self):
+        """Test that prey inside the range is found through the grid."""
+        self.scissors.pos.x = 180
+        self.assertIs(self.rock._select_target(self.agents, 0, self._grid()), self.scissors)
+    
+    def test_wanders_instead_of_stopping(self):
+        """Test that an agent with nothing in sight keeps moving."""
+        for _ in range(300):
+            self.rock.update(1 / 60, self.agents, grid=self._grid())
+        
+        self.assertIsNone(self.rock.target)
+        self.assertGreater(self.rock.vel.length(), 1.0)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,119 @@
+"""Tests for the main loop's idle handling."""
+
+import os
+import unittest
+from collections import defaultdict
+from unittest import mock
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from rps.app import RPSApp
+from rps.core.config import Config
+
+
+class TestIdleLoop(unittest.TestCase):
+    """Test that the loop sleeps while idle and wakes for anything visible."""
+    
+    def setUp(self):
+        """Create an app on the dummy display and record draws, waits and timesteps."""
+        config = Config(seed=42, screen_width=320, screen_height=240,
+                        world_width=640, world_height=480, log_events=False)
+        self.app = RPSApp(config)
+        self.app.world.spawn_batch(3)
+        self.draws = 0
+        self.waits = 0
+        self.steps = []  # dt of each world update that was not paused
+        self.frames = 0
+        self.max_frames = 0
+        
+        draw, wait, update = self.app.draw, self.app._wait_for_activity, self.app.update
+        world_update = self.app.world.update
+        
+        def counted_draw():
+            """Count draws."""
+            self.draws += 1
+            draw()
+        
+        def counted_wait():
+            """Count idle waits."""
+            self.waits += 1
+            wait()
+        
+        def counted_update(dt):
+            """Stop the loop after max_frames frames."""
+            update(dt)
+            self.frames += 1
+            if self.frames >= self.max_frames:
+                self.app.running = False
+        
+        def recorded_world_update(dt):
+            """Record timesteps that advance the simulation."""
+            if not (self.app.world.paused or self.app.world.game_over):
+                self.steps.append(dt)
+            world_update(dt)
+        
+        self.app.draw = counted_draw
+        self.app._wait_for_activity = counted_wait
+        self.app.update = counted_update
+        self.app.world.update = recorded_world_update
+    
+    def tearDown(self):
+        """Shut pygame down (also cancels timers and drops leftover events)."""
+        pygame.quit()
+    
+    def _run(self, frames: int):
+        """Run the loop for a number of frames (run exits the process at the end)."""
+        self.max_frames = frames
+        with self.assertRaises(SystemExit):
+            self.app.run()
+    
+    def test_no_draws_while_paused(self):
+        """Test that a paused, idle app draws its first frame and then only waits."""
+        self.app.IDLE_WAIT_MS = 10
+        self.app.world.paused = True
+        self._run(6)
+        self.assertEqual(self.draws, 1)
+        self.assertEqual(self.waits, 5)
+    
+    def test_redraw_on_input(self):
+        """Test that an event arriving while paused triggers one redraw."""
+        self.app.IDLE_WAIT_MS = 10
+        self.app.world.paused = True
+        pygame.time.set_timer(pygame.USEREVENT, 30, loops=1)
+        self._run(10)
+        self.assertEqual(self.draws, 2)  # First frame, then the frame with the event
+    
+    def test_redraw_on_message_expiry(self):
+        """Test that a message expiring while paused triggers one redraw."""
+        self.app.IDLE_WAIT_MS = 10
+        self.app.world.paused = True
+        self.app.show_message("hello", duration=0.05)
+        self._run(12)
+        self.assertEqual(self.draws, 2)  # First frame (with the message), then its removal
+        self.assertIsNone(self.app.message)
+    
+    def test_first_step_after_resume(self):
+        """Test that the idle wait is not counted as the first timestep after unpausing."""
+        self.app.world.paused = True
+        resume = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=' ', scancode=0)
+        pygame.time.set_timer(resume, 150, loops=1)
+        self._run(8)
+        self.assertFalse(self.app.world.paused)
+        self.assertTrue(self.steps)
+        self.assertLess(max(self.steps), 4 / self.app.config.fps)  # The wait lasted ~150 ms
+    
+    def test_held_arrow_key_pans_without_waiting(self):
+        """Test that panning while paused redraws every frame instead of waiting for events."""
+        self.app.world.paused = True
+        held = defaultdict(int, {pygame.K_RIGHT: 1})
+        x = self.app.camera.x
+        with mock.patch('pygame.key.get_pressed', return_value=held):
+            self._run(10)
+        self.assertEqual(self.waits, 0)
+        self.assertEqual(self.draws, 10)
+        self.assertGreater(self.app.camera.x, x)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for the on-disk run result cache."""
+
+import os
+import tempfile
+import unittest
+from rps.analysis.sweep import Sweep
+from rps.core.cache import ResultCache, run_key
+from rps.core.config import Config
+from rps.core.headless import RunResult, run_headless
+
+
+def _result(seed: int) -> RunResult:
+    return RunResult(seed=seed, winner='rock', ticks=100 + seed, sim_time=1.0, kills=5,
+                     final_counts={'rock': 3, 'paper': 0, 'scissors': 0}, elapsed=0.1)
+
+
+class TestRunKey(unittest.TestCase):
+    """Test cache keys."""
+    
+    def test_stable_and_distinct(self):
+        """Test equal configs share a key and any outcome-relevant change alters it."""
+        key = run_key(Config(seed=1))
+        self.assertEqual(key, run_key(Config(seed=1)))
+        self.assertNotEqual(key, run_key(Config(seed=2)))
+        self.assertNotEqual(key, run_key(Config(seed=1, agent_speed_rock=(60, 90))))
+        self.assertNotEqual(key, run_key(Config(seed=1), max_ticks=50))
+        self.assertNotEqual(key, run_key(Config(seed=1), validate=True))
+        self.assertNotEqual(key, run_key(Config(seed=1), count_per_kind=7))
+
+
+class TestResultCache(unittest.TestCase):
+    """Test storing, reopening and evicting results."""
+    
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temp.name, 'cache')
+    
+    def tearDown(self):
+        self.temp.cleanup()
+    
+    def test_round_trip_and_reopen(self):
+        """Test a stored result survives reopening the cache."""
+        cache = ResultCache(self.directory)
+        self.assertIsNone(cache.get('ab' * 32))
+        cache.put('ab' * 32, _result(1))
+        reopened = ResultCache(self.directory)
+        self.assertEqual(reopened.get('ab' * 32), _result(1))
+        self.assertEqual((reopened.hits, cache.misses), (1, 1))
+        self.assertEqual(reopened.size_bytes, cache.size_bytes)
+    
+    def test_lru_eviction(self):
+        """Test the least recently used result is evicted first when over size."""
+        cache = ResultCache(self.directory)
+        cache.put('aa' * 32, _result(1))
+        cache.max_bytes = cache.size_bytes * 2
+        cache.put('bb' * 32, _result(2))
+        cache.get('aa' * 32)  # 'bb' is now the oldest
+        cache.put('cc' * 32, _result(3))
+        self.assertIn('aa' * 32, cache)
+        self.assertNotIn('bb' * 32, cache)
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.size_bytes, cache.max_bytes)
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'bb', 'bb' * 32 + '.json')))
+    
+    def test_sweep_reuses_runs(self):
+        """Test a repeated sweep takes every run from the cache with identical results."""
+        cache = ResultCache(self.directory)
+        base = Config(world_width=200, world_height=200)
+        sweep = Sweep([{'bounce_on_tie': True}, {'bounce_on_tie': False}], base=base, seeds=3,
+                      tolerance=0.0, count_per_kind=3, max_ticks=3000, cache=cache)
+        first = [stats.row() for stats in sweep.run()]
+        self.assertEqual((cache.hits, len(cache)), (0, 6))
+        second = [stats.row() for stats in sweep.run()]
+        self.assertEqual(second, first)
+        self.assertEqual(cache.hits, 6)
+        
+        config = Config(world_width=200, world_height=200, bounce_on_tie=True, seed=0)
+        fresh = run_headless(config, 3, max_ticks=3000)
+        self.assertEqual(cache.get(run_key(config, 3, 1 / 60, 3000)).ticks, fresh.ticks)
+
+
+if __name__ == '__main__':
+    unittest.main()
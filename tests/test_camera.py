@@ -0,0 +1,111 @@
+"""Tests for the pan/zoom camera and viewport culling."""
+
+import unittest
+import pygame
+from rps.core.config import Config
+from rps.core.world import World
+from rps.ui.camera import Camera
+
+
+class TestCamera(unittest.TestCase):
+    """Test coordinate conversion, zooming and clamping."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.camera = Camera((800, 600), (8000, 6000))
+    
+    def test_identity_when_world_matches_screen(self):
+        """Test that a screen-sized world needs no transform."""
+        camera = Camera((800, 600), (800, 600))
+        self.assertTrue(camera.is_identity)
+        self.assertEqual(camera.world_to_screen(10, 20), (10, 20))
+    
+    def test_starts_centred(self):
+        """Test that the initial view is centred on the world."""
+        x0, y0, x1, y1 = self.camera.view_rect()
+        self.assertAlmostEqual((x0 + x1) / 2, 4000)
+        self.assertAlmostEqual((y0 + y1) / 2, 3000)
+    
+    def test_round_trip(self):
+        """Test that screen and world conversions are inverses."""
+        self.camera.zoom_at(1.7, (123, 45))
+        sx, sy = self.camera.world_to_screen(*self.camera.screen_to_world(300, 200))
+        self.assertAlmostEqual(sx, 300)
+        self.assertAlmostEqual(sy, 200)
+    
+    def test_zoom_keeps_anchor_fixed(self):
+        """Test that the point under the cursor stays put while zooming."""
+        before = self.camera.screen_to_world(200, 150)
+        self.camera.zoom_at(2.0, (200, 150))
+        after = self.camera.screen_to_world(200, 150)
+        self.assertAlmostEqual(before[0], after[0])
+        self.assertAlmostEqual(before[1], after[1])
+    
+    def test_zoom_limits(self):
+        """Test that zoom stays between fitting the world and MAX_ZOOM."""
+        self.camera.zoom_at(1000, (0, 0))
+        self.assertEqual(self.camera.zoom, Camera.MAX_ZOOM)
+        self.camera.zoom_at(0.0001, (0, 0))
+        self.assertAlmostEqual(self.camera.zoom, 0.1)
+        x0, y0, x1, y1 = self.camera.view_rect()
+        self.assertLessEqual(x1 - x0, 8000 + 1e-6)
+        self.assertAlmostEqual(y1 - y0, 6000)
+    
+    def test_pan_clamped_to_world(self):
+        """Test that panning cannot leave the world."""
+        self.camera.pan(-1e6, -1e6)
+        self.assertEqual((self.camera.x, self.camera.y), (0.0, 0.0))
+        self.camera.pan(1e6, 1e6)
+        x0, y0, x1, y1 = self.camera.view_rect()
+        self.assertAlmostEqual(x1, 8000)
+        self.assertAlmostEqual(y1, 6000)
+
+
+class TestViewportCulling(unittest.TestCase):
+    """Test that the world only draws what the camera sees."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame for tests."""
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = Config(seed=42, world_width=5000, world_height=5000, max_population=5000)
+        self.world = World(self.config)
+        for kind in ('rock', 'paper', 'scissors'):
+            self.world.spawn_random(kind, 500)
+    
+    def test_visible_agents_match_brute_force(self):
+        """Test that the grid query returns exactly the agents in the rectangle."""
+        self.world.update(1 / 60)
+        rect = (1000, 1500, 2200, 2300)
+        expected = {
+            a.id for a in self.world.agents
+            if a.alive and rect[0] <= a.pos.x <= rect[2] and rect[1] <= a.pos.y <= rect[3]
+        }
+        self.assertGreater(len(expected), 0)
+        found = {a.id for a in self.world.visible_agents(*rect)}
+        self.assertEqual(found, expected)
+    
+    def test_spawn_refreshes_grid(self):
+        """Test that agents spawned since the last update are visible."""
+        self.world.update(1 / 60)
+        agent = self.world.spawn('rock', (2500, 2500))
+        found = self.world.visible_agents(2400, 2400, 2600, 2600)
+        self.assertIn(agent, found)
+    
+    def test_draw_with_camera(self):
+        """Test drawing a zoomed-out and a zoomed-in view."""
+        surface = pygame.Surface((800, 600))
+        camera = Camera((800, 600), self.config.world_size)
+        self.world.draw(surface, camera)
+        camera.fit()
+        self.world.draw(surface, camera)
+        camera.zoom_at(40, (400, 300))
+        self.world.draw(surface, camera)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests for the frame recorder."""
+
+import json
+import os
+import tempfile
+import unittest
+import pygame
+from rps.ui.capture import FrameRecorder
+
+
+class TestFrameRecorder(unittest.TestCase):
+    """Test capturing frames through the writer process."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame for tests."""
+        pygame.init()
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.surface = pygame.Surface((32, 24))
+    
+    def tearDown(self):
+        """Remove captured files."""
+        self.directory.cleanup()
+    
+    def test_png_sequence(self):
+        """Test that captured frames are written as PNGs with the right pixels."""
+        recorder = FrameRecorder((32, 24), self.directory.name, 'png', slots=4)
+        for shade in (10, 20, 30):
+            self.surface.fill((shade, 0, 0))
+            self.surface.set_at((31, 23), (0, 255, 0))
+            while not recorder.capture(self.surface):
+                pass  # Wait for a slot so no frame is dropped
+        self.assertEqual(recorder.close(), (3, 0))
+        self.assertEqual(recorder.pending, 0)
+        
+        files = sorted(os.listdir(recorder.directory))
+        self.assertEqual(files, ['frame_000000.png', 'frame_000001.png', 'frame_000002.png'])
+        image = pygame.image.load(os.path.join(recorder.directory, files[2]))
+        self.assertEqual(image.get_at((0, 0))[:3], (30, 0, 0))
+        self.assertEqual(image.get_at((31, 23))[:3], (0, 255, 0))
+    
+    def test_raw_stream(self):
+        """Test that the raw stream holds rgb24 frames back to back."""
+        recorder = FrameRecorder((32, 24), self.directory.name, 'raw', slots=2, fps=30)
+        for shade in (1, 2):
+            self.surface.fill((shade, shade, shade))
+            while not recorder.capture(self.surface):
+                pass
+        recorder.close()
+        
+        with open(os.path.join(recorder.directory, 'frames.json')) as f:
+            self.assertEqual(json.load(f), {'width': 32, 'height': 24, 'pixel_format': 'rgb24', 'fps': 30})
+        with open(os.path.join(recorder.directory, 'frames.rgb'), 'rb') as f:
+            data = f.read()
+        frame = 32 * 24 * 3
+        self.assertEqual(len(data), 2 * frame)
+        self.assertEqual(data[frame:frame + 3], bytes((2, 2, 2)))
+    
+    def test_drops_instead_of_blocking(self):
+        """Test that a full queue drops frames and counts them."""
+        recorder = FrameRecorder((32, 24), self.directory.name, 'png', slots=1)
+        results = [recorder.capture(self.surface) for _ in range(20)]
+        captured, dropped = recorder.close()
+        self.assertTrue(results[0])
+        self.assertGreater(dropped, 0)
+        self.assertEqual(captured + dropped, 20)
+        self.assertEqual(len(os.listdir(recorder.directory)), captured)
+    
+    def test_unknown_format(self):
+        """Test that unsupported formats are rejected."""
+        with self.assertRaises(ValueError):
+            FrameRecorder((32, 24), self.directory.name, 'gif')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -143,6 +143,42 @@ class TestCollision(unittest.TestCase):
         
         # Should be the same
         self.assertEqual(results1, results2)
+    
+    def test_swept_detection_catches_tunneling(self):
+        """Test that agents passing through each other within a step collide."""
+        rock = Rock((300, 100), None, self.config, self.rng)
+        scissors = Scissors((200, 100), None, self.config, self.rng)
+        # Both moved 200px this step, swapping sides
+        start_positions = {rock.id: (100, 100), scissors.id: (400, 100)}
+        
+        self.assertEqual(self.resolver.detect_collisions([rock, scissors], tick=0), [])
+        pairs = self.resolver.detect_collisions_swept([rock, scissors], start_positions, tick=0)
+        
+        self.assertEqual(len(pairs), 1)
+    
+    def test_swept_detection_misses_parallel_paths(self):
+        """Test that agents on separated parallel paths do not collide."""
+        rock = Rock((300, 100), None, self.config, self.rng)
+        scissors = Scissors((300, 200), None, self.config, self.rng)
+        start_positions = {rock.id: (100, 100), scissors.id: (100, 200)}
+        
+        pairs = self.resolver.detect_collisions_swept([rock, scissors], start_positions, tick=0)
+        
+        self.assertEqual(pairs, [])
+    
+    def test_swept_pairs_ordered_by_contact_time(self):
+        """Test that earlier contacts are resolved first."""
+        paper = Paper((200, 100), None, self.config, self.rng)
+        scissors = Scissors((120, 100), None, self.config, self.rng)
+        rock = Rock((260, 100), None, self.config, self.rng)
+        # Scissors sweeps right through paper (early) towards rock (late)
+        start_positions = {paper.id: (200, 100), scissors.id: (20, 100), rock.id: (260, 100)}
+        scissors.pos.x = 250
+        
+        pairs = self.resolver.detect_collisions_swept([rock, paper, scissors], start_positions, tick=0)
+        outcomes = self.resolver.resolve_collisions(pairs, tick=0, presorted=True)
+        
+        self.assertEqual([(o[0].kind, o[1].kind) for o in outcomes], [('scissors', 'paper'), ('rock', 'scissors')])
 
 
 if __name__ == '__main__':
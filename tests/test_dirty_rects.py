@@ -0,0 +1,65 @@
+"""Tests for the dirty-rectangle renderer."""
+
+import unittest
+import pygame
+from rps.core.config import Config
+from rps.core.world import World
+from rps.ui.dirty_rects import DirtyRectRenderer
+
+
+class TestDirtyRectRenderer(unittest.TestCase):
+    """Test that partial repaints match full repaints."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame for tests."""
+        pygame.init()
+        cls.screen = pygame.display.set_mode((400, 300), pygame.HIDDEN)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = Config(seed=7, screen_width=400, screen_height=300, show_names=True)
+        self.world = World(self.config)
+        for kind in ('rock', 'paper', 'scissors'):
+            self.world.spawn_random(kind, 5)
+        self.renderer = DirtyRectRenderer(self.screen, self.config.background_color, threshold=1.0)
+    
+    def test_matches_full_repaint(self):
+        """Test that erasing old rects and drawing new ones reproduces a full redraw."""
+        reference = pygame.Surface(self.screen.get_size())
+        for _ in range(30):
+            self.world.update(1 / 30)
+            self.renderer.begin()
+            self.renderer.present(self.world.draw(self.screen))
+            
+            reference.fill(self.config.background_color)
+            self.world.draw(reference)
+            self.assertEqual(
+                pygame.image.tobytes(self.screen, 'RGB'),
+                pygame.image.tobytes(reference, 'RGB')
+            )
+        self.assertFalse(self.renderer.last_full)
+    
+    def test_flip_above_threshold(self):
+        """Test the fallback to a full flip for large dirty areas."""
+        self.renderer.threshold = 0.5
+        self.renderer.begin()
+        self.renderer.present([pygame.Rect(0, 0, 10, 10)])
+        self.assertTrue(self.renderer.last_full)  # First frame is always full
+        
+        self.renderer.begin()
+        self.renderer.present([pygame.Rect(0, 0, 10, 10)])
+        self.assertFalse(self.renderer.last_full)
+        
+        self.renderer.begin()
+        self.renderer.present([self.screen.get_rect()])
+        self.assertTrue(self.renderer.last_full)
+        
+        self.renderer.invalidate()
+        self.renderer.begin()
+        self.renderer.present([])
+        self.assertTrue(self.renderer.last_full)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -77,6 +77,38 @@ class TestAgentFactory(unittest.TestCase):
         self.assertEqual(len(population['paper']), 3)
         self.assertEqual(len(population['scissors']), 3)
     
+    def test_create_batch_speeds_and_bounds(self):
+        """Test vectorized batch respects bounds and speed ranges."""
+        agents = self.factory.create_batch('rock', 200, bounds=(300, 200))
+        low, high = self.config.agent_speed_rock
+        
+        for agent in agents:
+            self.assertTrue(0 <= agent.pos.x < 300)
+            self.assertTrue(0 <= agent.pos.y < 200)
+            self.assertTrue(low - 1e-9 <= agent.max_speed <= high + 1e-9)
+            self.assertAlmostEqual(agent.vel.length(), agent.max_speed)
+    
+    def test_create_batch_unique_names(self):
+        """Test bulk names stay unique past the base name list."""
+        agents = self.factory.create_batch('scissors', 500)
+        agents += self.factory.create_batch('scissors', 100)
+        
+        names = [agent.name for agent in agents]
+        self.assertEqual(len(set(names)), len(names))
+    
+    def test_create_batch_deterministic(self):
+        """Test that same seed produces the same batch."""
+        factory1 = AgentFactory(Config(seed=7), random.Random(7))
+        factory2 = AgentFactory(Config(seed=7), random.Random(7))
+        
+        batch1 = factory1.create_batch('paper', 50)
+        batch2 = factory2.create_batch('paper', 50)
+        
+        self.assertEqual(
+            [(a.pos.x, a.pos.y, a.vel.x, a.vel.y, a.name) for a in batch1],
+            [(a.pos.x, a.pos.y, a.vel.x, a.vel.y, a.name) for a in batch2]
+        )
+    
     def test_get_available_kinds(self):
         """Test getting available agent kinds."""
         kinds = self.factory.get_available_kinds()
@@ -95,6 +127,22 @@ class TestAgentFactory(unittest.TestCase):
         self.assertEqual(paper_class, Paper)
         self.assertEqual(scissors_class, Scissors)
     
+    def test_create_batch_follows_config_changes(self):
+        """Test batches use per-kind speeds changed after the factory was created."""
+        self.config.agent_speed_paper = (300, 300)
+        for agent in self.factory.create_batch('paper', 5):
+            self.assertAlmostEqual(agent.vel.length(), 300)
+    
+    def test_register_agent_type(self):
+        """Test replacing a kind's class and rejecting unknown kinds."""
+        class BigRock(Rock):
+            pass
+        
+        self.factory.register_agent_type('rock', BigRock)
+        self.assertIsInstance(self.factory.create_agent('rock', (100, 100)), BigRock)
+        with self.assertRaises(ValueError):
+            self.factory.register_agent_type('lizard', Rock)
+    
     def test_deterministic_with_seed(self):
         """Test that same seed produces same positions."""
         factory1 = AgentFactory(Config(seed=123), random.Random(123))
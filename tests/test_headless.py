@@ -0,0 +1,77 @@
+"""Tests for headless runs and early termination."""
+
+import os
+import subprocess
+import sys
+import unittest
+from rps.core.config import Config
+from rps.core.headless import decided_winner, run_headless
+
+
+def _config(**kwargs) -> Config:
+    return Config(seed=3, world_width=200, world_height=200, **kwargs)
+
+
+class TestDecidedWinner(unittest.TestCase):
+    """Test decided-state detection."""
+    
+    def test_two_kinds(self):
+        """Test the kind that beats the other is predicted when two remain."""
+        self.assertEqual(decided_winner({'rock': 1, 'paper': 0, 'scissors': 9}), ('rock', 'two_kinds'))
+        self.assertEqual(decided_winner({'rock': 9, 'paper': 1, 'scissors': 0}), ('paper', 'two_kinds'))
+    
+    def test_minority(self):
+        """Test a near-extinct kind hands the win to its prey only when enabled."""
+        counts = {'rock': 1, 'paper': 10, 'scissors': 20}
+        self.assertIsNone(decided_winner(counts))
+        self.assertIsNone(decided_winner(counts, minority=0.01))
+        self.assertEqual(decided_winner(counts, minority=0.05), ('scissors', 'minority'))
+    
+    def test_undecided(self):
+        """Test finished and balanced states are not predictions."""
+        self.assertIsNone(decided_winner({'rock': 5, 'paper': 0, 'scissors': 0}))
+        self.assertIsNone(decided_winner({'rock': 5, 'paper': 5, 'scissors': 5}, minority=0.1))
+
+
+class TestEarlyTermination(unittest.TestCase):
+    """Test early-terminated headless runs against full runs."""
+    
+    def test_stops_at_decided_state(self):
+        """Test the run stops at the decided tick with the predicted winner."""
+        full = run_headless(_config(), 5, max_ticks=5000)
+        early = run_headless(_config(early_termination=True), 5, max_ticks=5000)
+        self.assertEqual(early.decided_reason, 'two_kinds')
+        self.assertEqual(early.ticks, early.decided_tick)
+        self.assertLess(early.ticks, full.ticks)
+        self.assertEqual(early.winner, full.winner)
+        self.assertEqual(sum(1 for n in early.decided_counts.values() if n), 2)
+    
+    def test_validate_runs_to_victory(self):
+        """Test validation keeps simulating and matches the full run."""
+        full = run_headless(_config(), 5, max_ticks=5000)
+        checked = run_headless(_config(early_termination=True), 5, max_ticks=5000, validate=True)
+        self.assertEqual((checked.winner, checked.ticks), (full.winner, full.ticks))
+        self.assertEqual(checked.predicted_winner, full.winner)
+        self.assertLess(checked.decided_tick, checked.ticks)
+
+
+class TestWithoutPygame(unittest.TestCase):
+    """Test the simulation core imports and runs with pygame unavailable."""
+    
+    def test_core_without_pygame(self):
+        """Test a headless run in an interpreter where importing pygame fails."""
+        script = (
+            "import sys\n"
+            "sys.modules['pygame'] = None  # Any 'import pygame' now raises ImportError\n"
+            "from rps.core import agent, collision, config, factory, names, world\n"
+            "from rps.core.headless import run_headless\n"
+            "result = run_headless(config.Config(seed=1, world_width=200, world_height=200), 3)\n"
+            "assert result.winner is not None\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        completed = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, cwd=root)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Tests for the kill heatmap."""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import pygame
+from rps.analysis.heatmap import KillHeatmap
+from rps.analysis.logger import AnalysisLogger
+from rps.core.config import Config
+from rps.core.world import World
+from rps.ui.camera import Camera
+
+COLORS = {'rock': (120, 120, 120), 'paper': (255, 255, 100), 'scissors': (255, 100, 100)}
+
+
+class TestKillHeatmap(unittest.TestCase):
+    """Test incremental accumulation, rendering and export."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame for tests."""
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.heatmap = KillHeatmap((400, 300), cell_size=10)
+    
+    def test_logger_feeds_heatmap(self):
+        """Test that logged kills land in the winner kind's cell."""
+        logger = AnalysisLogger(self.heatmap)
+        logger.log_collision(1, 'rock', 2, 'scissors', 55.0, 123.0, 0)
+        logger.log_collision(3, 'rock', 4, 'scissors', 59.0, 129.0, 1)
+        logger.log_collision(5, 'paper', 1, 'rock', 399.9, -3.0, 2)
+        self.assertEqual(self.heatmap.kills[0, 12, 5], 2)
+        self.assertEqual(self.heatmap.kills[1, 0, 39], 1)  # Clamped into the grid
+        self.assertEqual(self.heatmap.kills.sum(), 3)
+        
+        logger.clear()
+        self.assertEqual(self.heatmap.kills.sum(), 0)
+    
+    def test_occupancy_matches_world(self):
+        """Test that an occupancy sample counts every living agent once."""
+        config = Config(seed=3, screen_width=400, screen_height=300)
+        world = World(config)
+        for kind in ('rock', 'paper', 'scissors'):
+            world.spawn_random(kind, 20)
+        self.heatmap.record_occupancy(world.agents)
+        self.assertEqual(self.heatmap.occupancy.sum(), 60)
+        self.assertEqual(self.heatmap.occupancy[2].sum(), 20)
+        agent = world.agents[0]
+        row, col = int(agent.pos.y // 10), int(agent.pos.x // 10)
+        self.assertGreaterEqual(self.heatmap.occupancy[0, row, col], 1)
+    
+    def test_surface(self):
+        """Test that the overlay is colored and transparent where nothing happened."""
+        self.heatmap.add_kill('scissors', 105, 55)
+        surface = self.heatmap.to_surface(COLORS)
+        self.assertEqual(surface.get_size(), (40, 30))
+        self.assertEqual(tuple(surface.get_at((10, 5))), (255, 100, 100, 200))
+        self.assertEqual(surface.get_at((0, 0)).a, 0)
+        self.assertIs(self.heatmap.to_surface(COLORS), surface)  # Cached until the next kill
+        
+        self.heatmap.add_kill('rock', 5, 5)
+        self.assertIsNot(self.heatmap.to_surface(COLORS), surface)
+    
+    def test_draw_through_camera(self):
+        """Test drawing only the visible part of a large arena."""
+        heatmap = KillHeatmap((20000, 20000), cell_size=10)
+        heatmap.add_kill('paper', 10000, 10000)
+        screen = pygame.Surface((400, 300))
+        camera = Camera((400, 300), (20000, 20000))
+        camera.zoom_at(Camera.MAX_ZOOM, (200, 150))
+        rects = heatmap.draw(screen, COLORS, camera=camera)
+        self.assertEqual(len(rects), 1)
+        self.assertLessEqual(rects[0].width, 400)
+        sx, sy = camera.world_to_screen(10005, 10005)
+        red, green, blue, _ = screen.get_at((int(sx), int(sy)))
+        self.assertGreater(red, 150)  # Paper yellow blended over black
+        self.assertLess(blue, 100)
+    
+    def test_export(self):
+        """Test the NumPy archive round trip."""
+        self.heatmap.add_kill('paper', 1, 1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.heatmap.export(path=os.path.join(directory, 'heat.npz'))
+            data = np.load(path)
+            np.testing.assert_array_equal(data['kills'], self.heatmap.kills)
+            self.assertEqual(list(data['kinds']), ['rock', 'paper', 'scissors'])
+
+
+if __name__ == '__main__':
+    unittest.main()
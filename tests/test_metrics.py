@@ -0,0 +1,116 @@
+"""Tests for simulation metrics."""
+
+import unittest
+import pygame
+from rps.analysis.logger import AnalysisLogger
+from rps.analysis.metrics import MetricsRegistry, SimulationMetrics
+from rps.api.spawn_queue import SpawnQueue, SpawnRequest
+from rps.core.world import World
+from rps.core.config import Config
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test metric types and exposition format."""
+    
+    def test_counter_and_gauge_render(self):
+        """Test rendering counters and labelled gauges."""
+        registry = MetricsRegistry()
+        counter = registry.counter('requests_total', 'Requests')
+        registry.gauge('depth', 'Depth', {'queue': 'spawn'}, function=lambda: 7)
+        counter.inc()
+        counter.inc(2)
+        
+        text = registry.render()
+        
+        self.assertIn('# TYPE requests_total counter\nrequests_total 3\n', text)
+        self.assertIn('depth{queue="spawn"} 7', text)
+    
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram bucket counts, sum and count."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram('latency', 'Latency', buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value)
+        
+        lines = histogram.samples()
+        
+        self.assertEqual(lines[:3], [
+            'latency_bucket{le="0.1"} 1',
+            'latency_bucket{le="1"} 3',
+            'latency_bucket{le="+Inf"} 4',
+        ])
+        self.assertEqual(lines[3], 'latency_sum 6.05')
+        self.assertEqual(lines[4], 'latency_count 4')
+    
+    def test_type_conflict(self):
+        """Test that one name cannot be registered with two types."""
+        registry = MetricsRegistry()
+        registry.counter('x', 'X')
+        with self.assertRaises(ValueError):
+            registry.gauge('x', 'X')
+
+
+class TestSimulationMetrics(unittest.TestCase):
+    """Test metrics bound to a running world."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame for tests."""
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.metrics = SimulationMetrics()
+        self.logger = AnalysisLogger()
+        self.world = World(Config(seed=42), self.logger, self.metrics)
+        self.spawn_queue = SpawnQueue(maxsize=1)
+        self.metrics.bind(self.world, self.spawn_queue, self.logger)
+    
+    def test_world_updates_are_recorded(self):
+        """Test ticks, phases, population and collisions."""
+        self.world.spawn('rock', (100, 100))
+        self.world.spawn('scissors', (110, 100))
+        self.world.spawn('paper', (600, 600))
+        
+        self.world.update(0.016)
+        text = self.metrics.render()
+        
+        self.assertIn('rps_ticks_total 1', text)
+        self.assertIn('rps_phase_seconds_count{phase="steering"} 1', text)
+        self.assertIn('rps_population{kind="scissors"} 0', text)
+        self.assertIn('rps_population{kind="rock"} 1', text)
+        self.assertIn('rps_collisions_total{outcome="kill"} 1', text)
+    
+    def test_spawn_queue_drops_are_recorded(self):
+        """Test queue depth and drop counters."""
+        request = SpawnRequest(agent_type='rock', x=1.0, y=1.0)
+        self.spawn_queue.add(request)
+        self.spawn_queue.add(request)
+        
+        text = self.metrics.render()
+        
+        self.assertIn('rps_spawn_queue_depth 1', text)
+        self.assertIn('rps_spawn_queue_dropped_total 1', text)
+        self.assertIn('rps_spawn_queue_enqueued_total 1', text)
+    
+    def test_api_requests_are_recorded(self):
+        """Test API latency histogram and status counter."""
+        self.metrics.observe_request('/api/spawn', 202, 0.002)
+        self.metrics.observe_request('/api/spawn', 202, 0.003)
+        
+        text = self.metrics.render()
+        
+        self.assertIn('rps_api_request_seconds_count{endpoint="/api/spawn"} 2', text)
+        self.assertIn('rps_api_requests_total{endpoint="/api/spawn",status="202"} 2', text)
+    
+    def test_logger_memory_grows_with_events(self):
+        """Test logger memory estimate."""
+        empty = self.logger.memory_usage()
+        self.world.spawn_random('rock', 20)
+        
+        self.assertGreater(self.logger.memory_usage(), empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
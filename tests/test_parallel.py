@@ -0,0 +1,78 @@
+"""Tests for the vectorized multi-threaded update."""
+
+import unittest
+import random
+import pygame
+from rps.core.agent import Rock, Scissors
+from rps.core.config import Config
+from rps.core.parallel import ParallelStepper
+from rps.core.world import World
+
+
+class TestParallelStepper(unittest.TestCase):
+    """Test vectorized steering and integration."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame for tests."""
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    
+    def _run_world(self, threads, ticks=60, **overrides):
+        config = Config(seed=11, update_threads=threads, show_names=False, **overrides)
+        world = World(config)
+        world.spawn_batch(60)
+        for _ in range(ticks):
+            world.update(1 / 60)
+        world.stepper.close()
+        return [(a.kind, a.pos.x, a.pos.y, a.vel.x, a.vel.y) for a in world.agents]
+    
+    def test_identical_for_any_thread_count(self):
+        """Test that results do not depend on the number of threads."""
+        baseline = self._run_world(1)
+        self.assertEqual(self._run_world(2), baseline)
+        self.assertEqual(self._run_world(4), baseline)
+    
+    def test_identical_for_any_thread_count_limited_vision(self):
+        """Test determinism with wandering (random jitter)."""
+        baseline = self._run_world(1, limited_vision=True)
+        self.assertEqual(self._run_world(3, limited_vision=True), baseline)
+    
+    def test_matches_object_update(self):
+        """Test that one vectorized step matches Agent.update."""
+        config = Config(seed=5)
+        rng = random.Random(5)
+        rock = Rock((100, 100), (30, -20), config, rng)
+        scissors = Scissors((300, 180), (-10, 40), config, rng)
+        expected_rock = Rock((100, 100), (30, -20), config, rng)
+        expected_scissors = Scissors((300, 180), (-10, 40), config, rng)
+        agents = [expected_rock, expected_scissors]
+        
+        # The rock moves first, so it sees the scissors' starting position
+        for agent in agents:
+            agent.update(1 / 60, agents)
+        ParallelStepper(config, threads=1).step([rock, scissors], 1 / 60)
+        
+        for actual, expected in ((rock, expected_rock), (scissors, expected_scissors)):
+            self.assertAlmostEqual(actual.pos.x, expected.pos.x, places=9)
+            self.assertAlmostEqual(actual.pos.y, expected.pos.y, places=9)
+            self.assertAlmostEqual(actual.vel.x, expected.vel.x, places=9)
+            self.assertAlmostEqual(actual.vel.y, expected.vel.y, places=9)
+        self.assertIs(rock.target, scissors)
+    
+    def test_matches_double_buffered_world(self):
+        """Test that the stepper agrees with the default object update."""
+        def positions(threads):
+            world = World(Config(seed=3, update_threads=threads, show_names=False))
+            world.spawn_batch(30)
+            for _ in range(5):
+                world.update(1 / 60)
+            return [(a.pos.x, a.pos.y) for a in world.agents]
+        
+        for actual, expected in zip(positions(1), positions(0)):
+            self.assertAlmostEqual(actual[0], expected[0], places=6)
+            self.assertAlmostEqual(actual[1], expected[1], places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Tests for the API process bridge pipe protocol."""
+
+import importlib.util
+import multiprocessing
+import socket
+import unittest
+from rps.api.process_bridge import ApiProcessBridge, _to_tuple
+from rps.api.spawn_queue import SpawnRequest
+from rps.core.config import Config
+
+
+class TestApiProcessBridge(unittest.TestCase):
+    """Test the game side of the bridge against a local pipe."""
+    
+    def setUp(self):
+        """Connect a bridge to a pipe without starting a process."""
+        self.bridge = ApiProcessBridge(Config(seed=42))
+        self.bridge._conn, self.child = multiprocessing.Pipe(duplex=True)
+    
+    def tearDown(self):
+        """Close both pipe ends."""
+        self.bridge._conn.close()
+        self.child.close()
+    
+    def test_receive_batches(self):
+        """Test that every batch waiting in the pipe is returned in order."""
+        first = SpawnRequest(agent_type='rock', x=1.0, y=2.0)
+        second = SpawnRequest(agent_type='paper', x=3.0, y=4.0, original_x=-5.0, original_y=4.0, adjusted=True)
+        self.child.send([_to_tuple(first)])
+        self.child.send([_to_tuple(second)])
+        
+        self.assertEqual(self.bridge.receive(), [first, second])
+        self.assertEqual(self.bridge.receive(), [])
+    
+    def test_send_status_only_on_change(self):
+        """Test that unchanged population snapshots are not resent."""
+        self.bridge.send_status(10, 500)
+        self.bridge.send_status(10, 500)
+        self.bridge.send_status(11, 500)
+        
+        self.assertEqual(self.child.recv(), (10, 500))
+        self.assertEqual(self.child.recv(), (11, 500))
+        self.assertFalse(self.child.poll())
+    
+    def test_handshake(self):
+        """Test that the start-up handshake reports readiness or the child's error."""
+        self.child.send(('ready',))
+        self.assertIsNone(self.bridge._handshake(1.0))
+        
+        self.child.send(('error', 'Cannot listen on 127.0.0.1:5000'))
+        self.assertEqual(self.bridge._handshake(1.0), 'Cannot listen on 127.0.0.1:5000')
+
+
+@unittest.skipIf(importlib.util.find_spec('flask') is None, "Flask not installed")
+class TestApiProcessStartup(unittest.TestCase):
+    """Test start-up failures of a real API process."""
+    
+    def test_port_in_use(self):
+        """Test that a taken port raises in the parent instead of failing silently."""
+        with socket.socket() as taken:
+            taken.bind(('127.0.0.1', 0))
+            taken.listen()
+            bridge = ApiProcessBridge(Config(seed=42), port=taken.getsockname()[1])
+            with self.assertRaisesRegex(RuntimeError, 'Cannot listen'):
+                bridge.start()
+            self.assertIsNone(bridge.process)
+
+
+if __name__ == '__main__':
+    unittest.main()
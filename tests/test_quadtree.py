@@ -0,0 +1,103 @@
+"""Tests for the prey quadtree."""
+
+import unittest
+import random
+import pygame
+from rps.core.agent import Rock, Paper, Scissors
+from rps.core.config import Config
+from rps.core.quadtree import PreyQuadtree
+from rps.core.world import World
+
+
+class TestPreyQuadtree(unittest.TestCase):
+    """Test nearest-of-kind queries and incremental maintenance."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame for tests."""
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = Config(seed=42)
+        self.rng = random.Random(42)
+        self.agents = [
+            cls((self.rng.uniform(0, 1000), self.rng.uniform(0, 800)), None, self.config, self.rng)
+            for cls in (Rock, Paper, Scissors)
+            for _ in range(100)
+        ]
+        self.tree = PreyQuadtree(1000, 800, capacity=4)
+        self.tree.sync(self.agents)
+    
+    def _brute_force(self, x, y, kind, exclude_id=None):
+        """Nearest living agent of a kind by linear scan."""
+        candidates = [
+            a for a in self.agents
+            if a.alive and a.kind == kind and a.id != exclude_id
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda a: (a.pos.x - x) ** 2 + (a.pos.y - y) ** 2)
+    
+    def _assert_matches_brute_force(self):
+        for _ in range(50):
+            x, y = self.rng.uniform(0, 1000), self.rng.uniform(0, 800)
+            for kind in ('rock', 'paper', 'scissors'):
+                expected = self._brute_force(x, y, kind)
+                found = self.tree.nearest(x, y, kind)
+                self.assertAlmostEqual(
+                    found.pos.distance_squared_to((x, y)), expected.pos.distance_squared_to((x, y))
+                )
+    
+    def test_nearest_matches_linear_search(self):
+        """Test that queries agree with a brute-force scan."""
+        self._assert_matches_brute_force()
+    
+    def test_exclude_id(self):
+        """Test that the searcher itself is never returned."""
+        rock = self.agents[0]
+        found = self.tree.nearest(rock.pos.x, rock.pos.y, 'rock', exclude_id=rock.id)
+        self.assertIsNot(found, rock)
+        self.assertIs(found, self._brute_force(rock.pos.x, rock.pos.y, 'rock', rock.id))
+    
+    def test_sync_after_moves(self):
+        """Test that moved agents are re-indexed."""
+        for _ in range(5):
+            for agent in self.agents:
+                agent.pos.x = min(max(agent.pos.x + self.rng.uniform(-150, 150), 0), 999)
+                agent.pos.y = min(max(agent.pos.y + self.rng.uniform(-150, 150), 0), 799)
+            self.tree.sync(self.agents)
+            self._assert_matches_brute_force()
+        self.assertEqual(len(self.tree), len(self.agents))
+    
+    def test_remove_updates_counts(self):
+        """Test that removed agents leave the counts and the results."""
+        for agent in self.agents[:250]:
+            agent.kill()
+            self.tree.remove(agent)
+        
+        self.assertEqual(len(self.tree), 50)
+        self.assertEqual(self.tree.count('rock'), 0)
+        self.assertEqual(self.tree.count('paper'), 0)
+        self.assertEqual(self.tree.count('scissors'), 50)
+        self.assertIsNone(self.tree.nearest(500, 400, 'rock'))
+        self.assertIs(self.tree.nearest(500, 400, 'scissors'), self._brute_force(500, 400, 'scissors'))
+    
+    def test_world_quadtree_mode_picks_nearest_prey(self):
+        """Test that the world steers with the quadtree when configured."""
+        config = Config(seed=7, prey_search='quadtree', show_names=False)
+        world = World(config)
+        for kind in ('rock', 'paper', 'scissors'):
+            world.spawn_random(kind, 20)
+        world.update(1 / 60)
+        
+        self.assertEqual(len(world.prey_tree), len(world.agents))
+        for agent in world.agents:
+            prey = agent.target
+            self.assertIsNotNone(prey)
+            self.assertEqual(agent.compare(prey), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Tests for the streaming event-log analysis."""
+
+import tempfile
+import unittest
+from rps.analysis.logger import AnalysisLogger
+from rps.analysis.report import analyze_files, format_report, StreamingAnalyzer
+from rps.core.config import Config
+from rps.core.world import World
+
+
+class TestStreamingAnalyzer(unittest.TestCase):
+    """Test single-pass statistics over event streams."""
+    
+    def test_lifespans_and_chains(self):
+        """Test lifespans, kill counts and kill chains on a hand-written log."""
+        analyzer = StreamingAnalyzer(window=10, cell_size=50, top=2)
+        analyzer.add_spawn(1, 'rock', 0, 0, 0)
+        analyzer.add_spawn(2, 'scissors', 0, 0, 0)
+        analyzer.add_spawn(3, 'paper', 0, 0, 2)
+        analyzer.add_spawn(4, 'scissors', 0, 0, 2)
+        analyzer.add_kill(1, 'rock', 2, 'scissors', 10, 10, 5)  # Rock chain 1
+        analyzer.add_kill(3, 'paper', 1, 'rock', 60, 10, 12)  # Paper chain 2
+        analyzer.add_kill(4, 'scissors', 3, 'paper', 60, 20, 14)  # Scissors chain 3
+        result = analyzer.result()
+        
+        self.assertEqual(result['kills'], {'rock': 1, 'paper': 1, 'scissors': 1})
+        self.assertEqual(result['survivors'], {'scissors': 1})
+        self.assertEqual(result['lifespans']['rock'], {'count': 1, 'mean': 12, 'min': 12, 'max': 12})
+        self.assertEqual(result['kill_chains']['max'], 3)
+        self.assertEqual(result['kill_chains']['agents_by_length'], {0: 1, 1: 1, 2: 1, 3: 1})
+        self.assertEqual([w['kills'] for w in result['kill_rate_windows']],
+                         [{'rock': 1}, {'paper': 1, 'scissors': 1}])
+        self.assertEqual(result['spatial']['hottest_cells'][0], {'cell': [1, 0], 'kills': 2})
+        self.assertEqual(len(result['top_killers']), 2)
+        self.assertEqual(result['top_killers'][0]['id'], 1)  # Ties go to the lower id
+    
+    def test_matches_exported_session(self):
+        """Test the streamed totals against the logger's in-memory statistics."""
+        logger = AnalysisLogger()
+        world = World(Config(seed=11, screen_width=500, screen_height=400), logger)
+        for kind in ('rock', 'paper', 'scissors'):
+            world.spawn_random(kind, 30)
+        for _ in range(600):
+            world.update(1 / 30)
+        stats = logger.get_stats()
+        self.assertGreater(stats['total_collisions'], 0)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            spawn_file, collision_file = logger.export_csv(directory)
+            result = analyze_files(spawn_file, collision_file, window=100, chunk_size=7)
+            self.assertIn('Top killers', format_report(result))
+        
+        self.assertEqual(result['spawns'], stats['spawns_by_kind'])
+        self.assertEqual(result['kills'], stats['kills_by_kind'])
+        self.assertEqual(result['survivors'], {k: n for k, n in world.get_counts().items() if n})
+        self.assertEqual(sum(sum(w['kills'].values()) for w in result['kill_rate_windows']),
+                         stats['total_collisions'])
+        best = max(world.all_agents_history, key=lambda a: (a.kills, -a.id))
+        self.assertEqual(result['top_killers'][0]['kills'], best.kills)
+        self.assertEqual(result['unknown_victims'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
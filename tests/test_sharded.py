@@ -0,0 +1,108 @@
+"""Tests for the sharded multi-process world."""
+
+import unittest
+import numpy as np
+from rps.core.config import Config
+from rps.core.sharded import AGENT_DTYPE, ShardedWorld, resolve_contacts, tile_layout
+
+
+def _record(agent_id, kind, x, y, radius=10.0):
+    record = np.zeros(1, dtype=AGENT_DTYPE)
+    record['id'], record['kind'] = agent_id, kind
+    record['x'], record['y'], record['radius'] = x, y, radius
+    record['last_collision'] = -10**9
+    return record
+
+
+class TestResolveContacts(unittest.TestCase):
+    """Test simultaneous collision resolution."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = Config(seed=1)
+    
+    def test_kill_credited_to_lowest_id_winner(self):
+        """Test that a loser touched by two winners counts one kill."""
+        # Kinds: 0 rock, 2 scissors; both rocks touch the scissors
+        owned = np.concatenate([_record(5, 0, 100, 100), _record(9, 2, 115, 100)])
+        ghosts = _record(3, 0, 130, 100)
+        
+        dead = resolve_contacts(owned, ghosts, tick=0, config=self.config)
+        
+        self.assertEqual(dead.tolist(), [False, True])
+        self.assertEqual(owned['kills'].tolist(), [0, 0])  # Ghost rock 3 gets the credit
+        self.assertEqual(owned['last_collision'].tolist(), [0, 0])
+    
+    def test_cooldown_skips_pair(self):
+        """Test that recently collided agents are ignored."""
+        owned = np.concatenate([_record(1, 0, 100, 100), _record(2, 2, 110, 100)])
+        owned['last_collision'][1] = 0
+        
+        dead = resolve_contacts(owned, np.empty(0, dtype=AGENT_DTYPE), tick=1, config=self.config)
+        
+        self.assertFalse(dead.any())
+    
+    def test_tie_bounces_apart(self):
+        """Test that same-kind agents moving together bounce."""
+        owned = np.concatenate([_record(1, 1, 100, 100), _record(2, 1, 110, 100)])
+        owned['vx'] = [10.0, -10.0]
+        
+        resolve_contacts(owned, np.empty(0, dtype=AGENT_DTYPE), tick=0, config=self.config)
+        
+        self.assertEqual(owned['vx'].tolist(), [-10.0, 10.0])
+
+
+class TestShardedWorld(unittest.TestCase):
+    """Test the coordinator and worker processes."""
+    
+    def test_tile_layout(self):
+        """Test that tiles form a near-square grid."""
+        self.assertEqual(tile_layout(1), (1, 1))
+        self.assertEqual(tile_layout(2), (2, 1))
+        self.assertEqual(tile_layout(4), (2, 2))
+        self.assertEqual(tile_layout(6), (3, 2))
+    
+    def test_cross_border_kill_and_victory(self):
+        """Test a collision between agents owned by different workers."""
+        with ShardedWorld(Config(seed=1), workers=2) as world:
+            world.spawn('rock', (590, 400), (0, 0))
+            world.spawn('scissors', (610, 400), (0, 0))
+            world.update(1 / 60)
+            
+            self.assertEqual(world.kills, 1)
+            self.assertEqual(world.get_counts(), {'rock': 1, 'paper': 0, 'scissors': 0})
+            self.assertTrue(world.game_over)
+            self.assertEqual(world.winner_kind, 'rock')
+            self.assertEqual(world.agents()['kills'].tolist(), [1])
+    
+    def test_migration_keeps_agent(self):
+        """Test that an agent crossing a tile border is handed over once."""
+        with ShardedWorld(Config(seed=1), workers=2) as world:
+            world.spawn('rock', (580, 400), (80, 0))
+            world.spawn('paper', (100, 700), (0, 0))  # Keeps the game going
+            for _ in range(30):
+                world.update(1 / 60)
+            
+            agents = world.agents()
+            self.assertEqual(len(agents), 2)
+            self.assertGreater(agents['x'][0], 600)
+            self.assertEqual(world.get_counts(), {'rock': 1, 'paper': 1, 'scissors': 0})
+    
+    def test_deterministic(self):
+        """Test that the same seed and worker count reproduce a run."""
+        def run():
+            with ShardedWorld(Config(seed=4, max_population=300), workers=2) as world:
+                world.spawn_batch(60)
+                for _ in range(40):
+                    world.update(1 / 60)
+                return world.agents(), world.get_counts()
+        
+        first, counts = run()
+        second, counts_again = run()
+        self.assertEqual(counts, counts_again)
+        self.assertTrue(np.array_equal(first, second))
+        self.assertEqual(sum(counts.values()), len(first))
+
+
+if __name__ == '__main__':
+    unittest.main()
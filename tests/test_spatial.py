@@ -0,0 +1,51 @@
+"""Tests for spatial indexing."""
+
+import unittest
+import random
+import pygame
+from rps.core.agent import Rock
+from rps.core.config import Config
+from rps.core.spatial import SpatialGrid
+
+
+class TestSpatialGrid(unittest.TestCase):
+    """Test uniform grid queries."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame for tests."""
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = Config(seed=42)
+        self.rng = random.Random(42)
+    
+    def test_query_returns_superset_of_agents_in_radius(self):
+        """Test that every agent inside the radius is returned."""
+        agents = [
+            Rock((self.rng.uniform(0, 1000), self.rng.uniform(0, 1000)), None, self.config, self.rng)
+            for _ in range(200)
+        ]
+        grid = SpatialGrid(cell_size=40)
+        grid.rebuild(agents)
+        
+        found = set(a.id for a in grid.query(500, 500, 120))
+        expected = set(a.id for a in agents if a.pos.distance_to((500, 500)) <= 120)
+        
+        self.assertTrue(expected <= found)
+        self.assertLess(len(found), len(agents))
+    
+    def test_dead_agents_not_indexed(self):
+        """Test that dead agents are skipped on rebuild."""
+        rock = Rock((10, 10), None, self.config, self.rng)
+        rock.kill()
+        grid = SpatialGrid(cell_size=40)
+        grid.rebuild([rock])
+        
+        self.assertEqual(list(grid.query(10, 10, 5)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for SpawnQueue."""
+
+import threading
+import unittest
+from rps.api.spawn_queue import SpawnQueue, SpawnRequest
+
+
+def make_request(x: float) -> SpawnRequest:
+    """Create a spawn request tagged by its x coordinate."""
+    return SpawnRequest(agent_type='rock', x=x, y=0.0)
+
+
+class TestSpawnQueue(unittest.TestCase):
+    """Test ring-buffer spawn queue."""
+    
+    def test_add_and_get_all_preserves_order(self):
+        """Test that requests are drained oldest first."""
+        spawn_queue = SpawnQueue(maxsize=5)
+        for i in range(3):
+            self.assertTrue(spawn_queue.add(make_request(i)))
+        
+        drained = spawn_queue.get_all()
+        
+        self.assertEqual([r.x for r in drained], [0, 1, 2])
+        self.assertEqual(spawn_queue.size(), 0)
+        self.assertEqual(spawn_queue.get_all(), [])
+    
+    def test_add_rejects_when_full(self):
+        """Test that add returns False once capacity is reached."""
+        spawn_queue = SpawnQueue(maxsize=2)
+        
+        self.assertTrue(spawn_queue.add(make_request(0)))
+        self.assertTrue(spawn_queue.add(make_request(1)))
+        self.assertTrue(spawn_queue.is_full())
+        self.assertFalse(spawn_queue.add(make_request(2)))
+        self.assertEqual(spawn_queue.occupancy(), (2, 2))
+    
+    def test_add_batch_accepts_up_to_capacity(self):
+        """Test batch enqueue stops at capacity."""
+        spawn_queue = SpawnQueue(maxsize=4)
+        spawn_queue.add(make_request(-1))
+        
+        accepted = spawn_queue.add_batch(make_request(i) for i in range(5))
+        
+        self.assertEqual(accepted, 3)
+        self.assertEqual([r.x for r in spawn_queue.get_all()], [-1, 0, 1, 2])
+    
+    def test_clear(self):
+        """Test clearing pending requests."""
+        spawn_queue = SpawnQueue(maxsize=3)
+        spawn_queue.add_batch([make_request(0), make_request(1)])
+        
+        spawn_queue.clear()
+        
+        self.assertEqual(spawn_queue.size(), 0)
+        self.assertTrue(spawn_queue.add(make_request(2)))
+        self.assertEqual([r.x for r in spawn_queue.get_all()], [2])
+    
+    def test_invalid_maxsize(self):
+        """Test that a non-positive capacity is rejected."""
+        with self.assertRaises(ValueError):
+            SpawnQueue(maxsize=0)
+    
+    def test_concurrent_producers(self):
+        """Test that no request is lost or duplicated under contention."""
+        spawn_queue = SpawnQueue(maxsize=10000)
+        
+        def produce(offset):
+            for i in range(1000):
+                spawn_queue.add(make_request(offset + i))
+        
+        threads = [threading.Thread(target=produce, args=(k * 1000,)) for k in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        drained = spawn_queue.get_all()
+        self.assertEqual(sorted(r.x for r in drained), list(range(4000)))
+
+
+if __name__ == '__main__':
+    unittest.main()
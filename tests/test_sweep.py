@@ -0,0 +1,114 @@
+"""Tests for Config parameter sweeps."""
+
+import math
+import unittest
+from rps.analysis.sweep import grid_points, PointStats, random_points, Sweep, wilson_halfwidth
+from rps.core.config import Config
+from rps.core.headless import RunResult
+
+
+def _small_sweep(points, **kwargs):
+    """Sweep over a small arena with few agents, so runs are quick."""
+    base = Config(world_width=200, world_height=200)
+    return Sweep(points, base=base, count_per_kind=3, max_ticks=3000, **kwargs)
+
+
+class TestSpaces(unittest.TestCase):
+    """Test point generation."""
+    
+    def test_grid(self):
+        """Test the grid is the full product, with lists coerced to tuples."""
+        points = grid_points({'agent_speed_rock': [[50, 80], [70, 100]], 'bounce_on_tie': [True, False]})
+        self.assertEqual(len(points), 4)
+        self.assertEqual(points[0], {'agent_speed_rock': (50, 80), 'bounce_on_tie': True})
+    
+    def test_random(self):
+        """Test random points respect ranges and types, and are reproducible."""
+        space = {'agent_radius_paper': [8, 16], 'bounce_on_tie': [True, False]}
+        points = random_points(space, 50, seed=1)
+        self.assertEqual(points, random_points(space, 50, seed=1))
+        for point in points:
+            self.assertIsInstance(point['agent_radius_paper'], int)
+            self.assertTrue(8 <= point['agent_radius_paper'] <= 16)
+            self.assertIn(point['bounce_on_tie'], (True, False))
+    
+    def test_unknown_field(self):
+        """Test unknown field names are rejected."""
+        with self.assertRaises(ValueError):
+            grid_points({'agent_speed_granite': [1]})
+    
+    def test_seed_rejected(self):
+        """Test the seed, which the sweep varies itself, cannot be a sweep field."""
+        with self.assertRaises(ValueError):
+            grid_points({'seed': [1, 2]})
+        with self.assertRaises(ValueError):
+            random_points({'seed': [0, 100]}, 3)
+
+
+class TestPointStats(unittest.TestCase):
+    """Test the running balance metrics."""
+    
+    def test_metrics(self):
+        """Test win rates, timeouts and mean ticks."""
+        stats = PointStats({})
+        for winner, ticks in (('rock', 100), ('rock', 200), ('paper', 300), (None, 5000)):
+            stats.add(RunResult(seed=0, winner=winner, ticks=ticks, sim_time=0, kills=0))
+        self.assertEqual(stats.runs, 4)
+        self.assertAlmostEqual(stats.win_rate('rock'), 0.5)
+        self.assertAlmostEqual(stats.mean_ticks, 200)
+        self.assertAlmostEqual(stats.ticks_ci(), 1.96 * 100 / math.sqrt(3))
+        self.assertEqual(stats.row()['timeout_rate'], 0.25)
+    
+    def test_decided_rate(self):
+        """Test runs stopped at a decided state are counted, and validated runs are not."""
+        stats = PointStats({})
+        stats.add(RunResult(seed=0, winner='rock', ticks=120, sim_time=0, kills=0, decided_tick=120))
+        stats.add(RunResult(seed=1, winner='rock', ticks=400, sim_time=0, kills=0, decided_tick=120))
+        self.assertEqual(stats.decided, 1)
+        self.assertEqual(stats.row()['decided_rate'], 0.5)
+    
+    def test_wilson(self):
+        """Test the interval narrows with more runs and stays positive at 0%."""
+        self.assertGreater(wilson_halfwidth(0, 10), 0)
+        self.assertLess(wilson_halfwidth(50, 100), wilson_halfwidth(5, 10))
+
+
+class TestSweep(unittest.TestCase):
+    """Test running sweeps."""
+    
+    def test_early_stopping(self):
+        """Test points stop at min_seeds with a loose tolerance and run all seeds otherwise."""
+        points = [{'bounce_on_tie': True}]
+        loose = list(_small_sweep(points, seeds=8, min_seeds=3, tolerance=1.0).run())
+        strict = list(_small_sweep(points, seeds=8, min_seeds=3, tolerance=0.0).run())
+        self.assertEqual((loose[0].runs, loose[0].converged), (3, True))
+        self.assertEqual((strict[0].runs, strict[0].converged), (8, False))
+    
+    def test_needs_a_seed(self):
+        """Test a sweep must run at least one seed per point."""
+        with self.assertRaises(ValueError):
+            Sweep([{}], seeds=0)
+    
+    def test_pool_matches_serial(self):
+        """Test a process pool gives the same statistics as running in-process."""
+        points = grid_points({'agent_speed_rock': [[50, 80], [150, 200]]})
+        serial = _small_sweep(points, seeds=4, tolerance=0.0).run()
+        pooled = _small_sweep(points, seeds=4, tolerance=0.0, workers=2).run()
+        key = lambda stats: str(stats.params)
+        self.assertEqual([s.row() for s in sorted(serial, key=key)],
+                         [s.row() for s in sorted(pooled, key=key)])
+    
+    def test_pool_matches_serial_with_early_stopping(self):
+        """Test points stop after the same seeds with a pool, whatever order runs finish in."""
+        points = grid_points({'agent_speed_rock': [[50, 80], [150, 200]]})
+        options = dict(seeds=10, min_seeds=3, tolerance=0.3)
+        serial = list(_small_sweep(points, **options).run())
+        pooled = list(_small_sweep(points, workers=3, **options).run())
+        self.assertTrue(all(s.converged and s.runs < 10 for s in serial))
+        key = lambda stats: str(stats.params)
+        self.assertEqual([s.row() for s in sorted(serial, key=key)],
+                         [s.row() for s in sorted(pooled, key=key)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Tests for the population time series."""
+
+import csv
+import os
+import tempfile
+import unittest
+import numpy as np
+from rps.analysis.timeseries import PopulationSeries
+
+KINDS = ['rock', 'paper', 'scissors']
+
+
+class TestPopulationSeries(unittest.TestCase):
+    """Test ring buffers, downsampling tiers and export."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.series = PopulationSeries(KINDS, capacity=10, tiers=3, factor=4)
+    
+    def record_ticks(self, count):
+        """Record ticks where rock counts down from 1000 and one kill happens per tick."""
+        for tick in range(count):
+            self.series.record(tick, {'rock': 1000 - tick, 'paper': 5, 'scissors': tick}, 1)
+    
+    def test_tier0_keeps_latest_ticks(self):
+        """Test that the full-resolution ring holds the most recent ticks in order."""
+        self.record_ticks(25)
+        rows = self.series.series(0)
+        self.assertEqual(rows[:, 0].tolist(), list(range(15, 25)))
+        self.assertEqual(rows[-1].tolist(), [24, 976, 5, 24, 1])
+        self.assertEqual(len(self.series), 10)
+    
+    def test_downsampled_tiers(self):
+        """Test that coarse tiers sample counts and sum kills over their period."""
+        self.record_ticks(64)
+        tier1 = self.series.series(1)
+        self.assertEqual(tier1[:, 0].tolist(), list(range(27, 64, 4)))
+        self.assertTrue(np.all(tier1[:, -1] == 4))
+        tier2 = self.series.series(2)
+        self.assertEqual(tier2[:, 0].tolist(), [15, 31, 47, 63])
+        self.assertTrue(np.all(tier2[:, -1] == 16))
+    
+    def test_covering_tier(self):
+        """Test choosing the finest tier that spans the run."""
+        self.record_ticks(10)
+        self.assertEqual(self.series.covering_tier(), 0)
+        self.record_ticks(20)
+        self.assertEqual(self.series.covering_tier(), 1)
+        self.record_ticks(1000)
+        self.assertEqual(self.series.covering_tier(), 2)
+    
+    def test_memory_is_fixed(self):
+        """Test that long runs do not grow the buffers."""
+        before = self.series.memory_usage()
+        self.record_ticks(5000)
+        self.assertEqual(self.series.memory_usage(), before)
+    
+    def test_clear(self):
+        """Test that clear empties every tier and bumps the generation."""
+        self.record_ticks(20)
+        generation = self.series.generation
+        self.series.clear()
+        self.assertEqual(len(self.series.series(1)), 0)
+        self.assertEqual(self.series.samples, 0)
+        self.assertGreater(self.series.generation, generation)
+    
+    def test_export_csv(self):
+        """Test that every tier is exported with its resolution."""
+        self.record_ticks(16)
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.series.export_csv(os.path.join(directory, 'population.csv'))
+            with open(path, newline='') as f:
+                rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['tier', 'ticks_per_sample', 'tick', 'rock', 'paper', 'scissors', 'kills'])
+        self.assertEqual(len(rows), 1 + 10 + 4 + 1)
+        self.assertEqual(rows[-1], ['2', '16', '15', '985', '5', '15', '16'])
+
+
+if __name__ == '__main__':
+    unittest.main()
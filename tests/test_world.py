@@ -137,6 +137,51 @@ class TestWorld(unittest.TestCase):
         
         # Should be identical
         self.assertEqual(positions1, positions2)
+    
+    def _positions_after_update(self, reverse: bool, sequential: bool, **options):
+        """Positions by name after one tick, optionally with the agent list reversed."""
+        world = World(Config(seed=42, sequential_update=sequential, show_names=False, **options))
+        world.spawn_batch(10)
+        if reverse:
+            world.agents.reverse()
+        world.update(1 / 60)
+        return sorted((a.name, a.pos.x, a.pos.y) for a in world.agents)
+    
+    def test_update_independent_of_agent_order(self):
+        """Test that the double-buffered update ignores list order."""
+        self.assertEqual(
+            self._positions_after_update(reverse=False, sequential=False),
+            self._positions_after_update(reverse=True, sequential=False)
+        )
+    
+    def test_wander_independent_of_agent_order(self):
+        """Test that limited-vision wandering ignores list order too."""
+        options = {'limited_vision': True, 'agent_detection_range': 50.0}
+        self.assertEqual(
+            self._positions_after_update(reverse=False, sequential=False, **options),
+            self._positions_after_update(reverse=True, sequential=False, **options)
+        )
+    
+    def test_sequential_update_reproduces_legacy_seed(self):
+        """Test that the legacy update still gives the pre-double-buffering result for a seed."""
+        world = World(Config(seed=42, sequential_update=True))
+        world.spawn_batch(10)
+        for _ in range(200):
+            world.update(1 / 60)
+        
+        # Recorded with the original in-place update and per-agent spawning
+        self.assertEqual(world.get_counts(), {'rock': 3, 'paper': 2, 'scissors': 4})
+        first = world.agents[0]
+        self.assertEqual(first.name, 'Pumice')
+        self.assertAlmostEqual(first.pos.x, 583.356, places=3)
+        self.assertAlmostEqual(first.pos.y, 127.549, places=3)
+    
+    def test_sequential_update_depends_on_agent_order(self):
+        """Test that the legacy update sees positions moved this tick."""
+        self.assertNotEqual(
+            self._positions_after_update(reverse=False, sequential=True),
+            self._positions_after_update(reverse=True, sequential=True)
+        )
 
 
 if __name__ == '__main__':
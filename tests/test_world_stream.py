@@ -0,0 +1,98 @@
+"""Tests for WorldStream delta encoding."""
+
+import json
+import unittest
+import pygame
+from rps.api.world_stream import WorldStream, apply_frame
+from rps.core.world import World
+from rps.core.config import Config
+
+
+def decode(frame: bytes) -> dict:
+    """Decode a Server-Sent Events message."""
+    text = frame.decode()
+    assert text.startswith('data: ')
+    return json.loads(text[len('data: '):])
+
+
+class TestWorldStream(unittest.TestCase):
+    """Test world snapshot streaming."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame for tests."""
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = Config(seed=42, max_population=100)
+        self.world = World(self.config)
+        self.stream = WorldStream(rate=0, keyframe_interval=5)
+    
+    def expected_state(self):
+        """Quantized state of the living agents."""
+        return {
+            a.id: [['rock', 'paper', 'scissors'].index(a.kind), round(a.pos.x), round(a.pos.y)]
+            for a in self.world.agents
+        }
+    
+    def test_first_frame_is_keyframe(self):
+        """Test that a new subscriber starts from a keyframe."""
+        self.world.spawn_random('rock', 3)
+        self.assertTrue(self.stream.publish(self.world))
+        
+        frame = decode(next(self.stream.subscribe(keepalive=0.1)))
+        
+        self.assertEqual(frame['type'], 'key')
+        self.assertEqual(len(frame['agents']), 3)
+    
+    def test_deltas_reconstruct_world(self):
+        """Test that keyframe plus deltas track spawns, moves and deaths."""
+        self.world.spawn_batch(5)
+        self.stream.publish(self.world)
+        subscriber = self.stream.subscribe(keepalive=0.1)
+        state = apply_frame({}, decode(next(subscriber)))
+        
+        for step in range(12):
+            self.world.update(0.05)
+            if step == 3:
+                self.world.agents[0].kill()
+                self.world.remove_dead()
+            if step == 6:
+                self.world.spawn('paper', (10, 10))
+            self.stream.publish(self.world)
+            while True:
+                frame = decode(next(subscriber))
+                state = apply_frame(state, frame)
+                if frame['seq'] == self.stream.seq:
+                    break
+            self.assertEqual(state, self.expected_state())
+    
+    def test_unchanged_world_not_republished(self):
+        """Test that an idle world publishes nothing."""
+        self.world.spawn('rock', (100, 100))
+        self.assertTrue(self.stream.publish(self.world))
+        self.assertFalse(self.stream.publish(self.world))
+    
+    def test_rate_limit(self):
+        """Test that publishing is throttled to the configured rate."""
+        stream = WorldStream(rate=10.0)
+        self.world.spawn('rock', (100, 100))
+        
+        self.assertTrue(stream.publish(self.world, now=1.0))
+        self.world.spawn('rock', (200, 200))
+        self.assertFalse(stream.publish(self.world, now=1.05))
+        self.assertTrue(stream.publish(self.world, now=1.2))
+    
+    def test_keepalive_and_close(self):
+        """Test keepalive comments and subscriber shutdown."""
+        subscriber = self.stream.subscribe(keepalive=0.01)
+        self.assertEqual(next(subscriber), b": keepalive\n\n")
+        
+        self.stream.close()
+        self.assertEqual(list(subscriber), [])
+
+
+if __name__ == '__main__':
+    unittest.main()